@@ -0,0 +1,220 @@
+import gc
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+import src
+from src._1_models import PostmanCollection
+
+# bump when the pickled model layout changes so older snapshots are ignored
+SNAPSHOT_FORMAT = 1
+
+
+def hash_file(file_path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _load_pickle(f) -> Any:
+    # the model tree is cyclic (parent links); collecting during the load
+    # would repeatedly rescan every object just created
+    is_gc_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        return pickle.load(f)
+
+    finally:
+        if is_gc_enabled:
+            gc.enable()
+
+
+@dataclass
+class PostmanSnapshotCache:
+    """On-disk cache of parsed PostmanCollection trees.
+
+    Snapshots are keyed by the sha256 of the source file, the library version and the
+    load options, so an edited export or a library upgrade always re-parses. Any
+    snapshot that fails to load is deleted and the collection is parsed from source.
+
+    Attributes:
+        cache_dir (str): Folder holding the snapshot files
+        max_bytes (int): Total size above which the least recently used snapshots are evicted
+        max_age_seconds (float): Snapshots unused for longer than this are evicted
+    """
+
+    cache_dir: str = "./.postman_cache"
+    max_bytes: int = 1 << 30
+    max_age_seconds: float = 7 * 24 * 60 * 60
+
+    def get_key(self, file_path: str, **load_kwargs) -> str:
+        options = ",".join(
+            f"{key}={value}" for key, value in sorted(load_kwargs.items())
+        )
+
+        return hashlib.sha256(
+            "|".join(
+                [
+                    hash_file(file_path),
+                    src.__version__,
+                    str(SNAPSHOT_FORMAT),
+                    options,
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def _get_snapshot_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def read(self, key: str, debug_prn: bool = False) -> Optional[PostmanCollection]:
+        snapshot_path = self._get_snapshot_path(key)
+
+        if not os.path.exists(snapshot_path):
+            return None
+
+        try:
+            with open(snapshot_path, "rb") as f:
+                payload = _load_pickle(f)
+
+            if payload.get("key") != key:
+                raise ValueError("snapshot key mismatch")
+
+        except Exception as e:
+            if debug_prn:
+                print(f"Discarding snapshot {snapshot_path}: {e}")
+
+            self._remove(snapshot_path)
+            return None
+
+        # refresh the mtime so eviction treats the snapshot as recently used
+        os.utime(snapshot_path)
+
+        return payload["collection"]
+
+    def write(
+        self, key: str, collection: PostmanCollection, debug_prn: bool = False
+    ) -> bool:
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {"key": key, "collection": collection},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+
+            # atomic, so concurrent readers never see a partial snapshot
+            os.replace(tmp_path, self._get_snapshot_path(key))
+
+        except (RecursionError, pickle.PicklingError, OSError) as e:
+            if debug_prn:
+                print(f"Unable to write snapshot for {key}: {e}")
+
+            self._remove(tmp_path)
+            return False
+
+        return True
+
+    def load_collection(
+        self,
+        file_path: str,
+        debug_prn: bool = False,
+        json_backend: Optional[str] = None,
+        **load_kwargs,
+    ) -> PostmanCollection:
+        """Load a collection from its snapshot, parsing and caching it on a miss.
+
+        Args:
+            file_path (str): Path to the Postman collection export
+            debug_prn (bool): Print cache hits, misses and discarded snapshots
+            json_backend (Optional[str]): JSON decoder used on a miss, not part of the key
+            **load_kwargs: Options forwarded to PostmanCollection.from_file
+
+        Returns:
+            PostmanCollection: The parsed collection
+        """
+        key = self.get_key(file_path, **load_kwargs)
+
+        collection = self.read(key, debug_prn=debug_prn)
+
+        if collection is not None:
+            if debug_prn:
+                print(f"Loaded snapshot of {file_path}")
+            return collection
+
+        if debug_prn:
+            print(f"No snapshot of {file_path}, parsing")
+
+        collection = PostmanCollection.from_file(
+            file_path, json_backend=json_backend, **load_kwargs
+        )
+
+        self.write(key, collection, debug_prn=debug_prn)
+        self.evict(debug_prn=debug_prn)
+
+        return collection
+
+    def _list_snapshots(self) -> List[Any]:
+        if not os.path.isdir(self.cache_dir):
+            return []
+
+        return [
+            entry
+            for entry in os.scandir(self.cache_dir)
+            if entry.is_file() and entry.name.endswith(".pkl")
+        ]
+
+    @staticmethod
+    def _remove(file_path: str) -> None:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+    def evict(self, debug_prn: bool = False) -> List[str]:
+        """Remove expired snapshots, then the least recently used until under max_bytes.
+
+        Returns:
+            List[str]: Paths of the removed snapshots
+        """
+        now = time.time()
+
+        snapshots = sorted(
+            ((entry.path, entry.stat()) for entry in self._list_snapshots()),
+            key=lambda snapshot: snapshot[1].st_mtime,
+        )
+
+        removed = []
+        total_bytes = sum(stat.st_size for _, stat in snapshots)
+
+        for snapshot_path, stat in snapshots:
+            is_expired = now - stat.st_mtime > self.max_age_seconds
+
+            if not is_expired and total_bytes <= self.max_bytes:
+                continue
+
+            self._remove(snapshot_path)
+            total_bytes -= stat.st_size
+            removed.append(snapshot_path)
+
+        if debug_prn and removed:
+            print(f"Evicted {len(removed)} snapshots from {self.cache_dir}")
+
+        return removed
+
+    def clear(self) -> None:
+        for entry in self._list_snapshots():
+            self._remove(entry.path)
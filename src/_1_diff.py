@@ -0,0 +1,258 @@
+import hashlib
+import json
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src._1_models import PostmanFolder, PostmanRequest
+
+
+def get_request_identity(
+    request: PostmanRequest, folder_path: Tuple[str, ...] = ()
+) -> str:
+    """Stable identity of a request: method, url path and folder path.
+
+    The request name is left out so renaming an endpoint in Postman reads as a
+    modification rather than a remove and an add.
+    """
+    method = (request.method or "").upper()
+    url_path = "/".join(request.url.path or []) if request.url else ""
+
+    return f"{method} /{url_path} @ {' > '.join(name or '' for name in folder_path)}"
+
+
+def _get_fingerprint_data(request: PostmanRequest) -> Dict[str, Any]:
+    url = request.url
+    body = request.body
+
+    return {
+        "name": request.name,
+        "method": request.method,
+        "description": request.description,
+        "headers": [(header.key, header.value) for header in request.headers],
+        "url": (
+            {
+                "raw": url.raw,
+                "protocol": url.protocol,
+                "host": url.host,
+                "path": url.path,
+                "query": [
+                    (param.key, param.value, param.description, param.disabled)
+                    for param in url.query or []
+                ],
+                "variable": [
+                    (variable.key, variable.value, variable.type, variable.description)
+                    for variable in url.variable or []
+                ],
+            }
+            if url
+            else None
+        ),
+        "body": (
+            {
+                "mode": body.mode,
+                "raw": body.raw,
+                "formdata": [
+                    (param.key, param.value, param.type, param.src, param.disabled)
+                    for param in body.formdata or []
+                ],
+                "urlencoded": [
+                    (param.key, param.value, param.disabled)
+                    for param in body.urlencoded or []
+                ],
+                "file": body.file,
+                "graphql": body.graphql,
+            }
+            if body
+            else None
+        ),
+        "auth": (
+            {"type": request.auth.type, "params": request.auth.params}
+            if request.auth
+            else None
+        ),
+    }
+
+
+def fingerprint_request(
+    request: PostmanRequest, context: Optional[Dict[str, Any]] = None
+) -> str:
+    """Content hash over everything that shapes the generated code.
+
+    Example responses are excluded. The hash is built from the parsed fields, so it
+    does not depend on `keep_raw`.
+
+    Args:
+        request (PostmanRequest): The request to hash
+        context (Optional[Dict[str, Any]]): JSON-serializable inputs from outside the
+            request that also shape its output, e.g. its breadcrumb or resolved variables
+    """
+    data = _get_fingerprint_data(request)
+    if context:
+        data["context"] = context
+
+    payload = json.dumps(data, sort_keys=True, default=str, ensure_ascii=False)
+
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def get_request_identities(folder: PostmanFolder) -> Dict[str, PostmanRequest]:
+    """Map every request below folder to its identity.
+
+    Requests sharing an identity are numbered in document order ("#2", "#3").
+    """
+    res = {}
+
+    for folder_path, requests in folder.get_index().by_folder.items():
+        for request in requests:
+            identity = get_request_identity(request, folder_path)
+
+            if identity in res:
+                n = 2
+                while f"{identity}#{n}" in res:
+                    n += 1
+                identity = f"{identity}#{n}"
+
+            res[identity] = request
+
+    return res
+
+
+@dataclass
+class PostmanRequestChange:
+    """A request present on either or both sides of a diff.
+
+    Attributes:
+        identity (str): The identity both sides were matched on
+        old (Optional[PostmanRequest]): The request in the old tree, None when added
+        new (Optional[PostmanRequest]): The request in the new tree, None when removed
+        old_fingerprint (Optional[str]): Content hash of old
+        new_fingerprint (Optional[str]): Content hash of new
+    """
+
+    identity: str
+    old: Optional[PostmanRequest] = field(default=None, repr=False)
+    new: Optional[PostmanRequest] = field(default=None, repr=False)
+    old_fingerprint: Optional[str] = None
+    new_fingerprint: Optional[str] = None
+
+    @property
+    def status(self) -> str:
+        if self.old is None:
+            return "added"
+        if self.new is None:
+            return "removed"
+        if self.old_fingerprint != self.new_fingerprint:
+            return "modified"
+        return "unchanged"
+
+
+@dataclass
+class PostmanCollectionDiff:
+    """Structural diff of two folder trees (typically two versions of a collection).
+
+    Attributes:
+        added (List[PostmanRequestChange]): Requests only in the new tree
+        removed (List[PostmanRequestChange]): Requests only in the old tree
+        modified (List[PostmanRequestChange]): Requests in both trees whose fingerprint changed
+        n_unchanged (int): Number of requests identical on both sides
+        added_folders (List[Tuple[str, ...]]): Folder paths only in the new tree
+        removed_folders (List[Tuple[str, ...]]): Folder paths only in the old tree
+        new_collection (Optional[PostmanFolder]): The new tree, including unchanged requests
+    """
+
+    added: List[PostmanRequestChange] = field(default_factory=list)
+    removed: List[PostmanRequestChange] = field(default_factory=list)
+    modified: List[PostmanRequestChange] = field(default_factory=list)
+    n_unchanged: int = 0
+    added_folders: List[Tuple[str, ...]] = field(default_factory=list)
+    removed_folders: List[Tuple[str, ...]] = field(default_factory=list)
+    new_collection: Optional[PostmanFolder] = field(default=None, repr=False)
+
+    @classmethod
+    def from_collections(
+        cls,
+        old: PostmanFolder,
+        new: PostmanFolder,
+        get_context: Optional[Callable[[PostmanRequest], Dict[str, Any]]] = None,
+    ) -> "PostmanCollectionDiff":
+        """Match both trees' requests by identity and compare their fingerprints.
+
+        Args:
+            old (PostmanFolder): The previously exported tree
+            new (PostmanFolder): The current tree
+            get_context (Optional[Callable]): Fingerprint context of a request, see
+                fingerprint_request; the converter's diff_collections passes its
+                breadcrumb and variable scope
+        """
+
+        def _fingerprint(request: PostmanRequest) -> str:
+            return fingerprint_request(
+                request, context=get_context(request) if get_context else None
+            )
+
+        diff = cls(new_collection=new)
+
+        old_requests = get_request_identities(old)
+        new_requests = get_request_identities(new)
+
+        for identity, new_request in new_requests.items():
+            old_request = old_requests.get(identity)
+
+            change = PostmanRequestChange(
+                identity=identity,
+                old=old_request,
+                new=new_request,
+                old_fingerprint=old_request and _fingerprint(old_request),
+                new_fingerprint=_fingerprint(new_request),
+            )
+
+            if change.status == "added":
+                diff.added.append(change)
+            elif change.status == "modified":
+                diff.modified.append(change)
+            else:
+                diff.n_unchanged += 1
+
+        for identity, old_request in old_requests.items():
+            if identity not in new_requests:
+                diff.removed.append(
+                    PostmanRequestChange(
+                        identity=identity,
+                        old=old_request,
+                        old_fingerprint=_fingerprint(old_request),
+                    )
+                )
+
+        old_folders = old.get_index().folders
+        new_folders = new.get_index().folders
+
+        diff.added_folders = [path for path in new_folders if path not in old_folders]
+        diff.removed_folders = [path for path in old_folders if path not in new_folders]
+
+        return diff
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.added
+            or self.removed
+            or self.modified
+            or self.added_folders
+            or self.removed_folders
+        )
+
+    @property
+    def changed_requests(self) -> List[PostmanRequest]:
+        """Requests of the new tree that need to be re-rendered."""
+        return [change.new for change in self.added + self.modified]
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "modified": len(self.modified),
+            "unchanged": self.n_unchanged,
+            "added_folders": len(self.added_folders),
+            "removed_folders": len(self.removed_folders),
+        }
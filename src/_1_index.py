@@ -0,0 +1,180 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from src._1_models import PostmanFolder, PostmanRequest
+
+PathKey = Tuple[str, ...]
+
+
+def to_path_key(path: Union[str, Sequence[str]]) -> PathKey:
+    """Normalize a folder or url path to a tuple of segments.
+
+    Strings are split on "/", so "rest/api/3" and "/rest/api/3/" are equivalent.
+    """
+    if isinstance(path, str):
+        return tuple(segment for segment in path.split("/") if segment)
+
+    return tuple(path)
+
+
+def _find_prefix(keys: List, prefix) -> List:
+    """Return the entries of a sorted key list that start with prefix."""
+    res = []
+
+    for key in keys[bisect_left(keys, prefix) :]:
+        if key[: len(prefix)] != prefix:
+            break
+        res.append(key)
+
+    return res
+
+
+@dataclass
+class PostmanRequestIndex:
+    """Lookup tables over every request of a folder tree, built in one traversal.
+
+    Exact lookups are dict hits. Prefix lookups bisect a sorted key list that is
+    built on first use, so they cost O(log n + matches).
+
+    Attributes:
+        requests (List[PostmanRequest]): Every indexed request in document order
+        by_name (Dict[str, List[PostmanRequest]]): Requests by request name
+        by_method (Dict[str, List[PostmanRequest]]): Requests by upper case HTTP method
+        by_folder (Dict[PathKey, List[PostmanRequest]]): Requests by containing folder path
+        by_path (Dict[PathKey, List[PostmanRequest]]): Requests by url path segments
+        folders (Dict[PathKey, PostmanFolder]): Folders by folder path
+        folders_by_name (Dict[str, List[PostmanFolder]]): Folders by folder name
+    """
+
+    requests: List[PostmanRequest] = field(default_factory=list, repr=False)
+    by_name: Dict[str, List[PostmanRequest]] = field(default_factory=dict, repr=False)
+    by_method: Dict[str, List[PostmanRequest]] = field(default_factory=dict, repr=False)
+    by_folder: Dict[PathKey, List[PostmanRequest]] = field(
+        default_factory=dict, repr=False
+    )
+    by_path: Dict[PathKey, List[PostmanRequest]] = field(
+        default_factory=dict, repr=False
+    )
+    folders: Dict[PathKey, PostmanFolder] = field(default_factory=dict, repr=False)
+    folders_by_name: Dict[str, List[PostmanFolder]] = field(
+        default_factory=dict, repr=False
+    )
+
+    _sorted: Dict[str, List] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_folder(cls, folder: PostmanFolder) -> "PostmanRequestIndex":
+        index = cls()
+        index.add_folder(folder)
+        return index
+
+    def add_folder(self, folder: PostmanFolder, base_path: PathKey = ()) -> None:
+        """Index every request and subfolder below folder.
+
+        Args:
+            folder (PostmanFolder): Root of the tree to index; its own name is not
+                part of the folder paths
+            base_path (PathKey): Prefix for the folder paths of this tree, used to
+                combine several collections in one index
+        """
+        self._sorted.clear()
+
+        # explicit stack of item iterators keeps document order without recursion
+        stack = [(tuple(base_path), iter(folder.items or []))]
+
+        while stack:
+            folder_path, items = stack[-1]
+            item = next(items, None)
+
+            if item is None:
+                stack.pop()
+                continue
+
+            if isinstance(item, PostmanRequest):
+                self.add_request(item, folder_path)
+                continue
+
+            item_path = folder_path + (item.name or "",)
+
+            self.folders[item_path] = item
+            self.folders_by_name.setdefault(item.name or "", []).append(item)
+
+            stack.append((item_path, iter(item.items or [])))
+
+    def add_request(self, request: PostmanRequest, folder_path: PathKey = ()) -> None:
+        self._sorted.clear()
+
+        self.requests.append(request)
+
+        self.by_name.setdefault(request.name or "", []).append(request)
+        self.by_method.setdefault((request.method or "").upper(), []).append(request)
+        self.by_folder.setdefault(tuple(folder_path), []).append(request)
+
+        url_path = tuple(request.url.path) if request.url and request.url.path else ()
+        self.by_path.setdefault(url_path, []).append(request)
+
+    def _sorted_keys(self, table_name: str) -> List:
+        if table_name not in self._sorted:
+            self._sorted[table_name] = sorted(getattr(self, table_name))
+
+        return self._sorted[table_name]
+
+    def _lookup(self, table_name: str, key, prefix: bool) -> List[PostmanRequest]:
+        table = getattr(self, table_name)
+
+        if not prefix:
+            return list(table.get(key, []))
+
+        return [
+            request
+            for match in _find_prefix(self._sorted_keys(table_name), key)
+            for request in table[match]
+        ]
+
+    def get_by_name(self, name: str, prefix: bool = False) -> List[PostmanRequest]:
+        return self._lookup("by_name", name, prefix)
+
+    def get_by_method(self, method: str) -> List[PostmanRequest]:
+        return list(self.by_method.get(method.upper(), []))
+
+    def get_by_folder(
+        self, folder_path: Union[str, Sequence[str]], prefix: bool = False
+    ) -> List[PostmanRequest]:
+        """Requests directly in folder_path, or anywhere below it when prefix is True."""
+        return self._lookup("by_folder", to_path_key(folder_path), prefix)
+
+    def get_by_path(
+        self,
+        url_path: Union[str, Sequence[str]],
+        method: Optional[str] = None,
+        prefix: bool = False,
+    ) -> List[PostmanRequest]:
+        """Requests whose url path segments equal (or start with) url_path."""
+        res = self._lookup("by_path", to_path_key(url_path), prefix)
+
+        if method:
+            res = [
+                request
+                for request in res
+                if (request.method or "").upper() == method.upper()
+            ]
+
+        return res
+
+    def get_folder(
+        self, folder_path: Union[str, Sequence[str]]
+    ) -> Optional[PostmanFolder]:
+        return self.folders.get(to_path_key(folder_path))
+
+    def get_folders_by_name(
+        self, name: str, prefix: bool = False
+    ) -> List[PostmanFolder]:
+        if not prefix:
+            return list(self.folders_by_name.get(name, []))
+
+        return [
+            folder
+            for match in _find_prefix(self._sorted_keys("folders_by_name"), name)
+            for folder in self.folders_by_name[match]
+        ]
@@ -0,0 +1,125 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src._1_models import PostmanRequest
+
+
+@dataclass
+class PostmanInventoryItem:
+    """Occurrences of one header, parameter, body mode, auth type or host.
+
+    Attributes:
+        count (int): Number of occurrences
+        requests (List[PostmanRequest]): Requests using it, each listed once
+        values (Dict[Any, PostmanInventoryItem]): Per-value breakdown for headers and params
+    """
+
+    count: int = 0
+    requests: List[PostmanRequest] = field(default_factory=list, repr=False)
+    values: Dict[Any, "PostmanInventoryItem"] = field(default_factory=dict)
+
+    def add(self, request: PostmanRequest) -> "PostmanInventoryItem":
+        self.count += 1
+
+        # requests are visited one at a time, so a repeat can only be the last entry
+        if not self.requests or self.requests[-1] is not request:
+            self.requests.append(request)
+
+        return self
+
+    def add_value(self, request: PostmanRequest, value: Any) -> None:
+        self.add(request)
+
+        if value not in self.values:
+            self.values[value] = PostmanInventoryItem()
+
+        self.values[value].add(request)
+
+
+def get_request_auth_type(request: PostmanRequest) -> str:
+    """Auth type of a request, inherited from the nearest ancestor when not set."""
+
+    if request.auth:
+        return request.auth.type
+
+    for ancestor in reversed(request.get_parents()):
+        auth = getattr(ancestor, "auth", None)
+        if auth:
+            return auth.type
+
+    return "noauth"
+
+
+@dataclass
+class PostmanInventory:
+    """Headers, query params, body modes, auth types and hosts used by a set of requests.
+
+    Built in a single pass over the requests; every entry tracks its occurrence count
+    and the requests that use it.
+
+    Attributes:
+        n_requests (int): Number of requests inventoried
+        headers (Dict[str, PostmanInventoryItem]): By lower case header key, with values
+        params (Dict[str, PostmanInventoryItem]): By query param key, with values
+        body_modes (Dict[str, PostmanInventoryItem]): By body mode, "none" without a body
+        auth_types (Dict[str, PostmanInventoryItem]): By effective auth type
+        hosts (Dict[str, PostmanInventoryItem]): By dotted host
+    """
+
+    n_requests: int = 0
+    headers: Dict[str, PostmanInventoryItem] = field(default_factory=dict)
+    params: Dict[str, PostmanInventoryItem] = field(default_factory=dict)
+    body_modes: Dict[str, PostmanInventoryItem] = field(default_factory=dict)
+    auth_types: Dict[str, PostmanInventoryItem] = field(default_factory=dict)
+    hosts: Dict[str, PostmanInventoryItem] = field(default_factory=dict)
+
+    @staticmethod
+    def _get_item(table: Dict[str, PostmanInventoryItem], key) -> PostmanInventoryItem:
+        if key not in table:
+            table[key] = PostmanInventoryItem()
+
+        return table[key]
+
+    @classmethod
+    def from_requests(cls, requests: Iterable[PostmanRequest]) -> "PostmanInventory":
+        inventory = cls()
+
+        for request in requests:
+            inventory.add_request(request)
+
+        return inventory
+
+    def add_request(self, request: PostmanRequest) -> None:
+        self.n_requests += 1
+
+        for header in request.headers:
+            self._get_item(self.headers, header.key).add_value(request, header.value)
+
+        url = request.url
+
+        for param in (url.query if url else None) or []:
+            self._get_item(self.params, param.key).add_value(request, param.value)
+
+        if url and url.host:
+            self._get_item(self.hosts, ".".join(url.host)).add(request)
+
+        body_mode = request.body.mode if request.body else "none"
+        self._get_item(self.body_modes, body_mode).add(request)
+
+        self._get_item(self.auth_types, get_request_auth_type(request)).add(request)
+
+    def list_values(self, category: str) -> Dict[str, List[Any]]:
+        """Unique values per key for "headers" or "params"."""
+        return {key: list(item.values) for key, item in getattr(self, category).items()}
+
+    def most_common(
+        self, category: str, n: Optional[int] = None
+    ) -> List[Tuple[Any, int]]:
+        """(key, count) pairs of a category, most frequent first."""
+        counts = sorted(
+            ((key, item.count) for key, item in getattr(self, category).items()),
+            key=lambda pair: pair[1],
+            reverse=True,
+        )
+
+        return counts[:n] if n is not None else counts
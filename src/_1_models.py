@@ -1,14 +1,34 @@
-from typing import List, Optional, Dict, Any, Union
-from dataclasses import dataclass, field
+import sys
+
+from typing import List, Optional, Dict, Any, Union, Iterator
+from dataclasses import InitVar, dataclass, field
 
 from abc import ABC, abstractmethod
 
+POSTMAN_SCHEMA_V21 = (
+    "https://schema.getpostman.com/json/collection/v2.1.0/collection.json"
+)
+
+
+def _drop_none(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in data.items() if value is not None}
 
-@dataclass
+
+@dataclass(slots=True)
 class PostmanBase(ABC):
     _raw: dict = field(repr=False)
     parent: Any = field(repr=False)
 
+    # ancestors are resolved once at construction; siblings share their parent's tuple
+    _ancestors: tuple = field(default=(), init=False, repr=False, compare=False)
+    _lineage: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if isinstance(self.parent, PostmanBase):
+            self._ancestors = self.parent.lineage
+
     @classmethod
     @abstractmethod
     def from_dict(cls, parent, data):
@@ -16,47 +36,61 @@ class PostmanBase(ABC):
             f"{cls.__name__}.from_dict() must be implemented in subclasses."
         )
 
-    def get_parents(self):
-
-        def _get_parents(folder, accum: List[Any] = None):
-            accum = accum or []
-
-            if not folder.parent:
-                return accum
+    @property
+    def lineage(self) -> tuple:
+        """Ancestors from the root down, followed by this object."""
+        if self._lineage is None:
+            self._lineage = self._ancestors + (self,)
 
-            accum.append(folder.parent)
+        return self._lineage
 
-            _get_parents(folder.parent, accum)
+    @property
+    def depth(self) -> int:
+        return len(self._ancestors)
 
-            return accum
+    def get_parents(self):
+        return list(self._ancestors)
 
-        accum = []
-        accum = _get_parents(self, accum) or []
-        accum.reverse()
+    def get_breadcrumb(self) -> tuple:
+        """Names of the enclosing folders followed by this object's name, if it has one."""
+        parent = self.parent
+        breadcrumb = parent.folder_path if isinstance(parent, PostmanFolder) else ()
 
-        return accum
+        name = getattr(self, "name", None)
+        return breadcrumb + (name,) if name is not None else breadcrumb
 
     @staticmethod
     def debug_cls(cls, data):
         print(f"{cls.__name__} data: {data}")
 
+    def to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        """Serialize back to the Postman v2.1 shape.
+
+        With prefer_raw, objects that kept their source dict return it as is, an exact
+        round trip including keys the models do not parse. Otherwise the dict is
+        rebuilt from the parsed fields (header keys come out lower case).
+        """
+        if prefer_raw and self._raw is not None:
+            return self._raw
+
+        return self._to_dict(prefer_raw)
+
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        raise NotImplementedError(
+            f"{type(self).__name__}._to_dict() must be implemented in subclasses."
+        )
+
     def test_parity(self) -> bool:
-        """Test if the dataclass instance matches the raw JSON object values."""
-        from dataclasses import asdict
+        """Test if the parsed fields match the raw JSON object values."""
+        from src._1_serializer import get_parity_errors
 
         if self._raw is None:
             raise ValueError("No raw_obj to compare against.")
 
-        instance_dict = asdict(self)
-        del instance_dict.parent
-        instance_dict.pop("_raw", None)
-
-        raw_obj_filtered = {k: v for k, v in self._raw.items() if k in instance_dict}
+        return not get_parity_errors(self)
 
-        return instance_dict == raw_obj_filtered
 
-
-@dataclass
+@dataclass(slots=True)
 class PostmanAuth(PostmanBase):
     """Represents authentication information in a Postman collection or request.
 
@@ -68,9 +102,19 @@ class PostmanAuth(PostmanBase):
     type: str
     params: Optional[List[Dict[str, Any]]] = None
 
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        res = {"type": self.type}
+        if self.params is not None:
+            res[self.type] = self.params
+        return res
+
     @classmethod
     def from_dict(
-        cls, parent, data: Dict[str, Any], debug_prn: bool = False
+        cls,
+        parent,
+        data: Dict[str, Any],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
     ) -> "PostmanAuth":
 
         if debug_prn:
@@ -80,10 +124,15 @@ class PostmanAuth(PostmanBase):
         params = None
         if auth_type and auth_type in data:
             params = data[auth_type]
-        return cls(parent=parent, _raw=data, type=auth_type, params=params)
+        return cls(
+            parent=parent,
+            _raw=data if keep_raw else None,
+            type=auth_type,
+            params=params,
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class PostmanVariable(PostmanBase):
     """Represents a variable in a Postman collection or request/url.
 
@@ -99,13 +148,29 @@ class PostmanVariable(PostmanBase):
     type: Optional[str] = None
     description: Optional[str] = None
 
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        return _drop_none(
+            {
+                "key": self.key,
+                "value": self.value,
+                "type": self.type,
+                "description": self.description,
+            }
+        )
+
     @classmethod
-    def from_dict(cls, parent, data: Dict[str, Any], debug_prn: bool = False):
+    def from_dict(
+        cls,
+        parent,
+        data: Dict[str, Any],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
+    ):
         if debug_prn:
             cls.debug_cls(cls, data)
 
         return cls(
-            _raw=data,
+            _raw=data if keep_raw else None,
             parent=parent,
             key=data["key"],
             value=data.get("value"),
@@ -114,7 +179,7 @@ class PostmanVariable(PostmanBase):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PostmanRequest_Header(PostmanBase):
     """Represents an HTTP header in a request or response.
 
@@ -126,17 +191,29 @@ class PostmanRequest_Header(PostmanBase):
     key: str
     value: str
 
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        return {"key": self.key, "value": self.value}
+
     @classmethod
-    def from_dict(cls, parent, data: Dict[str, str], debug_prn: bool = False):
+    def from_dict(
+        cls,
+        parent,
+        data: Dict[str, str],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
+    ):
         if debug_prn:
             cls.debug_cls(cls, data)
 
         return cls(
-            parent=parent, _raw=data, key=data["key"].lower(), value=data["value"]
+            parent=parent,
+            _raw=data if keep_raw else None,
+            key=sys.intern(data["key"].lower()),
+            value=data["value"],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PostmanQueryParam(PostmanBase):
     """Represents a URL query parameter.
 
@@ -152,15 +229,31 @@ class PostmanQueryParam(PostmanBase):
     description: Optional[str] = None
     disabled: Optional[bool] = None
 
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        return _drop_none(
+            {
+                "key": self.key,
+                "value": self.value,
+                "description": self.description,
+                "disabled": True if self.disabled else None,
+            }
+        )
+
     @classmethod
-    def from_dict(cls, parent, data: Dict[str, Any], debug_prn: bool = False):
+    def from_dict(
+        cls,
+        parent,
+        data: Dict[str, Any],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
+    ):
 
         if debug_prn:
             cls.debug_cls(cls, data)
 
         return cls(
             parent=parent,
-            _raw=data,
+            _raw=data if keep_raw else None,
             key=data["key"],
             value=data["value"],
             description=data.get("description"),
@@ -168,7 +261,7 @@ class PostmanQueryParam(PostmanBase):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PostmanUrl(PostmanBase):
     """Represents a complete URL with all its components.
 
@@ -188,34 +281,59 @@ class PostmanUrl(PostmanBase):
     query: Optional[List[PostmanQueryParam]] = None
     variable: Optional[List[PostmanVariable]] = None
 
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        res = {
+            "raw": self.raw,
+            "protocol": self.protocol,
+            "host": self.host,
+            "path": self.path,
+        }
+        if self.query is not None:
+            res["query"] = [param.to_dict(prefer_raw) for param in self.query]
+        if self.variable is not None:
+            res["variable"] = [
+                variable.to_dict(prefer_raw) for variable in self.variable
+            ]
+        return res
+
     @classmethod
     def from_dict(
-        cls, parent, data: Dict[str, Any], debug_prn: bool = False
+        cls,
+        parent,
+        data: Dict[str, Any],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
     ) -> "PostmanUrl":
         if debug_prn:
             cls.debug_cls(cls, data)
 
         return cls(
             parent=parent,
-            _raw=data,
+            _raw=data if keep_raw else None,
             raw=data.get("raw", ""),
             protocol=data.get("protocol", "https"),
-            host=data.get("host", ["localhost"]),
+            host=[sys.intern(part) for part in data.get("host", ["localhost"])],
             path=data.get("path", []),
             query=(
-                [PostmanQueryParam.from_dict(parent, q) for q in data.get("query", [])]
+                [
+                    PostmanQueryParam.from_dict(parent, q, keep_raw=keep_raw)
+                    for q in data.get("query", [])
+                ]
                 if "query" in data
                 else None
             ),
             variable=(
-                [PostmanVariable.from_dict(parent, v) for v in data.get("variable", [])]
+                [
+                    PostmanVariable.from_dict(parent, v, keep_raw=keep_raw)
+                    for v in data.get("variable", [])
+                ]
                 if "variable" in data
                 else None
             ),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PostmanFormDataParam(PostmanBase):
     """Represents a form-data parameter in a request body."""
 
@@ -226,16 +344,32 @@ class PostmanFormDataParam(PostmanBase):
     description: Optional[str] = None
     disabled: Optional[bool] = None
 
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        return _drop_none(
+            {
+                "key": self.key,
+                "value": self.value,
+                "type": self.type,
+                "src": self.src,
+                "description": self.description,
+                "disabled": self.disabled,
+            }
+        )
+
     @classmethod
     def from_dict(
-        cls, parent, data: Dict[str, Any], debug_prn: bool = False
+        cls,
+        parent,
+        data: Dict[str, Any],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
     ) -> "PostmanFormDataParam":
         if debug_prn:
             cls.debug_cls(cls, data)
 
         return cls(
             parent=parent,
-            _raw=data,
+            _raw=data if keep_raw else None,
             key=data["key"],
             value=data.get("value"),
             type=data.get("type"),
@@ -245,7 +379,7 @@ class PostmanFormDataParam(PostmanBase):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PostmanUrlEncodedParam(PostmanBase):
     """Represents a urlencoded parameter in a request body."""
 
@@ -254,16 +388,30 @@ class PostmanUrlEncodedParam(PostmanBase):
     description: Optional[str] = None
     disabled: Optional[bool] = None
 
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        return _drop_none(
+            {
+                "key": self.key,
+                "value": self.value,
+                "description": self.description,
+                "disabled": self.disabled,
+            }
+        )
+
     @classmethod
     def from_dict(
-        cls, parent, data: Dict[str, Any], debug_prn: bool = False
+        cls,
+        parent,
+        data: Dict[str, Any],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
     ) -> "PostmanUrlEncodedParam":
         if debug_prn:
             cls.debug_cls(cls, data)
 
         return cls(
             parent=parent,
-            _raw=data,
+            _raw=data if keep_raw else None,
             key=data["key"],
             value=data.get("value"),
             description=data.get("description"),
@@ -271,7 +419,7 @@ class PostmanUrlEncodedParam(PostmanBase):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PostmanRequest_Body(PostmanBase):
     """Represents the body of an HTTP request.
 
@@ -291,9 +439,29 @@ class PostmanRequest_Body(PostmanBase):
     file: Optional[Dict[str, Any]] = None
     graphql: Optional[Dict[str, Any]] = None
 
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        res = {"mode": self.mode}
+
+        if self.mode == "raw":
+            res["raw"] = self.raw
+        elif self.mode == "formdata":
+            res["formdata"] = [param.to_dict(prefer_raw) for param in self.formdata]
+        elif self.mode == "urlencoded":
+            res["urlencoded"] = [param.to_dict(prefer_raw) for param in self.urlencoded]
+        elif self.mode == "file":
+            res["file"] = self.file
+        elif self.mode == "graphql":
+            res["graphql"] = self.graphql
+
+        return _drop_none(res)
+
     @classmethod
     def from_dict(
-        cls, parent, data: Optional[Dict[str, Any]], debug_prn: bool = False
+        cls,
+        parent,
+        data: Optional[Dict[str, Any]],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
     ) -> Optional["PostmanRequest_Body"]:
 
         if debug_prn:
@@ -311,12 +479,12 @@ class PostmanRequest_Body(PostmanBase):
 
         elif mode == "formdata":
             kwargs["formdata"] = [
-                PostmanFormDataParam.from_dict(parent, fd)
+                PostmanFormDataParam.from_dict(parent, fd, keep_raw=keep_raw)
                 for fd in data.get("formdata", [])
             ]
         elif mode == "urlencoded":
             kwargs["urlencoded"] = [
-                PostmanUrlEncodedParam.from_dict(parent, ue)
+                PostmanUrlEncodedParam.from_dict(parent, ue, keep_raw=keep_raw)
                 for ue in data.get("urlencoded", [])
             ]
         elif mode == "file":
@@ -324,10 +492,10 @@ class PostmanRequest_Body(PostmanBase):
         elif mode == "graphql":
             kwargs["graphql"] = data.get("graphql")
 
-        return cls(parent=parent, _raw=data, **kwargs)
+        return cls(parent=parent, _raw=data if keep_raw else None, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class PostmanResponse(PostmanBase):
     """Represents an HTTP response in a Postman collection.
 
@@ -341,15 +509,31 @@ class PostmanResponse(PostmanBase):
     header: Optional[Dict[str, Any]] = None
     body: Optional[Any] = None
 
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        return _drop_none(
+            {
+                "status": self.status,
+                "code": self.code,
+                "header": self.header,
+                "body": self.body,
+            }
+        )
+
     @classmethod
-    def from_dict(cls, parent, data: Dict[str, Any], debug_prn: bool = False):
+    def from_dict(
+        cls,
+        parent,
+        data: Dict[str, Any],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
+    ):
 
         if debug_prn:
             cls.debug_cls(cls, data)
 
         return cls(
             parent=parent,
-            _raw=data,
+            _raw=data if keep_raw else None,
             status=data.get("status"),
             code=data.get("code"),
             header=data.get("header"),
@@ -357,7 +541,7 @@ class PostmanResponse(PostmanBase):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PostmanRequest(PostmanBase):
     """Represents a single request in a Postman collection.
 
@@ -371,6 +555,7 @@ class PostmanRequest(PostmanBase):
         url (PostmanUrl): The request URL
         body (Optional[PostmanRequest_Body]): The request body, if any
         response (List[PostmanResponse]): List of example responses
+        auth (Optional[PostmanAuth]): Request level auth, if it overrides the parent's
         raw_obj (Optional[Dict[str, Any]]): The raw JSON object for parity testing
     """
 
@@ -381,16 +566,39 @@ class PostmanRequest(PostmanBase):
     description: str = None
     body: Optional[PostmanRequest_Body] = None
     responses: List[PostmanResponse] = field(repr=False, default=list)
+    auth: Optional[PostmanAuth] = None
 
     def extract_method(self):
-        method = self._raw.get("method")
+        method = self._raw.get("method") if self._raw else None
         if method:
             self.method = method
 
         return self.method
 
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        request = {
+            "method": self.method,
+            "header": [header.to_dict(prefer_raw) for header in self.headers],
+            "url": self.url.to_dict(prefer_raw) if self.url else None,
+            "description": self.description,
+            "body": self.body.to_dict(prefer_raw) if self.body else None,
+            "auth": self.auth.to_dict(prefer_raw) if self.auth else None,
+        }
+
+        return {
+            "name": self.name,
+            "request": _drop_none(request),
+            "response": [response.to_dict(prefer_raw) for response in self.responses],
+        }
+
     @classmethod
-    def from_dict(cls, parent, data: Dict[str, Any], debug_prn: bool = False):
+    def from_dict(
+        cls,
+        parent,
+        data: Dict[str, Any],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
+    ):
 
         if debug_prn:
             cls.debug_cls(cls, data)
@@ -399,12 +607,12 @@ class PostmanRequest(PostmanBase):
 
         return cls(
             parent=parent,
-            _raw={**data},
+            _raw=data if keep_raw else None,
             name=data.get("name"),
             method=request_data.get("method"),
             description=request_data.get("description"),
             headers=[
-                PostmanRequest_Header.from_dict(parent, h)
+                PostmanRequest_Header.from_dict(parent, h, keep_raw=keep_raw)
                 for h in request_data.get("header", [])
             ],
             url=PostmanUrl.from_dict(
@@ -413,31 +621,206 @@ class PostmanRequest(PostmanBase):
                     "url",
                     {},
                 ),
+                keep_raw=keep_raw,
+            ),
+            body=PostmanRequest_Body.from_dict(
+                parent, request_data.get("body"), keep_raw=keep_raw
             ),
-            body=PostmanRequest_Body.from_dict(parent, request_data.get("body")),
             responses=[
-                PostmanResponse.from_dict(parent, r) for r in data.get("response", [])
+                PostmanResponse.from_dict(parent, r, keep_raw=keep_raw)
+                for r in data.get("response", [])
             ],
+            auth=(
+                PostmanAuth.from_dict(parent, request_data["auth"], keep_raw=keep_raw)
+                if request_data.get("auth")
+                else None
+            ),
         )
 
     # Remove duplicate from_dict for PostmanResponse
 
 
-@dataclass
+@dataclass(slots=True)
 class PostmanFolder(PostmanBase):
+    """Represents a folder of requests and subfolders.
+
+    When loaded with `lazy=True`, `items` is parsed from the source dict the first
+    time it is accessed and cached, so untouched folders cost only their name.
+
+    Attributes:
+        name (Optional[str]): The folder name
+        items (List[Union[PostmanFolder, PostmanRequest]]): Child folders and requests
+        auth (Optional[PostmanAuth]): Folder level auth, inherited by the requests below
+        variables (Optional[List[PostmanVariable]]): Folder level variables, overriding
+            the collection's for the requests below
+    """
+
     name: Optional[str] = None
-    items: List[Union["PostmanFolder", PostmanRequest]] = field(default_factory=list)
+    # init only; stored in the _items slot behind the `items` property below
+    items: InitVar[Optional[List[Union["PostmanFolder", PostmanRequest]]]] = None
+    auth: Optional[PostmanAuth] = None
+    variables: Optional[List[PostmanVariable]] = field(default_factory=list)
+    _items: Optional[List[Union["PostmanFolder", PostmanRequest]]] = field(
+        default=None, init=False, repr=False
+    )
+    _pending: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _index: Any = field(default=None, init=False, repr=False, compare=False)
+    _inventory: Any = field(default=None, init=False, repr=False, compare=False)
+    _routes: Any = field(default=None, init=False, repr=False, compare=False)
+    _folder_path: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self, items):
+        PostmanBase.__post_init__(self)
+
+        # the property defined below is the class attribute, so it is also the
+        # default handed in when items is not passed
+        self._items = [] if items is None or isinstance(items, property) else items
+
+    @property
+    def folder_path(self) -> tuple:
+        """Names of the folders from the root down to and including this one, cached."""
+        if self._folder_path is None:
+            self._folder_path = tuple(
+                ancestor.name
+                for ancestor in self.lineage
+                if isinstance(ancestor, PostmanFolder)
+            )
 
-    @classmethod
-    def from_dict(cls, parent, data: Dict[str, Any], debug_prn: bool = False):
-        folder = cls(parent=parent, _raw=data, name=data.get("name"))
+        return self._folder_path
+
+    @property
+    def items(self) -> Optional[List[Union["PostmanFolder", PostmanRequest]]]:
+        if self._pending is not None:
+            data, debug_prn, keep_raw = self._pending
+            self._pending = None
+            self._items = create_items_and_requests(
+                data=data,
+                parent=self,
+                debug_prn=debug_prn,
+                keep_raw=keep_raw,
+                lazy=True,
+            )
+
+        return self._items
+
+    @items.setter
+    def items(self, items: Optional[List[Union["PostmanFolder", PostmanRequest]]]):
+        self._pending = None
+        self._items = items
+
+    @property
+    def is_loaded(self) -> bool:
+        """False while a lazy folder's items have not been parsed yet."""
+        return self._pending is None
+
+    def _load_items(
+        self,
+        data: Dict[str, Any],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
+        lazy: bool = False,
+    ) -> None:
+        if lazy:
+            self._items = None
+            self._pending = (data, debug_prn, keep_raw)
+            return
+
+        self.items = create_items_and_requests(
+            data=data, parent=self, debug_prn=debug_prn, keep_raw=keep_raw
+        )
+
+    def to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        """Serialize the folder; items are always rebuilt so edits to `items` are kept.
+
+        With prefer_raw, the folder's other source keys (description, auth, event)
+        are carried over from `_raw`.
+        """
+        res = {}
+
+        if prefer_raw and self._raw is not None:
+            res.update(
+                (key, value) for key, value in self._raw.items() if key != "item"
+            )
+
+        res.update(self._to_dict(prefer_raw))
+        return res
+
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        res = {
+            "name": self.name,
+            "item": [item.to_dict(prefer_raw) for item in self.items or []],
+        }
+
+        if self.variables:
+            res["variable"] = [
+                variable.to_dict(prefer_raw) for variable in self.variables
+            ]
+        if self.auth:
+            res["auth"] = self.auth.to_dict(prefer_raw)
+
+        return res
 
-        folder.items = create_items_and_requests(
-            data=data, parent=folder, debug_prn=debug_prn
+    def _load_fields(
+        self, data: Dict[str, Any], debug_prn: bool = False, keep_raw: bool = True
+    ) -> None:
+        """Parse the folder keys other than `name` and `item`."""
+        if data.get("variable"):
+            self.variables = [
+                PostmanVariable.from_dict(
+                    parent=self, data=v, debug_prn=debug_prn, keep_raw=keep_raw
+                )
+                for v in data["variable"]
+            ]
+
+        if data.get("auth"):
+            self.auth = PostmanAuth.from_dict(
+                parent=self, data=data["auth"], debug_prn=debug_prn, keep_raw=keep_raw
+            )
+
+    @classmethod
+    def from_dict(
+        cls,
+        parent,
+        data: Dict[str, Any],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
+        lazy: bool = False,
+    ):
+        folder = cls(
+            parent=parent, _raw=data if keep_raw else None, name=data.get("name")
         )
 
+        folder._load_fields(data, debug_prn=debug_prn, keep_raw=keep_raw)
+        folder._load_items(data, debug_prn=debug_prn, keep_raw=keep_raw, lazy=lazy)
+
         return folder
 
+    def get_index(self, is_rebuild: bool = False):
+        """Return the PostmanRequestIndex over this folder, built once and cached.
+
+        Folder paths in the index are relative to this folder. Pass is_rebuild=True
+        after mutating `items`. On a lazy collection this materializes every folder.
+        """
+        from src._1_index import PostmanRequestIndex
+
+        if self._index is None or is_rebuild:
+            self._index = PostmanRequestIndex.from_folder(self)
+
+        return self._index
+
+    def get_routes(self, is_rebuild: bool = False):
+        """Return the PostmanRouteTrie over this folder's requests, built once and cached."""
+        from src._1_routes import PostmanRouteTrie
+
+        if self._routes is None or is_rebuild:
+            self._routes = PostmanRouteTrie.from_folder(self)
+
+        return self._routes
+
     def get_folder_requests(self):
 
         def _get_requests(ele, res):
@@ -482,24 +865,25 @@ class PostmanFolder(PostmanBase):
         res = []
         return _get_folders(self.items, res=res)
 
+    def get_inventory(self, is_rebuild: bool = False):
+        """Return the PostmanInventory of every request below this folder, cached.
+
+        Pass is_rebuild=True after mutating `items`.
+        """
+        from src._1_inventory import PostmanInventory
+
+        if self._inventory is None or is_rebuild:
+            self._inventory = PostmanInventory.from_requests(self.get_folder_requests())
+
+        return self._inventory
+
     def list_all_headers(self) -> Dict[str, List[str]]:
         """List all unique headers and their values from this collection.
 
         Returns:
             Dict[str, List[str]]: Dictionary where keys are header names and values are lists of unique values
         """
-        headers_dict = {}
-
-        res = self.get_folder_requests()
-
-        for request in res:
-            for header in request.headers:
-                if header.key not in headers_dict:
-                    headers_dict[header.key] = set()
-                headers_dict[header.key].add(header.value)
-
-        # Convert sets to lists for better serialization
-        return {key: list(values) for key, values in headers_dict.items()}
+        return self.get_inventory().list_values("headers")
 
     def list_all_params(self) -> Dict[str, List[str]]:
         """List all unique query parameters and their values from this collection.
@@ -507,22 +891,12 @@ class PostmanFolder(PostmanBase):
         Returns:
             Dict[str, List[str]]: Dictionary where keys are parameter names and values are lists of unique values
         """
-        params_dict = {}
-
-        res = self.get_folder_requests()
-
-        for request in res:
-            if request.url.query:
-                for param in request.url.query:
-                    if param.key not in params_dict:
-                        params_dict[param.key] = set()
-                    params_dict[param.key].add(param.value)
+        return self.get_inventory().list_values("params")
 
-        # Convert sets to lists for better serialization
-        return {key: list(values) for key, values in params_dict.items()}
 
-
-def create_items_and_requests(data, parent, debug_prn: bool = False):
+def create_items_and_requests(
+    data, parent, debug_prn: bool = False, keep_raw: bool = True, lazy: bool = False
+):
     if not data.get("item"):
         return None
 
@@ -532,18 +906,81 @@ def create_items_and_requests(data, parent, debug_prn: bool = False):
 
         if obj.get("request"):
             items.append(
-                PostmanRequest.from_dict(parent=parent, data=obj, debug_prn=debug_prn)
+                PostmanRequest.from_dict(
+                    parent=parent, data=obj, debug_prn=debug_prn, keep_raw=keep_raw
+                )
             )
 
         else:
             items.append(
-                PostmanFolder.from_dict(parent=parent, data=obj, debug_prn=debug_prn)
+                PostmanFolder.from_dict(
+                    parent=parent,
+                    data=obj,
+                    debug_prn=debug_prn,
+                    keep_raw=keep_raw,
+                    lazy=lazy,
+                )
             )
 
     return items
 
 
-@dataclass
+def stream_items_and_requests(
+    reader, parent, debug_prn: bool = False, keep_raw: bool = True
+) -> Iterator["PostmanRequest"]:
+    """Walk an `item` array from a JsonStreamReader, yielding requests as they are decoded.
+
+    Folders are created as lightweight parents (their `items` stay empty) so each
+    request keeps its breadcrumb without the rest of the tree being held in memory.
+    Postman does not order keys: when a folder's `name` follows its `item` array,
+    that folder's requests are held back until the name is read.
+    """
+
+    for _ in reader.iter_array():
+        data = {}
+        folder = None
+        pending = None
+
+        for key in reader.iter_object():
+            if key != "item":
+                data[key] = reader.read_value()
+                continue
+
+            if folder is None:
+                folder = PostmanFolder(
+                    parent=parent,
+                    _raw=data if keep_raw else None,
+                    name=data.get("name"),
+                )
+                folder._load_fields(data, debug_prn=debug_prn, keep_raw=keep_raw)
+
+            requests = stream_items_and_requests(
+                reader, parent=folder, debug_prn=debug_prn, keep_raw=keep_raw
+            )
+
+            if "name" in data:
+                yield from requests
+
+            else:
+                pending = (pending or []) + list(requests)
+
+        if folder is not None:
+            folder.name = data.get("name")
+            # again, for keys that came after the item array
+            folder._load_fields(data, debug_prn=debug_prn, keep_raw=keep_raw)
+            # drop a folder_path cached while the name was still unknown
+            folder._folder_path = None
+
+            if pending:
+                yield from pending
+
+        elif data.get("request"):
+            yield PostmanRequest.from_dict(
+                parent=parent, data=data, debug_prn=debug_prn, keep_raw=keep_raw
+            )
+
+
+@dataclass(slots=True)
 class PostmanCollectionInfo(PostmanBase):
     """Contains metadata about the Postman collection.
 
@@ -561,15 +998,28 @@ class PostmanCollectionInfo(PostmanBase):
     _exporter_id: str
     _collection_link: str
 
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        return {
+            "_postman_id": self.id,
+            "name": self.name,
+            "schema": self.schema,
+            "_exporter_id": self._exporter_id,
+            "_collection_link": self._collection_link,
+        }
+
     @classmethod
     def from_dict(
-        cls, parent, data: Dict[str, str], debug_prn: bool = False
+        cls,
+        parent,
+        data: Dict[str, str],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
     ) -> "PostmanCollectionInfo":
         if debug_prn:
             print(data)
         return cls(
             parent=parent,
-            _raw=data,
+            _raw=data if keep_raw else None,
             id=data["_postman_id"],
             name=data["name"],
             schema=data["schema"],
@@ -578,7 +1028,7 @@ class PostmanCollectionInfo(PostmanBase):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PostmanCollection(PostmanFolder):
     """Represents a complete Postman collection.
 
@@ -594,53 +1044,137 @@ class PostmanCollection(PostmanFolder):
 
     info: PostmanCollectionInfo = field(default=None)
 
-    variables: Optional[List[PostmanVariable]] = field(default_factory=list)
-    auth: Optional[PostmanAuth] = field(default=None)
+    def _to_dict(self, prefer_raw: bool = False) -> Dict[str, Any]:
+        res = {
+            "info": (
+                self.info.to_dict(prefer_raw)
+                if self.info
+                else {"name": self.name, "schema": POSTMAN_SCHEMA_V21}
+            ),
+            "item": [item.to_dict(prefer_raw) for item in self.items or []],
+        }
+
+        if self.variables:
+            res["variable"] = [
+                variable.to_dict(prefer_raw) for variable in self.variables
+            ]
+        if self.auth:
+            res["auth"] = self.auth.to_dict(prefer_raw)
+
+        return res
 
     @classmethod
     def from_dict(
-        cls, data: Dict[str, Any], debug_prn: bool = False
+        cls,
+        data: Dict[str, Any],
+        debug_prn: bool = False,
+        keep_raw: bool = True,
+        lazy: bool = False,
     ) -> "PostmanCollection":
 
         collection = cls(
             parent=None,
-            _raw=data,
+            _raw=data if keep_raw else None,
             name=data.get("info", {}).get("name", "Unnamed Collection"),
         )
 
         if data.get("info"):
             collection.info = PostmanCollectionInfo.from_dict(
-                parent=collection, data=data["info"], debug_prn=debug_prn
+                parent=collection,
+                data=data["info"],
+                debug_prn=debug_prn,
+                keep_raw=keep_raw,
             )
 
-        collection.items = create_items_and_requests(
-            data=data, parent=collection, debug_prn=debug_prn
-        )
+        collection._load_items(data, debug_prn=debug_prn, keep_raw=keep_raw, lazy=lazy)
+        collection._load_fields(data, debug_prn=debug_prn, keep_raw=keep_raw)
 
-        if data.get("variable"):
-            collection.variables = [
-                PostmanVariable.from_dict(
-                    parent=collection, data=v, debug_prn=debug_prn
-                )
-                for v in data["variable"]
-            ]
+        return collection
 
-        if data.get("auth"):
-            collection.auth = (
-                PostmanAuth.from_dict(
-                    parent=collection, data=data["auth"], debug_prn=debug_prn
-                )
-                if "auth" in data
-                else None
+    @classmethod
+    def from_file(
+        cls,
+        file_path: str,
+        debug_prn: bool = False,
+        keep_raw: bool = True,
+        lazy: bool = False,
+        snapshot_cache=None,
+        json_backend: Optional[str] = None,
+    ) -> "PostmanCollection":
+        """Load a collection export.
+
+        Args:
+            file_path (str): Path to the Postman collection export
+            debug_prn (bool): Print each parsed object
+            keep_raw (bool): Keep the source dict on each model as `_raw`. Disable for
+                large collections; the models then hold only their parsed fields.
+            lazy (bool): Defer parsing each folder's items until first accessed
+            snapshot_cache (PostmanSnapshotCache): Reuse a pickled snapshot of the
+                parsed tree when the file is unchanged
+            json_backend (Optional[str]): JSON decoder registered in utils.json_backend,
+                defaults to the fastest one installed
+        """
+        import src.utils.json_backend as pmjb
+
+        if snapshot_cache is not None:
+            return snapshot_cache.load_collection(
+                file_path,
+                debug_prn=debug_prn,
+                json_backend=json_backend,
+                keep_raw=keep_raw,
+                lazy=lazy,
             )
 
-        return collection
+        data = pmjb.read_json_file(file_path, backend=json_backend)
+
+        return cls.from_dict(data, debug_prn=debug_prn, keep_raw=keep_raw, lazy=lazy)
 
     @classmethod
-    def from_file(cls, file_path: str, debug_prn: bool = False) -> "PostmanCollection":
-        import json
+    def iter_requests(
+        cls,
+        file_path: str,
+        debug_prn: bool = False,
+        keep_raw: bool = True,
+    ) -> Iterator[PostmanRequest]:
+        """Stream the requests of a collection file without loading the whole export.
+
+        Peak memory is bounded by the largest single item rather than the file size.
+        Each request is parented to lightweight folders (and a collection holding only
+        `info`), so `get_parents()` still returns the folder breadcrumb.
+
+        Args:
+            file_path (str): Path to the Postman collection export
+            debug_prn (bool): Print each parsed object
+            keep_raw (bool): Keep the source dict on each model as `_raw`
+
+        Yields:
+            PostmanRequest: Requests in document order
+        """
+        import src.utils.json_stream as pmjs
 
         with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        return cls.from_dict(data, debug_prn=debug_prn)
+            reader = pmjs.JsonStreamReader(f.read)
+
+            collection = cls(parent=None, _raw=None, name="Unnamed Collection")
+
+            for key in reader.iter_object():
+                if key == "info":
+                    info = reader.read_value()
+                    collection.name = info.get("name", collection.name)
+                    collection.info = PostmanCollectionInfo.from_dict(
+                        parent=collection,
+                        data=info,
+                        debug_prn=debug_prn,
+                        keep_raw=keep_raw,
+                    )
+
+                elif key == "item":
+                    yield from stream_items_and_requests(
+                        reader,
+                        parent=collection,
+                        debug_prn=debug_prn,
+                        keep_raw=keep_raw,
+                    )
+
+                else:
+                    reader.skip_value()
@@ -0,0 +1,186 @@
+import re
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from src._1_models import PostmanFolder, PostmanRequest
+
+# a whole segment that is a variable: `:id`, `{{id}}` or `{id}`
+_VARIABLE_SEGMENT = re.compile(r"^:(\w+)$|^\{\{\s*([^{}]+?)\s*\}\}$|^\{([^{}]+)\}$")
+
+
+def get_segment_variable(segment: str) -> Optional[str]:
+    """Name of the variable a route segment stands for, None for a literal segment.
+
+    Segments that only partly consist of a variable ("v{{version}}") match any value
+    and are named after the segment itself.
+    """
+    match = _VARIABLE_SEGMENT.match(segment)
+
+    if match:
+        return next(group for group in match.groups() if group is not None)
+
+    if "{" in segment:
+        return segment
+
+    return None
+
+
+def to_url_segments(url: str) -> Tuple[str, ...]:
+    """Path segments of a concrete url or path; scheme, host, query and fragment are dropped."""
+    if "://" in url:
+        path = urlsplit(url).path
+    else:
+        path = url.split("?", 1)[0].split("#", 1)[0]
+
+    return tuple(unquote(segment) for segment in path.split("/") if segment)
+
+
+@dataclass(slots=True)
+class PostmanRouteNode:
+    """One path segment of the trie.
+
+    Attributes:
+        children (Dict[str, PostmanRouteNode]): Literal segments
+        wildcard (Optional[PostmanRouteNode]): Shared child for any variable segment
+        routes (Dict[str, List[Tuple[PostmanRequest, Tuple[str, ...]]]]): Requests
+            ending here by upper case method, with their variable names in path order
+    """
+
+    children: Dict[str, "PostmanRouteNode"] = field(default_factory=dict)
+    wildcard: Optional["PostmanRouteNode"] = None
+    routes: Dict[str, List[Tuple[PostmanRequest, Tuple[str, ...]]]] = field(
+        default_factory=dict
+    )
+
+
+@dataclass
+class PostmanRouteMatch:
+    """A request matched by a concrete url.
+
+    Attributes:
+        request (PostmanRequest): The matched request
+        path_variables (Dict[str, str]): Url values captured by the variable segments
+    """
+
+    request: PostmanRequest
+    path_variables: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class PostmanRouteTrie:
+    """Trie over the method and url path segments of every request.
+
+    Variable segments (`:id`, `{{var}}`, `{var}`) of every route share one wildcard
+    child. Matching tries the literal child before the wildcard at every segment,
+    so a literal segment further left wins over one further right. Without dead
+    ends it walks one node per url segment. A dead end backtracks to the nearest
+    wildcard, but as every node has one parent no node is visited twice: the
+    worst case is the number of nodes within the url's depth, never exponential.
+
+    Attributes:
+        root (PostmanRouteNode): Node of the empty path
+        n_routes (int): Number of requests added
+    """
+
+    root: PostmanRouteNode = field(default_factory=PostmanRouteNode, repr=False)
+    n_routes: int = 0
+
+    @classmethod
+    def from_requests(cls, requests: Iterable[PostmanRequest]) -> "PostmanRouteTrie":
+        trie = cls()
+
+        for request in requests:
+            trie.add_request(request)
+
+        return trie
+
+    @classmethod
+    def from_folder(cls, folder: PostmanFolder) -> "PostmanRouteTrie":
+        return cls.from_requests(folder.get_folder_requests())
+
+    def add_request(self, request: PostmanRequest) -> None:
+        path = request.url.path if request.url and request.url.path else []
+
+        node = self.root
+        variable_names = []
+
+        for segment in path:
+            if not segment:
+                continue
+
+            variable_name = get_segment_variable(segment)
+
+            if variable_name is None:
+                if segment not in node.children:
+                    node.children[segment] = PostmanRouteNode()
+                node = node.children[segment]
+                continue
+
+            if node.wildcard is None:
+                node.wildcard = PostmanRouteNode()
+            node = node.wildcard
+            variable_names.append(variable_name)
+
+        method = (request.method or "").upper()
+        node.routes.setdefault(method, []).append((request, tuple(variable_names)))
+
+        self.n_routes += 1
+
+    def _iter_matches(self, segments: Tuple[str, ...], method: Optional[str]):
+        n_segments = len(segments)
+
+        # depth-first with literal children explored before the wildcard, so the most
+        # specific route is found first; a dead end falls back to the wildcard branch.
+        # Each node is reached by a single path, so nothing is pushed twice
+        stack = [(self.root, 0, ())]
+
+        while stack:
+            node, depth, values = stack.pop()
+
+            if depth == n_segments:
+                if method:
+                    routes = node.routes.get(method, [])
+                else:
+                    routes = [
+                        route for group in node.routes.values() for route in group
+                    ]
+
+                for request, variable_names in routes:
+                    yield PostmanRouteMatch(
+                        request=request,
+                        path_variables=dict(zip(variable_names, values)),
+                    )
+                continue
+
+            segment = segments[depth]
+
+            if node.wildcard is not None:
+                stack.append((node.wildcard, depth + 1, values + (segment,)))
+
+            child = node.children.get(segment)
+            if child is not None:
+                stack.append((child, depth + 1, values))
+
+    def match(
+        self, url: str, method: Optional[str] = None
+    ) -> Optional[PostmanRouteMatch]:
+        """Most specific request for a concrete url ("https://host/users/42?x=1" or "/users/42").
+
+        Args:
+            url (str): Full url or path as seen in an access log
+            method (Optional[str]): HTTP method; any method matches when omitted
+
+        Returns:
+            Optional[PostmanRouteMatch]: The matched request, None when no route fits
+        """
+        return next(
+            self._iter_matches(to_url_segments(url), method and method.upper()), None
+        )
+
+    def match_all(
+        self, url: str, method: Optional[str] = None
+    ) -> List[PostmanRouteMatch]:
+        """Every request matching url, most specific first."""
+        return list(self._iter_matches(to_url_segments(url), method and method.upper()))
@@ -0,0 +1,276 @@
+import json
+import os
+import uuid
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from src._1_models import (
+    POSTMAN_SCHEMA_V21,
+    PostmanBase,
+    PostmanCollection,
+    PostmanFolder,
+    PostmanRequest,
+)
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _compare(generated: Any, raw: Any, path: str, errors: List[str]) -> None:
+    if isinstance(generated, dict) and isinstance(raw, dict):
+        # the models parse a subset of the schema, so only shared keys are compared
+        for key, value in generated.items():
+            if key in raw:
+                _compare(value, raw[key], f"{path}.{key}", errors)
+        return
+
+    if isinstance(generated, list) and isinstance(raw, list):
+        if len(generated) != len(raw):
+            errors.append(f"{path}: {len(generated)} items != {len(raw)} items")
+            return
+
+        for i, (generated_item, raw_item) in enumerate(zip(generated, raw)):
+            _compare(generated_item, raw_item, f"{path}[{i}]", errors)
+        return
+
+    # header keys are lower cased on parse
+    if (
+        isinstance(generated, str)
+        and isinstance(raw, str)
+        and ".header[" in path
+        and path.endswith(".key")
+    ):
+        generated, raw = generated.lower(), raw.lower()
+
+    if generated != raw:
+        errors.append(f"{path}: {generated!r} != {raw!r}")
+
+
+def get_parity_errors(obj: PostmanBase) -> List[str]:
+    """Differences between an object's parsed fields and its `_raw` source dict.
+
+    A single walk over the rebuilt dict and the source; on a collection this checks
+    every nested model at once.
+
+    Returns:
+        List[str]: One "path: parsed != source" entry per mismatch, empty on parity
+    """
+    if obj._raw is None:
+        raise ValueError("No raw_obj to compare against, load with keep_raw=True.")
+
+    errors = []
+    _compare(obj.to_dict(prefer_raw=False), obj._raw, "$", errors)
+
+    return errors
+
+
+def _get_kept_folders(requests: Iterable[PostmanRequest]) -> Set[int]:
+    """ids of every folder containing one of requests, so empty branches can be pruned."""
+    return {id(ancestor) for request in requests for ancestor in request.get_parents()}
+
+
+def _iter_items_json(
+    items: Optional[List[Any]],
+    prefer_raw: bool,
+    kept_requests: Optional[Set[int]],
+    kept_folders: Optional[Set[int]],
+) -> Iterator[str]:
+    yield "["
+
+    is_first = True
+    for item in items or []:
+        if isinstance(item, PostmanRequest):
+            if kept_requests is not None and id(item) not in kept_requests:
+                continue
+
+            yield ("" if is_first else ",") + _ENCODER.encode(item.to_dict(prefer_raw))
+            is_first = False
+            continue
+
+        if kept_folders is not None and id(item) not in kept_folders:
+            continue
+
+        yield from _iter_folder_json(
+            item, prefer_raw, kept_requests, kept_folders, is_first=is_first
+        )
+        is_first = False
+
+    yield "]"
+
+
+def _iter_folder_json(
+    folder: PostmanFolder,
+    prefer_raw: bool,
+    kept_requests: Optional[Set[int]],
+    kept_folders: Optional[Set[int]],
+    is_first: bool = True,
+) -> Iterator[str]:
+    header = {}
+
+    if prefer_raw and folder._raw is not None:
+        header.update(
+            (key, value) for key, value in folder._raw.items() if key != "item"
+        )
+
+    header["name"] = folder.name
+    if folder.variables and "variable" not in header:
+        header["variable"] = [
+            variable.to_dict(prefer_raw) for variable in folder.variables
+        ]
+    if folder.auth and "auth" not in header:
+        header["auth"] = folder.auth.to_dict(prefer_raw)
+
+    # the folder's own keys, then its items written one at a time
+    yield ("{" if is_first else ",{") + _ENCODER.encode(header)[1:-1] + ',"item":'
+    yield from _iter_items_json(folder.items, prefer_raw, kept_requests, kept_folders)
+    yield "}"
+
+
+def iter_collection_json(
+    collection: PostmanCollection,
+    requests: Optional[Iterable[PostmanRequest]] = None,
+    prefer_raw: bool = True,
+    name: Optional[str] = None,
+    collection_id: Optional[str] = None,
+) -> Iterator[str]:
+    """Encode a collection as v2.1 JSON in chunks, one request at a time.
+
+    Args:
+        collection (PostmanCollection): The collection to write
+        requests (Optional[Iterable[PostmanRequest]]): Only write these requests, with
+            the folders that contain them. Defaults to every request
+        prefer_raw (bool): Write each object's `_raw` source when it was kept,
+            preserving keys the models do not parse
+        name (Optional[str]): Replace the collection name in `info`
+        collection_id (Optional[str]): Replace `info._postman_id`, for output that is
+            a new collection rather than a copy; the parent's `_collection_link` is cleared
+
+    Yields:
+        str: Consecutive chunks of the JSON document
+    """
+    kept_requests = kept_folders = None
+
+    if requests is not None:
+        requests = list(requests)
+        kept_requests = {id(request) for request in requests}
+        kept_folders = _get_kept_folders(requests)
+
+    head = {}
+
+    if prefer_raw and collection._raw is not None:
+        head.update(
+            (key, value)
+            for key, value in collection._raw.items()
+            if key not in ("info", "item")
+        )
+
+    else:
+        if collection.variables:
+            head["variable"] = [
+                variable.to_dict(prefer_raw) for variable in collection.variables
+            ]
+        if collection.auth:
+            head["auth"] = collection.auth.to_dict(prefer_raw)
+
+    info = (
+        dict(collection.info.to_dict(prefer_raw))
+        if collection.info
+        else {"name": collection.name, "schema": POSTMAN_SCHEMA_V21}
+    )
+    if name is not None:
+        info["name"] = name
+    if collection_id is not None:
+        info["_postman_id"] = collection_id
+        info["_collection_link"] = ""
+
+    yield '{"info":' + _ENCODER.encode(info) + ',"item":'
+    yield from _iter_items_json(
+        collection.items, prefer_raw, kept_requests, kept_folders
+    )
+
+    if head:
+        yield "," + _ENCODER.encode(head)[1:-1]
+
+    yield "}"
+
+
+def write_collection(
+    collection: PostmanCollection,
+    file_path: str,
+    requests: Optional[Iterable[PostmanRequest]] = None,
+    prefer_raw: bool = True,
+    name: Optional[str] = None,
+    collection_id: Optional[str] = None,
+) -> str:
+    """Stream a collection, or the subset holding requests, to a v2.1 JSON file.
+
+    See iter_collection_json for the arguments.
+
+    Returns:
+        str: file_path
+    """
+    folder = os.path.dirname(file_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.writelines(
+            iter_collection_json(
+                collection,
+                requests=requests,
+                prefer_raw=prefer_raw,
+                name=name,
+                collection_id=collection_id,
+            )
+        )
+
+    return file_path
+
+
+def split_collection(
+    collection: PostmanCollection,
+    key_fn: Callable[[PostmanRequest], Optional[str]],
+    export_folder: str,
+    prefer_raw: bool = True,
+    debug_prn: bool = False,
+) -> Dict[str, str]:
+    """Write one sub-collection per key, e.g. per team.
+
+    Each split gets its own `_postman_id`, derived from the parent's id and the key,
+    so importing several splits does not overwrite one collection with another and
+    re-running a split keeps its id.
+
+    Args:
+        collection (PostmanCollection): The collection to split
+        key_fn (Callable[[PostmanRequest], Optional[str]]): Key of a request; requests
+            keyed None are left out
+        export_folder (str): Folder receiving one "<key>.json" per key
+        prefer_raw (bool): Write each object's `_raw` source when it was kept
+        debug_prn (bool): Print each written file
+
+    Returns:
+        Dict[str, str]: File path by key
+    """
+    groups: Dict[str, List[PostmanRequest]] = {}
+
+    for request in collection.get_index().requests:
+        key = key_fn(request)
+        if key is not None:
+            groups.setdefault(key, []).append(request)
+
+    parent_id = collection.info.id if collection.info else collection.name
+
+    res = {}
+    for key, requests in groups.items():
+        res[key] = write_collection(
+            collection,
+            os.path.join(export_folder, f"{key}.json"),
+            requests=requests,
+            prefer_raw=prefer_raw,
+            name=f"{collection.name} - {key}",
+            collection_id=str(uuid.uuid5(uuid.NAMESPACE_URL, f"{parent_id}/{key}")),
+        )
+
+        if debug_prn:
+            print(f"{key}: {len(requests)} requests -> {res[key]}")
+
+    return res
@@ -0,0 +1,195 @@
+import gc
+import glob
+import os
+import pickle
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from src._1_index import PostmanRequestIndex
+from src._1_models import PostmanCollection
+
+
+@dataclass
+class PostmanWorkspaceFile:
+    """Outcome of loading one collection file of a workspace.
+
+    Attributes:
+        file_path (str): Path of the collection export
+        collection (Optional[PostmanCollection]): The parsed collection, None on error
+        seconds (float): Parse time measured in the worker
+        error (Optional[str]): The exception raised while parsing, if any
+    """
+
+    file_path: str
+    collection: Optional[PostmanCollection] = field(default=None, repr=False)
+    seconds: float = 0
+    error: Optional[str] = None
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+
+def load_workspace_file(
+    file_path: str, load_kwargs: Dict[str, Any]
+) -> PostmanWorkspaceFile:
+    """Parse one collection, capturing the error instead of raising (runs in a worker process)."""
+    start = time.perf_counter()
+
+    try:
+        collection = PostmanCollection.from_file(file_path, **load_kwargs)
+
+    except Exception as e:
+        return PostmanWorkspaceFile(
+            file_path=file_path,
+            seconds=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+    return PostmanWorkspaceFile(
+        file_path=file_path,
+        collection=collection,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _load_workspace_file_pickled(file_path: str, load_kwargs: Dict[str, Any]) -> bytes:
+    """load_workspace_file, pickled in the worker so the parent unpickles it itself."""
+    return pickle.dumps(
+        load_workspace_file(file_path, load_kwargs), protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+def _unpickle_without_gc(payload: bytes) -> Any:
+    # unpickling a tree creates many cyclic objects (parent links); pausing the
+    # collector for the load avoids rescanning them on every generation
+    is_gc_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        return pickle.loads(payload)
+
+    finally:
+        if is_gc_enabled:
+            gc.enable()
+
+
+@dataclass
+class PostmanWorkspace:
+    """A set of Postman collections loaded in parallel, with a combined index.
+
+    Attributes:
+        files (List[PostmanWorkspaceFile]): One result per file, in file path order
+        seconds (float): Wall clock time of the whole load
+    """
+
+    files: List[PostmanWorkspaceFile] = field(default_factory=list)
+    seconds: float = 0
+
+    _index: Optional[PostmanRequestIndex] = field(default=None, repr=False)
+
+    @classmethod
+    def from_path(
+        cls,
+        path: str,
+        pattern: str = "*.json",
+        n_jobs: Optional[int] = None,
+        debug_prn: bool = False,
+        **load_kwargs,
+    ) -> "PostmanWorkspace":
+        """Load every collection in a directory (matching pattern) or matching a glob.
+
+        Args:
+            path (str): Directory of collection exports, or a glob such as "exports/*.json"
+            pattern (str): Glob applied inside path when it is a directory
+            n_jobs (Optional[int]): Worker processes, defaults to the CPU count. 1 loads serially
+            debug_prn (bool): Print the per-file timing and errors
+            **load_kwargs: Options forwarded to PostmanCollection.from_file
+
+        Returns:
+            PostmanWorkspace: Loaded collections; failed files are reported, not raised
+        """
+        if os.path.isdir(path):
+            path = os.path.join(path, pattern)
+
+        file_paths = sorted(glob.glob(path))
+
+        return cls.from_files(
+            file_paths, n_jobs=n_jobs, debug_prn=debug_prn, **load_kwargs
+        )
+
+    @classmethod
+    def from_files(
+        cls,
+        file_paths: List[str],
+        n_jobs: Optional[int] = None,
+        debug_prn: bool = False,
+        **load_kwargs,
+    ) -> "PostmanWorkspace":
+        start = time.perf_counter()
+
+        n_jobs = min(n_jobs or os.cpu_count() or 1, len(file_paths) or 1)
+
+        if n_jobs == 1:
+            files = [
+                load_workspace_file(file_path, load_kwargs) for file_path in file_paths
+            ]
+
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                futures = [
+                    executor.submit(
+                        _load_workspace_file_pickled, file_path, load_kwargs
+                    )
+                    for file_path in file_paths
+                ]
+
+                files = []
+                for file_path, future in zip(file_paths, futures):
+                    try:
+                        files.append(_unpickle_without_gc(future.result()))
+
+                    except Exception as e:
+                        # the worker itself died or the result could not be pickled
+                        files.append(
+                            PostmanWorkspaceFile(
+                                file_path=file_path,
+                                error=f"{type(e).__name__}: {e}",
+                            )
+                        )
+
+        workspace = cls(files=files, seconds=time.perf_counter() - start)
+
+        if debug_prn:
+            for file in workspace.files:
+                status = "ok" if file.is_success else file.error
+                print(f"{file.file_path}: {file.seconds:.3f}s {status}")
+
+            print(
+                f"Loaded {len(workspace.collections)}/{len(files)} collections in {workspace.seconds:.3f}s"
+            )
+
+        return workspace
+
+    @property
+    def collections(self) -> List[PostmanCollection]:
+        return [file.collection for file in self.files if file.is_success]
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        return {
+            file.file_path: file.error for file in self.files if not file.is_success
+        }
+
+    def get_index(self, is_rebuild: bool = False) -> PostmanRequestIndex:
+        """Index across all collections; folder paths start with the collection name."""
+        if self._index is None or is_rebuild:
+            self._index = PostmanRequestIndex()
+
+            for collection in self.collections:
+                self._index.add_folder(collection, base_path=(collection.name,))
+
+        return self._index
@@ -1,16 +1,27 @@
 from ._1_models import PostmanRequest, PostmanUrl, PostmanFolder
 import src.Converter_Params as pmcp
+import src._1_diff as pmdf
+import src._2_manifest as pmmf
+import src._2_templates as pmtp
+import src._2_variables as pmvr
 
 import src.utils.convert as pmcv
 import src.utils.files as pmfi
-from typing import Any, Tuple
+from typing import Any, Callable, Tuple
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Optional
 from dataclasses import dataclass, field
 from urllib.parse import urljoin
 
 import ast
-import re
+import keyword
+
+# output modes of PostmanCollectionConverter: one file per request or one module per folder
+OUTPUT_MODES = ["file", "folder"]
+
+MODULE_FILE_NAME = "endpoints.py"
 
 
 def replace_postman_variables(
@@ -19,19 +30,19 @@ def replace_postman_variables(
     provider_class_attribute: str,
     provider_class_name="auth",
 ) -> str:
+    """Replace {{variable_name}} with a reference to the provider's attribute.
 
-    def repl(match):
-        var_name = match.group(1)
-        if var_name == variable_name:
-            # Use the provided attribute name directly
-            if provider_class_name:
-                return f"{{{provider_class_name}.{provider_class_attribute}}}"
-            else:
-                return f"{{{provider_class_attribute}}}"
-        # Otherwise, keep the original variable unchanged
-        return match.group(0)
+    Other variables are kept unchanged.
+    """
+
+    if provider_class_name:
+        replacement = f"{{{provider_class_name}.{provider_class_attribute}}}"
+    else:
+        replacement = f"{{{provider_class_attribute}}}"
 
-    return re.sub(r"\{\{(\w+)\}\}", repl, text)
+    return pmvr.resolve_template(
+        text, pmvr.PostmanVariableScope.from_dict({variable_name: replacement})
+    )
 
 
 def generate_params_from_request(
@@ -103,6 +114,43 @@ def generate_headers_from_request(
     return headers
 
 
+def generate_body_from_request(
+    request: PostmanRequest,
+    scope: Optional[pmvr.PostmanVariableScope] = None,
+) -> Any:
+    """Build the body of this PostmanRequest, resolving variables when a scope is given.
+
+    Returns:
+        Any: The text of a raw body, a dict of the enabled urlencoded / formdata
+            params, the graphql dict, the file dict, or None without a body
+    """
+    body = request.body
+
+    def _resolve(text):
+        if scope is None or not isinstance(text, str):
+            return text
+
+        return pmvr.resolve_template(text, scope)
+
+    if body is None:
+        return None
+
+    if body.mode == "raw":
+        return _resolve(body.raw)
+
+    if body.mode in ("urlencoded", "formdata"):
+        return {
+            param.key: _resolve(param.value)
+            for param in getattr(body, body.mode) or []
+            if not param.disabled
+        }
+
+    if body.mode == "graphql" and body.graphql:
+        return {key: _resolve(value) for key, value in body.graphql.items()}
+
+    return body.file if body.mode == "file" else None
+
+
 def generate_function_name_from_request(
     prq: PostmanRequest, drop_n_from_path_head: int = 0, prefix=""
 ) -> str:
@@ -124,6 +172,26 @@ def generate_function_name_from_request(
     return f"{prefix}{endpoint}_{method}"
 
 
+def generate_module_name(folder_name: str) -> str:
+    """Valid Python package name for a Postman folder name."""
+    module_name = pmcv.to_snake_case(folder_name or "")
+
+    if not module_name or module_name[0].isdigit() or keyword.iskeyword(module_name):
+        module_name = f"_{module_name}"
+
+    return module_name
+
+
+def generate_module_path(folder_path: Tuple[str, ...]) -> str:
+    """Relative path of the module holding the requests of a folder.
+
+    Each folder becomes a package; requests of the root go in the top level module.
+    """
+    return os.path.join(
+        *[generate_module_name(name) for name in folder_path], MODULE_FILE_NAME
+    )
+
+
 @dataclass
 class PostmanRequestConverter:
 
@@ -132,6 +200,10 @@ class PostmanRequestConverter:
     description: str = None
     headers: Dict[str, str] = field(default_factory=dict)
     params: List[pmcp.PostmanParamConverter] = field(default_factory=list)
+    body: Any = None
+
+    # (arguments, scope) of the last generate_variable_scope call
+    _variable_scope: Optional[tuple] = field(default=None, init=False, repr=False)
 
     url: str = None
 
@@ -139,7 +211,10 @@ class PostmanRequestConverter:
 
     @classmethod
     def from_postman_request(
-        cls, request: PostmanRequest, config: Dict[str, Any]
+        cls,
+        request: PostmanRequest,
+        config: Dict[str, Any],
+        is_add_imports: bool = True,
     ) -> "PostmanRequestConverter":
         """Create a PostmanRequestConverter from a PostmanRequest and generate function code."""
 
@@ -147,7 +222,7 @@ class PostmanRequestConverter:
 
         converter = cls(request=request)
 
-        converter.generate_request_code(config=config)
+        converter.generate_request_code(config=config, is_add_imports=is_add_imports)
 
         return converter
 
@@ -160,11 +235,69 @@ class PostmanRequestConverter:
         )
         return self.function_name
 
+    def generate_variable_scope(
+        self,
+        base_url_variable: str = None,
+        environment: Optional[Dict[str, str]] = None,
+        resolve_variables: bool = False,
+        **kwargs,
+    ) -> Optional[pmvr.PostmanVariableScope]:
+        """Variables substituted in the url, headers and body; None when there are none.
+
+        Args:
+            base_url_variable (str): Variable replaced by the matching `auth` attribute
+            environment (Optional[Dict[str, str]]): Postman environment values
+            resolve_variables (bool): Also substitute collection, folder, environment
+                and url path variables, following Postman's scoping
+        """
+        # the url, headers and body of one request are resolved with the same scope;
+        # keyed on the environment's content, as a dict can be edited in place
+        arguments = (
+            base_url_variable,
+            pmvr.to_variable_items(environment),
+            resolve_variables,
+        )
+        if self._variable_scope is not None and self._variable_scope[0] == arguments:
+            return self._variable_scope[1]
+
+        overrides = {}
+        if base_url_variable:
+            overrides[base_url_variable] = (
+                f"{{auth.{pmcv.to_snake_case(base_url_variable)}}}"
+            )
+
+        scope = None
+        if resolve_variables:
+            scope = pmvr.PostmanVariableScope.from_request(
+                self.request, environment=environment, overrides=overrides
+            )
+
+        elif overrides:
+            scope = pmvr.PostmanVariableScope.from_dict(overrides)
+
+        self._variable_scope = (arguments, scope)
+        return scope
+
     def generate_headers(self, **kwargs) -> Dict[str, str]:
-        """Generate headers for the request."""
+        """Generate headers for the request, with variables resolved as in generate_url."""
         self.headers = generate_headers_from_request(self.request)
+
+        scope = self.generate_variable_scope(**kwargs)
+        if scope is not None:
+            self.headers = {
+                key: pmvr.resolve_template(value, scope) if value else value
+                for key, value in self.headers.items()
+            }
+
         return self.headers
 
+    def generate_body(self, **kwargs) -> Any:
+        """Generate the request body, with variables resolved as in generate_url."""
+        self.body = generate_body_from_request(
+            self.request, self.generate_variable_scope(**kwargs)
+        )
+        return self.body
+
     def generate_params(
         self,
         signature_params: Optional[List[str]] = None,
@@ -187,41 +320,49 @@ class PostmanRequestConverter:
 
         self._params_signature = [p for p in self.params if p.key in signature_params]
 
-        res = "{"
-
-        res += ",".join(
+        # hardcoded params first, then those passed through from the signature
+        self._params_body = pmtp.render_dict_literal(
             [
-                ", ".join(
-                    f'"{p.key}": {p._generate_value_str()}'
-                    for p in self.params
-                    if p.key not in excluded_params and p.key not in signature_params
-                ),
-                ", ".join(
-                    f'"{p.key}": {p.name}'
-                    for p in self.params
-                    if p.key not in excluded_params and p.key in signature_params
-                ),
+                (p.key, p._generate_value_str())
+                for p in self.params
+                if p.key not in excluded_params and p.key not in signature_params
+            ]
+            + [
+                (p.key, p.name)
+                for p in self.params
+                if p.key not in excluded_params and p.key in signature_params
             ]
         )
 
-        res += "}"
-
-        self._params_body = res
-
         return self._params_signature, self._params_body
 
-    def generate_url(self, base_url_variable: str = None, **kwargs) -> str:
-        """Generate the URL for the request."""
+    def generate_url(
+        self,
+        base_url_variable: str = None,
+        environment: Optional[Dict[str, str]] = None,
+        resolve_variables: bool = False,
+        **kwargs,
+    ) -> str:
+        """Generate the URL for the request.
+
+        Args:
+            base_url_variable (str): Variable replaced by the matching `auth` attribute
+            environment (Optional[Dict[str, str]]): Postman environment values
+            resolve_variables (bool): Also substitute collection, folder, environment
+                and url path variables, following Postman's scoping
+        """
 
         self.url = generate_url_from_request(self.request)
 
-        if base_url_variable:
-            self.url = replace_postman_variables(
-                generate_url_from_request(self.request),
-                variable_name=base_url_variable,
-                provider_class_attribute=pmcv.to_snake_case(base_url_variable),
-                provider_class_name="auth",
-            )
+        scope = self.generate_variable_scope(
+            base_url_variable=base_url_variable,
+            environment=environment,
+            resolve_variables=resolve_variables,
+        )
+        if scope is None:
+            return self.url
+
+        self.url = pmvr.resolve_template(self.url, scope)
 
         return self.url
 
@@ -238,106 +379,58 @@ class PostmanRequestConverter:
 
         return self.description
 
-    def _append_code(self, code_ls: List[str], indent: int = 0) -> str:
-        indent = " " * (indent * 4)
-
-        self.code += "\n".join(
-            f"{indent}{line}" if line.strip() else line for line in code_ls
-        )
-
-        return self.code
-
     def generate_request_code(
         self,
         config=None,
         is_add_imports: bool = True,
     ) -> str:
-        """Build the request code for the function."""
+        """Build the request code for the function.
 
-        self.code = ""
+        `config["is_async"]` renders an `async def` backed by gd_requests_async.
+        `config["is_stream"]` adds stream, file_path and records_path parameters for
+        bodies too large to hold in memory.
+        """
 
         params_signature, params_body = self.generate_params(**config)
 
+        is_stream = bool(config and config.get("is_stream"))
+        if is_stream:
+            clashes = sorted(
+                {param.name for param in params_signature}
+                & set(pmtp.STREAM_PARAM_NAMES)
+            )
+            if clashes:
+                raise ValueError(
+                    f"Signature params {clashes} clash with the parameters added by is_stream, "
+                    "exclude them or leave them out of signature_params."
+                )
+
+        # headers and body are not rendered (generated functions send json), so
+        # generate_headers / generate_body are left to callers that want them
         if config:
             self.generate_function_name(**config)
-            self.generate_headers(**config)
             self.generate_description(**config)
             self.generate_url(**config)
 
-        if is_add_imports:
-
-            self._append_code(
-                code_ls=[
-                    "# Auto-generated by PostmanConverter. Do not edit manually.\n",
-                    f"# {' > '.join([parent.name for parent in self.request.get_parents() if isinstance(parent, PostmanFolder)] +[self.request.name])}\n",
-                    "from src.client.Auth import Auth\n"
-                    "from src.client.get_data import gd_requests\n"
-                    "from typing import Dict\n\n",
-                ],
-                indent=0,
-            )
-
-            self._append_code(
-                [
-                    f"def {self.function_name}(\n",
-                ],
-                indent=0,
-            )
-
-        self._append_code(
-            [
-                "auth : Auth, # class that handles generating auth headers",
-                *[param.generate_signature_part() for param in params_signature],
-                "\n",
-            ],
-            indent=1,
-        )
-
-        self._append_code(
-            [
-                "):\n",
-            ],
-            indent=0,
-        )
-
-        if self.description:
-            self._append_code(
-                [
-                    '"""',
-                    *pmcv.convert_str_to_str_list(
-                        self.description, is_return_list=True
-                    ),
-                    '"""\n',
-                ],
-                1,
-            )
-
-        self._append_code([f"url = '{self.url}'\n"], indent=1)
-
-        self.headers = {"content-type": "application/json"}
-
-        if self.headers:
-            self._append_code([f"headers = {self.headers}\n"], indent=1)
-
-        self._append_code([f"method = '{self.request.method.lower()}'\n"], indent=1)
-
-        self._append_code([f"params = {params_body}\n"], indent=1)
-
-        self._append_code(
-            [
-                "res = gd_requests(auth = auth , method = method, url = url, headers = headers, params = params)\n\n"
+        self.code = pmtp.render_request_code(
+            function_name=self.function_name,
+            breadcrumb=" > ".join(self.request.get_breadcrumb()),
+            signature_lines=[
+                param.generate_signature_part() for param in params_signature
             ],
-            indent=1,
-        )
-
-        self._append_code(
-            [
-                "if not res.ok:",
-                "    raise ValueError(f'Error {res.status_code}: {res.text}')",
-                "else:",
-                "    return res",
-            ],
-            indent=1,
+            description_lines=(
+                pmcv.convert_str_to_str_list(self.description, is_return_list=True)
+                if self.description
+                else None
+            ),
+            url=self.url,
+            # generated functions send json; the request's own headers are not rendered
+            headers={"content-type": "application/json"},
+            method=self.request.method.lower(),
+            params=params_body,
+            is_add_imports=is_add_imports,
+            is_async=bool(config and config.get("is_async")),
+            is_stream=is_stream,
         )
 
         return self.code
@@ -365,30 +458,64 @@ class PostmanRequestConverter:
     #     self.generated_url = self.generate_url()
     #     self.generated_params = self.generate_params()
 
-    def export_code(
+    def get_file_path(
         self,
         file_path: str = None,
         export_base_folder: str = "./EXPORT",
-        config: dict = None,
         prefix: str = "",  # only applies if no file_path specified
-        replace_folder: bool = False,
-        is_add_imports: bool = True,
-        # include_test_code: bool = True,
-        debug_prn: bool = False,
     ) -> str:
-
-        code = self.generate_request_code(config=config, is_add_imports=is_add_imports)
-
         if not file_path:
             file_path = f"{prefix}{self.function_name}.py"
 
         if export_base_folder:
             file_path = os.path.join(export_base_folder, file_path)
 
+        return file_path
+
+    def write_code(
+        self,
+        file_path: str = None,
+        export_base_folder: str = "./EXPORT",
+        prefix: str = "",  # only applies if no file_path specified
+        replace_folder: bool = False,
+        debug_prn: bool = False,
+    ) -> str:
+        """Write the already generated code without rendering it again.
+
+        Returns:
+            str: Path of the written file
+        """
+
+        file_path = self.get_file_path(file_path, export_base_folder, prefix)
+
         if debug_prn:
             print(f"Exporting to {file_path}")
 
-        pmfi.upsert_file(file_path, content=code, replace_folder=replace_folder)
+        pmfi.upsert_file(file_path, content=self.code, replace_folder=replace_folder)
+
+        return file_path
+
+    def export_code(
+        self,
+        file_path: str = None,
+        export_base_folder: str = "./EXPORT",
+        config: dict = None,
+        prefix: str = "",  # only applies if no file_path specified
+        replace_folder: bool = False,
+        is_add_imports: bool = True,
+        # include_test_code: bool = True,
+        debug_prn: bool = False,
+    ) -> str:
+
+        self.generate_request_code(config=config, is_add_imports=is_add_imports)
+
+        return self.write_code(
+            file_path=file_path,
+            export_base_folder=export_base_folder,
+            prefix=prefix,
+            replace_folder=replace_folder,
+            debug_prn=debug_prn,
+        )
 
         # Add test code if requested
         # if include_test_code:
@@ -527,95 +654,671 @@ class PostmanRequestConverter:
     #     )
 
 
-# @dataclass
-# class PostmanCollectionConverter:
-#     """Class to handle conversions for entire Postman Collections."""
-
-#     export_folder: str
-#     collection: PostmanCollection
-#     converters: List[PostmanRequestConverter] = field(default_factory=list)
-
-#     customize: Dict[str, Dict] = field(default_factory=dict)
-#     required_headers: List[str] = field(default_factory=list)
-
-#     @classmethod
-#     def from_postman_collection(
-#         cls,
-#         postman_path: str,
-#         export_folder: str,
-#         customize: Optional[Dict[str, Dict]] = None,
-#         required_headers: Optional[List[str]] = None,
-#         is_replace: bool = False,
-#         is_include_test_code: bool = True,
-#     ) -> "PostmanCollectionConverter":
-#         """Load a PostmanCollection from a file.
-
-#         Args:
-#             postman_path (str): Path to the Postman collection file
-#             export_folder (str): Folder to export the generated files to
-#             customize (Optional[Dict[str, Dict]]): Customization options for functions
-#             required_headers (Optional[List[str]]): List of header keys to include
-
-#         Returns:
-#             PostmanCollectionConverter: Converter instance for the collection
-#         """
-#         collection = PostmanCollection.from_file(postman_path)
-
-#         collection_converter = cls(
-#             collection=collection,
-#             export_folder=export_folder,
-#             customize=customize or {},
-#             required_headers=required_headers or [],
-#         )
-
-#         if is_replace:
-#             utils.upsert_folder(export_folder, is_replace=True)
-
-#         collection_converter.generate_conversion_files(
-#             is_replace=False,
-#             is_include_test_code=is_include_test_code,
-#         )
-#         return collection_converter
-
-#     def get_customize(self, function_name):
-#         """Get the customization options for a specific function."""
-#         return self.customize.get(function_name, {})
-
-#     def generate_conversion_files(
-#         self, is_replace: bool = False, is_include_test_code: bool = True
-#     ) -> List[PostmanRequestConverter]:
-#         """Generate implementation files for each request in the collection.
-
-#         Args:
-#             is_replace (bool): Whether to replace existing files. Defaults to True.
-#             is_include_test_code (bool): Whether to include test code. Defaults to True
-
-#         Returns:
-#             List[PostmanRequestConverter]: List of converters used to generate the files
-#         """
-
-#         for request in self.collection.requests:
-#             # Generate the function name that would be used
-#             function_name = PostmanRequestConverter._generate_function_name(
-#                 request.name, request.method
-#             )
-
-#             # Get any customizations for this function
-#             customize = self.get_customize(function_name)
-
-#             # Use function-specific required_headers if provided, or class-wide required_headers otherwise
-#             req_headers = customize.get("required_headers", self.required_headers)
-
-#             # Convert request to a PostmanRequestConverter
-#             converter = PostmanRequestConverter.from_postman_request(
-#                 request=request,
-#                 export_folder=self.export_folder,
-#                 is_include_test_code=is_include_test_code,
-#                 is_replace=is_replace,
-#                 required_headers=req_headers,
-#                 **{k: v for k, v in customize.items() if k != "required_headers"},
-#             )
-
-#             self.converters.append(converter)
-
-#         return self.converters
+def get_fingerprint_context(
+    request: PostmanRequest, config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """What a request's output depends on besides the request and the config.
+
+    The breadcrumb (collection and folder names) is written in the file header.
+    With resolve_variables, the collection, folder and environment variables in
+    scope are substituted into the code.
+    """
+    context = {"breadcrumb": request.get_breadcrumb()}
+
+    if config.get("resolve_variables"):
+        scope = pmvr.PostmanVariableScope.from_request(
+            request, environment=config.get("environment")
+        )
+        context["variables"] = scope.variables
+
+    return context
+
+
+def diff_collections(
+    old: PostmanFolder, new: PostmanFolder, config: Dict[str, Any]
+) -> pmdf.PostmanCollectionDiff:
+    """Diff two versions of a collection as converted with config.
+
+    Unlike a bare PostmanCollectionDiff, requests whose breadcrumb or resolved
+    variables changed count as modified, as they do for incremental convert.
+    """
+    return pmdf.PostmanCollectionDiff.from_collections(
+        old, new, get_context=lambda request: get_fingerprint_context(request, config)
+    )
+
+
+@dataclass
+class PostmanConversionResult:
+    """Outcome of converting one request of a collection.
+
+    Attributes:
+        index (int): Position of the request in the converter's request list
+        function_name (Optional[str]): Name of the generated function
+        file_path (Optional[str]): Written file, None when not exported or on error
+        code (Optional[str]): The generated code, None when skipped
+        content_hash (Optional[str]): Hash of the generated code
+        error (Optional[str]): The exception raised while converting, if any
+        is_skipped (bool): The request was unchanged since the last export and not rendered
+    """
+
+    index: int
+    function_name: Optional[str] = None
+    file_path: Optional[str] = None
+    code: Optional[str] = field(default=None, repr=False)
+    content_hash: Optional[str] = None
+    error: Optional[str] = None
+    is_skipped: bool = False
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+
+# per process state of convert_collection_request, set once by init_conversion_worker
+_worker_state: Dict[str, Any] = {}
+
+
+def init_conversion_worker(
+    requests: List[PostmanRequest],
+    config: Dict[str, Any],
+    export_kwargs: Optional[Dict[str, Any]],
+    content_hashes: Optional[Dict[int, str]] = None,
+    is_add_imports: bool = True,
+) -> None:
+    """Process pool initializer: receive the requests once instead of with every task.
+
+    content_hashes holds the hash of each request's previously written file, so
+    unchanged output is not rewritten.
+    """
+    _worker_state.update(
+        {
+            "requests": requests,
+            "config": config,
+            "export_kwargs": export_kwargs,
+            "content_hashes": content_hashes or {},
+            "is_add_imports": is_add_imports,
+        }
+    )
+
+
+def convert_collection_request(index: int) -> PostmanConversionResult:
+    """Render (and write) one request of the worker's request list, capturing errors."""
+    request = _worker_state["requests"][index]
+    export_kwargs = _worker_state["export_kwargs"]
+
+    result = PostmanConversionResult(index=index)
+
+    try:
+        converter = PostmanRequestConverter.from_postman_request(
+            request,
+            config=_worker_state["config"],
+            is_add_imports=_worker_state["is_add_imports"],
+        )
+        result.function_name = converter.function_name
+        result.code = converter.code
+        result.content_hash = pmmf.hash_content(converter.code)
+
+        if export_kwargs is not None:
+            file_path = converter.get_file_path(**export_kwargs)
+
+            # identical output keeps its mtime, so downstream .pyc caches stay valid
+            if result.content_hash == _worker_state["content_hashes"].get(
+                index
+            ) and os.path.exists(file_path):
+                result.file_path = file_path
+            else:
+                result.file_path = converter.write_code(**export_kwargs)
+
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+
+    return result
+
+
+@dataclass
+class PostmanCollectionConverter:
+    """Convert every request of a collection, each rendered exactly once.
+
+    Rendering is spread across a process pool. The request list is sent to each
+    worker once through the pool initializer, so tasks only carry request indexes.
+    A failing request is recorded in `results` instead of stopping the run.
+
+    Attributes:
+        collection (PostmanFolder): Collection (or folder) being converted
+        config (Dict[str, Any]): Conversion config, as passed to from_postman_request
+        requests (List[PostmanRequest]): Requests to convert, defaults to every request
+        results (List[PostmanConversionResult]): One result per request, in order
+        seconds (float): Wall clock time of the last run
+    """
+
+    collection: PostmanFolder = field(repr=False)
+    config: Dict[str, Any] = field(default_factory=dict)
+    requests: List[PostmanRequest] = field(default_factory=list, repr=False)
+    results: List[PostmanConversionResult] = field(default_factory=list, repr=False)
+    seconds: float = 0
+
+    def __post_init__(self):
+        if not self.requests:
+            self.requests = self.collection.get_index().requests
+
+    @classmethod
+    def from_postman_collection(
+        cls,
+        collection: PostmanFolder,
+        config: Dict[str, Any],
+        export_base_folder: Optional[str] = "./EXPORT",
+        prefix: str = "",
+        replace_folder: bool = False,
+        n_jobs: Optional[int] = None,
+        is_incremental: bool = True,
+        output_mode: str = "file",
+        debug_prn: bool = False,
+    ) -> "PostmanCollectionConverter":
+        """Convert and export a whole collection, see convert for the arguments."""
+
+        converter = cls(collection=collection, config=config)
+
+        converter.convert(
+            export_base_folder=export_base_folder,
+            prefix=prefix,
+            replace_folder=replace_folder,
+            n_jobs=n_jobs,
+            is_incremental=is_incremental,
+            output_mode=output_mode,
+            debug_prn=debug_prn,
+        )
+
+        return converter
+
+    def convert(
+        self,
+        export_base_folder: Optional[str] = "./EXPORT",
+        prefix: str = "",
+        replace_folder: bool = False,
+        n_jobs: Optional[int] = None,
+        is_incremental: bool = True,
+        output_mode: str = "file",
+        debug_prn: bool = False,
+    ) -> List[PostmanConversionResult]:
+        """Render every request once and write it to export_base_folder.
+
+        Args:
+            export_base_folder (Optional[str]): Folder receiving the generated files.
+                None only renders; the code is kept on the results
+            prefix (str): File name prefix, as passed to export_code ("file" mode only)
+            replace_folder (bool): Empty export_base_folder before writing
+            n_jobs (Optional[int]): Worker processes, defaults to the CPU count. 1 runs serially
+            is_incremental (bool): Keep a manifest in export_base_folder; requests whose
+                fingerprint and config are unchanged are skipped, unchanged output is
+                not rewritten and files of removed requests are deleted
+            output_mode (str): "file" writes one module per request. "folder" mirrors the
+                folder tree as packages, each with one `endpoints.py` module holding
+                the functions of its requests; root requests go in `endpoints.py`
+            debug_prn (bool): Print errors and the throughput
+
+        Returns:
+            List[PostmanConversionResult]: One result per request, in request order
+        """
+        if output_mode not in OUTPUT_MODES:
+            raise ValueError(f"output_mode must be one of {OUTPUT_MODES}")
+
+        start = time.perf_counter()
+
+        is_module_mode = output_mode == "folder"
+
+        if export_base_folder is not None:
+            pmfi.upsert_folder(export_base_folder, replace_folder=replace_folder)
+
+        manifest = None
+        identities = {}
+        fingerprints = {}
+        config_hash = None
+
+        if export_base_folder is not None and is_incremental:
+            manifest = pmmf.PostmanExportManifest.load(export_base_folder)
+            config_hash = pmmf.hash_config(self.config, prefix, output_mode)
+
+            identities = {
+                id(request): identity
+                for identity, request in pmdf.get_request_identities(
+                    self.collection
+                ).items()
+            }
+            fingerprints = {
+                index: pmdf.fingerprint_request(
+                    request, context=get_fingerprint_context(request, self.config)
+                )
+                for index, request in enumerate(self.requests)
+            }
+
+        def _get_current_entry(index: int) -> Optional[pmmf.PostmanManifestEntry]:
+            if manifest is None:
+                return None
+
+            return manifest.get_current_entry(
+                identities.get(id(self.requests[index])),
+                fingerprints[index],
+                config_hash,
+            )
+
+        if is_module_mode:
+            results, skipped = self._convert_modules(
+                export_base_folder, manifest, identities, _get_current_entry, n_jobs
+            )
+
+        else:
+            results, skipped = self._convert_files(
+                export_base_folder,
+                prefix,
+                manifest,
+                identities,
+                _get_current_entry,
+                n_jobs,
+            )
+
+        self.results = sorted(skipped + results, key=lambda result: result.index)
+
+        if manifest is not None:
+            for result in results:
+                identity = identities.get(id(self.requests[result.index]))
+
+                if identity is None or not result.is_success or not result.file_path:
+                    continue
+
+                manifest.set_entry(
+                    identity,
+                    pmmf.PostmanManifestEntry(
+                        fingerprint=fingerprints[result.index],
+                        config_hash=config_hash,
+                        file_path=os.path.relpath(result.file_path, export_base_folder),
+                        content_hash=result.content_hash,
+                        function_name=result.function_name,
+                    ),
+                )
+
+            manifest.remove_orphans(identities.values(), debug_prn=debug_prn)
+            manifest.save()
+
+        if export_base_folder is not None:
+            self._write_package_inits(export_base_folder)
+
+        self.seconds = time.perf_counter() - start
+
+        if debug_prn:
+            for index, error in self.errors.items():
+                print(f"{self.requests[index].name}: {error}")
+
+            print(
+                f"Converted {len(results) - len(self.errors)}/{len(self.requests)} requests "
+                f"({len(skipped)} unchanged) in {self.seconds:.3f}s "
+                f"({self.requests_per_second:.0f} requests/s)"
+            )
+
+        return self.results
+
+    def _convert_files(
+        self,
+        export_base_folder: Optional[str],
+        prefix: str,
+        manifest: Optional[pmmf.PostmanExportManifest],
+        identities: Dict[int, str],
+        get_current_entry: Callable,
+        n_jobs: Optional[int] = None,
+    ) -> Tuple[List[PostmanConversionResult], List[PostmanConversionResult]]:
+        """Render and write one file per request; returns (rendered, skipped) results."""
+        export_kwargs = None
+        if export_base_folder is not None:
+            export_kwargs = {"export_base_folder": export_base_folder, "prefix": prefix}
+
+        skipped = []
+        pending = []
+        content_hashes = {}
+
+        for index, request in enumerate(self.requests):
+            entry = get_current_entry(index)
+
+            if entry is None:
+                pending.append(index)
+
+                previous = manifest and manifest.entries.get(
+                    identities.get(id(request))
+                )
+                if previous:
+                    content_hashes[index] = previous.content_hash
+                continue
+
+            skipped.append(
+                PostmanConversionResult(
+                    index=index,
+                    function_name=entry.function_name,
+                    file_path=manifest.get_file_path(entry),
+                    content_hash=entry.content_hash,
+                    is_skipped=True,
+                )
+            )
+
+        results = self._render(pending, export_kwargs, content_hashes, n_jobs)
+
+        return results, skipped
+
+    def _convert_modules(
+        self,
+        export_base_folder: Optional[str],
+        manifest: Optional[pmmf.PostmanExportManifest],
+        identities: Dict[int, str],
+        get_current_entry: Callable,
+        n_jobs: Optional[int] = None,
+    ) -> Tuple[List[PostmanConversionResult], List[PostmanConversionResult]]:
+        """Render one module per folder; a module is skipped only when all its requests are."""
+        module_paths = {
+            id(request): generate_module_path(folder_path)
+            for folder_path, requests in self.collection.get_index().by_folder.items()
+            for request in requests
+        }
+
+        modules: Dict[str, List[int]] = {}
+        for index, request in enumerate(self.requests):
+            module_path = module_paths.get(id(request), MODULE_FILE_NAME)
+            modules.setdefault(module_path, []).append(index)
+
+        manifest_members: Dict[str, set] = {}
+        for identity, entry in (manifest.entries if manifest else {}).items():
+            manifest_members.setdefault(entry.file_path, set()).add(identity)
+
+        skipped = []
+        pending = []
+
+        for module_path, indexes in modules.items():
+            entries = [get_current_entry(index) for index in indexes]
+
+            members = {identities.get(id(self.requests[index])) for index in indexes}
+
+            if all(entries) and members == manifest_members.get(module_path):
+                skipped.extend(
+                    PostmanConversionResult(
+                        index=index,
+                        function_name=entry.function_name,
+                        file_path=manifest.get_file_path(entry),
+                        content_hash=entry.content_hash,
+                        is_skipped=True,
+                    )
+                    for index, entry in zip(indexes, entries)
+                )
+                continue
+
+            pending.extend(indexes)
+
+        results = self._render(pending, None, {}, n_jobs, is_add_imports=False)
+
+        if export_base_folder is None:
+            return results, skipped
+
+        results_by_index = {result.index: result for result in results}
+
+        for module_path, indexes in modules.items():
+            module_results = [
+                results_by_index[index]
+                for index in indexes
+                if index in results_by_index and results_by_index[index].is_success
+            ]
+
+            if not module_results:
+                continue
+
+            functions = []
+            function_names = set()
+
+            for result in module_results:
+                # requests of one folder can map to the same function name
+                function_name = result.function_name
+                n = 2
+                while function_name in function_names:
+                    function_name = f"{result.function_name}_{n}"
+                    n += 1
+
+                function_names.add(function_name)
+                functions.append(
+                    result.code.replace(
+                        f"def {result.function_name}(", f"def {function_name}(", 1
+                    )
+                )
+                result.function_name = function_name
+
+            code = pmtp.render_module_code(
+                breadcrumb=" > ".join(
+                    self.requests[module_results[0].index].parent.folder_path
+                ),
+                functions=functions,
+                is_async=bool(self.config.get("is_async")),
+                is_stream=bool(self.config.get("is_stream")),
+            )
+
+            file_path = os.path.join(export_base_folder, module_path)
+            content_hash = pmmf.hash_content(code)
+
+            previous_hashes = {
+                manifest.entries[identity].content_hash
+                for identity in manifest_members.get(module_path, ())
+            }
+
+            # identical output keeps its mtime, so downstream .pyc caches stay valid
+            if content_hash not in previous_hashes or not os.path.exists(file_path):
+                pmfi.upsert_file(file_path, content=code)
+
+            self._upsert_package_inits(export_base_folder, module_path)
+
+            for result in module_results:
+                result.file_path = file_path
+                result.content_hash = content_hash
+
+        return results, skipped
+
+    def _write_package_inits(self, export_base_folder: str) -> List[str]:
+        """Write a lazy `__init__.py` for the export folder and every package below it.
+
+        Each maps the functions of its subtree to their module, imported on first access.
+        Unchanged files are not rewritten.
+
+        Returns:
+            List[str]: Paths of the written files
+        """
+        function_modules: Dict[str, Dict[str, str]] = {}
+        submodules: Dict[str, Dict[str, str]] = {}
+
+        for result in self.results:
+            if (
+                not result.is_success
+                or not result.file_path
+                or not result.function_name
+            ):
+                continue
+
+            parts = os.path.relpath(result.file_path, export_base_folder)[:-3].split(
+                os.sep
+            )
+
+            # every package from the export root down to the module's own
+            for depth in range(len(parts)):
+                package = os.sep.join(parts[:depth])
+
+                # functions repeated across modules resolve to the first one
+                function_modules.setdefault(package, {}).setdefault(
+                    result.function_name, "." + ".".join(parts[depth:])
+                )
+                submodules.setdefault(package, {})[parts[depth]] = f".{parts[depth]}"
+
+        res = []
+        for package, package_function_modules in function_modules.items():
+            code = pmtp.render_package_init(
+                function_modules=dict(sorted(package_function_modules.items())),
+                submodules=dict(sorted(submodules[package].items())),
+            )
+
+            init_path = os.path.join(export_base_folder, package, "__init__.py")
+
+            if os.path.exists(init_path):
+                with open(init_path, "r", encoding="utf-8") as f:
+                    if f.read() == code:
+                        continue
+
+            pmfi.upsert_file(init_path, content=code)
+            res.append(init_path)
+
+        return res
+
+    @staticmethod
+    def _upsert_package_inits(export_base_folder: str, module_path: str) -> None:
+        """Create the missing `__init__.py` of every package down to module_path."""
+        folder_path = export_base_folder
+
+        for name in os.path.dirname(module_path).split(os.sep):
+            if not name:
+                continue
+
+            folder_path = os.path.join(folder_path, name)
+            init_path = os.path.join(folder_path, "__init__.py")
+
+            if not os.path.exists(init_path):
+                pmfi.upsert_file(init_path, content="")
+
+    def _render(
+        self,
+        indexes: List[int],
+        export_kwargs: Optional[Dict[str, Any]],
+        content_hashes: Dict[int, str],
+        n_jobs: Optional[int] = None,
+        is_add_imports: bool = True,
+    ) -> List[PostmanConversionResult]:
+        if not indexes:
+            return []
+
+        n_jobs = min(n_jobs or os.cpu_count() or 1, len(indexes))
+
+        initargs = (
+            self.requests,
+            self.config,
+            export_kwargs,
+            content_hashes,
+            is_add_imports,
+        )
+
+        if n_jobs == 1:
+            init_conversion_worker(*initargs)
+            try:
+                return [convert_collection_request(index) for index in indexes]
+            finally:
+                _worker_state.clear()
+
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=init_conversion_worker,
+            initargs=initargs,
+        ) as executor:
+            return list(
+                executor.map(
+                    convert_collection_request,
+                    indexes,
+                    chunksize=max(1, len(indexes) // (n_jobs * 8)),
+                )
+            )
+
+    @property
+    def errors(self) -> Dict[int, str]:
+        """Error by request index."""
+        return {
+            result.index: result.error
+            for result in self.results
+            if not result.is_success
+        }
+
+    @property
+    def requests_per_second(self) -> float:
+        return len(self.results) / self.seconds if self.seconds else 0
+
+
+def export_collection_diff(
+    diff,
+    config: Dict[str, Any],
+    export_base_folder: str = "./EXPORT",
+    prefix: str = "",
+    n_jobs: Optional[int] = None,
+    debug_prn: bool = False,
+) -> Dict[str, List[str]]:
+    """Apply a PostmanCollectionDiff to an export folder.
+
+    Only added and modified requests are rendered and written, through the same
+    process pool as PostmanCollectionConverter. Files of removed requests, and
+    files left behind when a modified request's function name changed, are
+    deleted unless a request of the new collection still renders to the same path.
+    Build the diff with diff_collections so variable and breadcrumb changes count.
+
+    Args:
+        diff (PostmanCollectionDiff): Diff between the exported and the new collection
+        config (Dict[str, Any]): Conversion config, as passed to export_code
+        export_base_folder (str): Folder holding the generated files
+        prefix (str): File name prefix, as passed to export_code
+        n_jobs (Optional[int]): Worker processes, defaults to the CPU count. 1 runs serially
+
+    Returns:
+        Dict[str, List[str]]: The "written" and "removed" file paths, and the
+            "errors" of requests that failed to render ("name: error")
+    """
+
+    def _get_file_path(request: PostmanRequest) -> str:
+        function_name = generate_function_name_from_request(
+            request,
+            drop_n_from_path_head=config.get("drop_n_from_path_head", 0),
+            prefix=config.get("prefix", ""),
+        )
+        return os.path.join(export_base_folder, f"{prefix}{function_name}.py")
+
+    res = {"written": [], "removed": [], "errors": []}
+
+    changed_requests = diff.changed_requests
+
+    if changed_requests:
+        converter = PostmanCollectionConverter(
+            collection=diff.new_collection,
+            config=config,
+            requests=changed_requests,
+        )
+        results = converter._render(
+            list(range(len(changed_requests))),
+            {"export_base_folder": export_base_folder, "prefix": prefix},
+            {},
+            n_jobs,
+        )
+
+        for result in results:
+            if not result.is_success:
+                res["errors"].append(
+                    f"{changed_requests[result.index].name}: {result.error}"
+                )
+                continue
+
+            if debug_prn:
+                print(f"Exporting to {result.file_path}")
+
+            res["written"].append(result.file_path)
+
+    # a removed request can share its file with a request kept in another folder
+    live_paths = set(res["written"])
+    if diff.new_collection is not None:
+        live_paths.update(
+            _get_file_path(request)
+            for request in diff.new_collection.get_folder_requests()
+        )
+
+    stale_requests = [change.old for change in diff.removed + diff.modified]
+
+    for file_path in {_get_file_path(request) for request in stale_requests}:
+        if file_path in live_paths or not os.path.exists(file_path):
+            continue
+
+        if debug_prn:
+            print(f"Removing {file_path}")
+
+        os.remove(file_path)
+        res["removed"].append(file_path)
+
+    return res
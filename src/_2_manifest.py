@@ -0,0 +1,222 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import src
+
+MANIFEST_FILE_NAME = ".postman_manifest.json"
+
+# bump when the manifest layout changes so older manifests trigger a full export
+MANIFEST_FORMAT = 2
+
+
+def hash_content(content: str) -> str:
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def hash_config(
+    config: Dict[str, Any], prefix: str = "", output_mode: str = "file"
+) -> str:
+    """Hash of everything besides the request that shapes a generated file.
+
+    The library version is included so a generator upgrade re-renders every file.
+    """
+    return hash_content(
+        json.dumps(
+            {
+                "config": config,
+                "prefix": prefix,
+                "output_mode": output_mode,
+                "version": src.__version__,
+            },
+            sort_keys=True,
+            default=str,
+        )
+    )
+
+
+@dataclass
+class PostmanManifestEntry:
+    """What one request was last exported from and to.
+
+    Attributes:
+        fingerprint (str): fingerprint_request of the exported request
+        config_hash (str): hash_config of the export
+        file_path (str): Written file, relative to the export folder
+        content_hash (str): hash_content of the written code
+        function_name (Optional[str]): Name of the generated function
+    """
+
+    fingerprint: str
+    config_hash: str
+    file_path: str
+    content_hash: str
+    function_name: Optional[str] = None
+
+
+@dataclass
+class PostmanExportManifest:
+    """Record of an export folder's files, keyed by request identity.
+
+    Stored as `.postman_manifest.json` in the export folder. Lets a re-run skip
+    requests whose fingerprint and config are unchanged and delete files whose
+    request is gone.
+
+    Attributes:
+        export_base_folder (str): Folder holding the generated files and the manifest
+        entries (Dict[str, PostmanManifestEntry]): Entry by request identity
+    """
+
+    export_base_folder: str
+    entries: Dict[str, PostmanManifestEntry] = field(default_factory=dict)
+
+    # files that stopped being referenced by an entry during this run
+    _released_files: Set[str] = field(default_factory=set, repr=False)
+    _is_dirty: bool = field(default=False, repr=False)
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.export_base_folder, MANIFEST_FILE_NAME)
+
+    @classmethod
+    def load(cls, export_base_folder: str) -> "PostmanExportManifest":
+        """Read the folder's manifest; a missing or unreadable one starts empty."""
+        manifest = cls(export_base_folder=export_base_folder)
+
+        try:
+            with open(manifest.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        except (OSError, ValueError):
+            return manifest
+
+        if data.get("format") != MANIFEST_FORMAT:
+            return manifest
+
+        manifest.entries = {
+            identity: PostmanManifestEntry(**entry)
+            for identity, entry in data.get("entries", {}).items()
+        }
+
+        return manifest
+
+    def save(self, is_force: bool = False) -> str:
+        """Write the manifest atomically, so an interrupted run leaves the old one.
+
+        Skipped when no entry changed since it was loaded, unless is_force.
+        """
+        if not self._is_dirty and not is_force and os.path.exists(self.manifest_path):
+            return self.manifest_path
+
+        os.makedirs(self.export_base_folder, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.export_base_folder, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                # compact output keeps json on its C encoder
+                json.dump(
+                    {
+                        "format": MANIFEST_FORMAT,
+                        "entries": {
+                            identity: vars(entry)
+                            for identity, entry in sorted(self.entries.items())
+                        },
+                    },
+                    f,
+                )
+
+            os.replace(tmp_path, self.manifest_path)
+            self._is_dirty = False
+
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return self.manifest_path
+
+    def get_file_path(self, entry: PostmanManifestEntry) -> str:
+        return os.path.join(self.export_base_folder, entry.file_path)
+
+    def get_current_entry(
+        self, identity: Optional[str], fingerprint: str, config_hash: str
+    ) -> Optional[PostmanManifestEntry]:
+        """The entry of identity when its inputs are unchanged and its file still exists."""
+        entry = self.entries.get(identity)
+
+        if (
+            entry is None
+            or entry.fingerprint != fingerprint
+            or entry.config_hash != config_hash
+            or not os.path.exists(self.get_file_path(entry))
+        ):
+            return None
+
+        return entry
+
+    def set_entry(self, identity: str, entry: PostmanManifestEntry) -> None:
+        previous = self.entries.get(identity)
+
+        if previous is not None and previous.file_path != entry.file_path:
+            self._released_files.add(previous.file_path)
+
+        if previous != entry:
+            self.entries[identity] = entry
+            self._is_dirty = True
+
+    def remove_orphans(
+        self, identities: Iterable[str], debug_prn: bool = False
+    ) -> List[str]:
+        """Drop entries not in identities and delete files no entry refers to anymore.
+
+        Args:
+            identities (Iterable[str]): Identity of every request of the collection
+
+        Returns:
+            List[str]: Deleted file paths
+        """
+        identities = set(identities)
+
+        for identity in [
+            identity for identity in self.entries if identity not in identities
+        ]:
+            self._released_files.add(self.entries.pop(identity).file_path)
+            self._is_dirty = True
+
+        referenced = {entry.file_path for entry in self.entries.values()}
+
+        res = []
+        for relative_path in sorted(self._released_files - referenced):
+            file_path = os.path.join(self.export_base_folder, relative_path)
+
+            if not os.path.exists(file_path):
+                continue
+
+            if debug_prn:
+                print(f"Removing {file_path}")
+
+            os.remove(file_path)
+            res.append(file_path)
+
+            self._prune_package_folders(os.path.dirname(file_path))
+
+        self._released_files.clear()
+
+        return res
+
+    def _prune_package_folders(self, folder_path: str) -> None:
+        """Remove generated packages left with nothing but `__init__.py` and caches."""
+        root = os.path.abspath(self.export_base_folder)
+
+        while os.path.abspath(folder_path) != root and os.path.isdir(folder_path):
+            if set(os.listdir(folder_path)) - {"__init__.py", "__pycache__"}:
+                return
+
+            shutil.rmtree(folder_path)
+            folder_path = os.path.dirname(folder_path)
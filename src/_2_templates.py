@@ -0,0 +1,309 @@
+from dataclasses import dataclass
+from string import Formatter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+INDENT = " " * 4
+
+
+@dataclass(frozen=True)
+class CodeTemplate:
+    """A code template split once into literal text and `{field}` placeholders.
+
+    Literal braces are written `{{` and `}}`, as with str.format. Rendering appends
+    the parts to a caller-owned buffer, so a whole file is joined exactly once.
+
+    Attributes:
+        source (str): The template text
+        parts (Tuple[Tuple[str, Optional[str]], ...]): (literal, field name) pairs
+    """
+
+    source: str
+    parts: Tuple[Tuple[str, Optional[str]], ...] = ()
+
+    @classmethod
+    def compile(cls, source: str) -> "CodeTemplate":
+        parts = []
+
+        for literal, field_name, format_spec, conversion in Formatter().parse(source):
+            if format_spec or conversion:
+                raise ValueError(
+                    f"Template field '{field_name}' cannot use a format spec or conversion."
+                )
+
+            parts.append((literal, field_name))
+
+        return cls(source=source, parts=tuple(parts))
+
+    def render_into(self, buffer: List[str], values: Dict[str, Any]) -> List[str]:
+        for literal, field_name in self.parts:
+            if literal:
+                buffer.append(literal)
+
+            if field_name is not None:
+                buffer.append(str(values[field_name]))
+
+        return buffer
+
+    def render(self, **values) -> str:
+        return "".join(self.render_into([], values))
+
+
+def indent_lines(lines: Iterable[str], indent: int = 1) -> str:
+    """Join lines, indenting the ones that are not blank."""
+    prefix = INDENT * indent
+
+    return "\n".join(f"{prefix}{line}" if line.strip() else line for line in lines)
+
+
+def render_dict_literal(entries: Iterable[Tuple[str, str]]) -> str:
+    """Python dict literal from (key, value expression) pairs, keys quoted."""
+    return "{" + ", ".join(f'"{key}": {value}' for key, value in entries) + "}"
+
+
+# compiled once per process, on import
+IMPORTS_TEMPLATE = CodeTemplate.compile(
+    "# Auto-generated by PostmanConverter. Do not edit manually.\n"
+    "\n"
+    "# {breadcrumb}\n"
+    "\n"
+    "from src.client.Auth import Auth\n"
+    "from src.client.get_data import {client_imports}\n"
+    "from typing import Dict\n"
+    "\n"
+)
+
+REQUEST_SIGNATURE_TEMPLATE = CodeTemplate.compile(
+    "def {function_name}(\n{signature}\n\n):\n"
+)
+
+REQUEST_BODY_TEMPLATE = CodeTemplate.compile(
+    "    url = '{url}'\n"
+    "    headers = {headers}\n"
+    "    method = '{method}'\n"
+    "    params = {params}\n"
+    "    res = gd_requests(auth = auth , method = method, url = url, headers = headers, params = params)\n"
+    "\n"
+    "    if not res.ok:\n"
+    "        raise ApiResponseError.from_response(res)\n"
+    "    else:\n"
+    "        return res"
+)
+
+ASYNC_REQUEST_BODY_TEMPLATE = CodeTemplate.compile(
+    "    url = '{url}'\n"
+    "    headers = {headers}\n"
+    "    method = '{method}'\n"
+    "    params = {params}\n"
+    "    res = await gd_requests_async(auth = auth , method = method, url = url, headers = headers, params = params)\n"
+    "\n"
+    "    if not res.ok:\n"
+    "        raise ApiResponseError.from_response(res)\n"
+    "    else:\n"
+    "        return res"
+)
+
+# only a streaming output leaves the body on the connection (and skips the
+# response cache); stream_response reads it out as asked
+STREAM_REQUEST_BODY_TEMPLATE = CodeTemplate.compile(
+    "    url = '{url}'\n"
+    "    headers = {headers}\n"
+    "    method = '{method}'\n"
+    "    params = {params}\n"
+    "    res = gd_requests(auth = auth , method = method, url = url, headers = headers, params = params, stream = bool(stream or file_path))\n"
+    "\n"
+    "    if not res.ok:\n"
+    "        raise ApiResponseError.from_response(res)\n"
+    "    else:\n"
+    "        return stream_response(res, stream = stream, file_path = file_path, records_path = records_path)"
+)
+
+# parameters added by is_stream; request params must not reuse these names
+STREAM_PARAM_NAMES = ("stream", "file_path", "records_path")
+
+STREAM_SIGNATURE_LINES = [
+    'stream: str = None,  # "chunks" or "records" to return an iterator instead of the response',
+    "file_path: str = None,  # download the body to this path and return the path",
+    'records_path: tuple = (),  # keys leading to the JSON array with stream = "records"',
+]
+
+
+def _render_imports_into(
+    buffer: List[str], breadcrumb: str, is_async: bool, is_stream: bool
+) -> List[str]:
+    client_imports = ["ApiResponseError"]
+    client_imports.append("gd_requests_async" if is_async else "gd_requests")
+
+    if is_stream:
+        client_imports.append("stream_response")
+
+    return IMPORTS_TEMPLATE.render_into(
+        buffer,
+        {"breadcrumb": breadcrumb, "client_imports": ", ".join(client_imports)},
+    )
+
+
+def _get_body_template(is_async: bool, is_stream: bool) -> CodeTemplate:
+    if is_async and is_stream:
+        raise ValueError("Streaming is not supported for async request functions.")
+
+    if is_async:
+        return ASYNC_REQUEST_BODY_TEMPLATE
+
+    return STREAM_REQUEST_BODY_TEMPLATE if is_stream else REQUEST_BODY_TEMPLATE
+
+
+def render_request_code(
+    function_name: str,
+    breadcrumb: str,
+    signature_lines: List[str],
+    description_lines: Optional[List[str]],
+    url: str,
+    headers: Dict[str, str],
+    method: str,
+    params: str,
+    is_add_imports: bool = True,
+    is_async: bool = False,
+    is_stream: bool = False,
+) -> str:
+    """Render one request function into a single buffer.
+
+    Args:
+        function_name (str): Name of the generated function
+        breadcrumb (str): Folder path of the request, for the header comment
+        signature_lines (List[str]): Parameters after `auth`, one per line
+        description_lines (Optional[List[str]]): Docstring lines, no docstring when None
+        url (str): Url literal content
+        headers (Dict[str, str]): Headers, written as a dict literal
+        method (str): Lower case HTTP method
+        params (str): Dict literal of the query params
+        is_add_imports (bool): Start with the header comment and imports
+        is_async (bool): Render an `async def` awaiting gd_requests_async
+        is_stream (bool): Add the stream, file_path and records_path parameters,
+            returning through stream_response
+
+    Returns:
+        str: The generated code
+    """
+    body_template = _get_body_template(is_async, is_stream)
+    buffer = []
+
+    if is_add_imports:
+        _render_imports_into(buffer, breadcrumb, is_async, is_stream)
+
+    if is_stream:
+        signature_lines = signature_lines + STREAM_SIGNATURE_LINES
+
+    if is_async:
+        buffer.append("async ")
+
+    REQUEST_SIGNATURE_TEMPLATE.render_into(
+        buffer,
+        {
+            "function_name": function_name,
+            "signature": indent_lines(
+                ["auth : Auth, # class that handles generating auth headers"]
+                + signature_lines
+            ),
+        },
+    )
+
+    if description_lines is not None:
+        buffer.append(indent_lines(['"""', *description_lines, '"""']))
+        buffer.append("\n")
+
+    body_template.render_into(
+        buffer,
+        {"url": url, "headers": headers, "method": method, "params": params},
+    )
+
+    return "".join(buffer)
+
+
+def render_module_code(
+    breadcrumb: str,
+    functions: Iterable[str],
+    is_async: bool = False,
+    is_stream: bool = False,
+) -> str:
+    """Render a module holding several request functions, sharing one set of imports.
+
+    Args:
+        breadcrumb (str): Folder path of the module, for the header comment
+        functions (Iterable[str]): Functions rendered with is_add_imports=False
+        is_async (bool): The functions were rendered with is_async
+        is_stream (bool): The functions were rendered with is_stream
+
+    Returns:
+        str: The module code
+    """
+    buffer = _render_imports_into([], breadcrumb, is_async, is_stream)
+
+    buffer.append("\n\n\n".join(functions))
+    buffer.append("\n")
+
+    return "".join(buffer)
+
+
+PACKAGE_INIT_TEMPLATE = CodeTemplate.compile(
+    "# Auto-generated by PostmanConverter. Do not edit manually.\n"
+    "\n"
+    "# Endpoint functions are imported from their module on first access, so importing\n"
+    "# the package does not import every endpoint.\n"
+    "\n"
+    "import importlib\n"
+    "\n"
+    "_FUNCTION_MODULES = {function_modules}\n"
+    "\n"
+    "_SUBMODULES = {submodules}\n"
+    "\n"
+    "__all__ = sorted(_FUNCTION_MODULES)\n"
+    "\n"
+    "\n"
+    "def __getattr__(name):\n"
+    "    if name in _FUNCTION_MODULES:\n"
+    "        module = importlib.import_module(_FUNCTION_MODULES[name], __name__)\n"
+    "        value = getattr(module, name)\n"
+    "\n"
+    "    elif name in _SUBMODULES:\n"
+    "        value = importlib.import_module(_SUBMODULES[name], __name__)\n"
+    "\n"
+    "    else:\n"
+    '        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")\n'
+    "\n"
+    "    # cached, so __getattr__ only runs on first access\n"
+    "    globals()[name] = value\n"
+    "    return value\n"
+    "\n"
+    "\n"
+    "def __dir__():\n"
+    "    return sorted(set(globals()) | set(_FUNCTION_MODULES) | set(_SUBMODULES))\n"
+)
+
+
+def _render_str_dict(data: Dict[str, str]) -> str:
+    if not data:
+        return "{}"
+
+    return (
+        "{\n"
+        + "".join(f'    "{key}": "{value}",\n' for key, value in data.items())
+        + "}"
+    )
+
+
+def render_package_init(
+    function_modules: Dict[str, str], submodules: Dict[str, str]
+) -> str:
+    """Render a package `__init__.py` that imports endpoint modules on first access.
+
+    Args:
+        function_modules (Dict[str, str]): Relative module (".folder.endpoints") by function name
+        submodules (Dict[str, str]): Relative module by subpackage or module name
+
+    Returns:
+        str: The module code
+    """
+    return PACKAGE_INIT_TEMPLATE.render(
+        function_modules=_render_str_dict(function_modules),
+        submodules=_render_str_dict(submodules),
+    )
@@ -1,3 +1,5 @@
+import asyncio
+import inspect
 import os
 import sys
 from typing import Dict, Any, List, Optional
@@ -30,26 +32,44 @@ def test_exports(
     if not os.path.isdir(export_folder):
         raise ValueError(f"Directory not found: {export_folder}")
 
-    # Get all Python files in the directory
-    py_files = [
-        f
-        for f in os.listdir(export_folder)
-        if f.endswith(".py") and f != "__init__.py" and not f.startswith("test_")
-    ]
+    # Get all Python files below the directory, including per-folder packages
+    py_files = []
+    for folder_path, folder_names, file_names in os.walk(export_folder):
+        folder_names[:] = sorted(name for name in folder_names if name != "__pycache__")
 
-    # Process each file
-    for py_file in py_files:
-        file_results = {}
-        _process_test_file(
-            py_file, export_folder, auth, file_results, debug_api=debug_api
+        py_files.extend(
+            os.path.relpath(os.path.join(folder_path, f), export_folder)
+            for f in sorted(file_names)
+            if f.endswith(".py") and f != "__init__.py" and not f.startswith("test_")
         )
 
-        # Update file with test results if requested
-        if update_files:
-            _update_file_with_results(py_file, export_folder, file_results)
+    # one loop for every async function, so they share one connection pool
+    loop = asyncio.new_event_loop()
+
+    try:
+        # Process each file
+        for py_file in py_files:
+            file_results = {}
+            _process_test_file(
+                py_file,
+                export_folder,
+                auth,
+                file_results,
+                debug_api=debug_api,
+                loop=loop,
+            )
+
+            # Update file with test results if requested
+            if update_files:
+                _update_file_with_results(py_file, export_folder, file_results)
 
-        # Add file results to overall results
-        results.update(file_results)
+            # Add file results to overall results
+            results.update(file_results)
+
+    finally:
+        # closes the pool gd_requests_async opened on the loop
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
 
     # Print summary
     success_count = sum(
@@ -60,6 +80,22 @@ def test_exports(
     return results
 
 
+def _run(response: Any, loop: Optional[asyncio.AbstractEventLoop] = None) -> Any:
+    """Await a coroutine on loop, or on a fresh asyncio.run loop without one."""
+    if not inspect.iscoroutine(response):
+        return response
+
+    if loop is None:
+        return asyncio.run(response)
+
+    return loop.run_until_complete(response)
+
+
+def _get_module_name(py_file: str) -> str:
+    """Dotted module name of a file path relative to the export folder."""
+    return py_file[:-3].replace(os.sep, ".")  # Remove .py extension
+
+
 def _update_file_with_results(py_file: str, folder_path: str, results: dict) -> None:
     """Update source file with test results.
 
@@ -69,7 +105,7 @@ def _update_file_with_results(py_file: str, folder_path: str, results: dict) ->
         results (dict): Test results for the file
     """
     file_path = os.path.join(folder_path, py_file)
-    module_name = py_file[:-3]  # Remove .py extension
+    module_name = _get_module_name(py_file)
 
     # Extract results for this module only
     module_results = {
@@ -120,7 +156,12 @@ def _update_file_with_results(py_file: str, folder_path: str, results: dict) ->
 
 
 def _process_test_file(
-    py_file: str, output_path: str, auth: dict, results: dict, debug_api: bool = False
+    py_file: str,
+    output_path: str,
+    auth: dict,
+    results: dict,
+    debug_api: bool = False,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
 ) -> None:
     """Process a single Python file for testing.
 
@@ -130,8 +171,9 @@ def _process_test_file(
         auth (dict): Authentication dictionary
         results (dict): Dictionary to store results in
         debug_api (bool): Whether to enable API debugging
+        loop (Optional[asyncio.AbstractEventLoop]): Runs async functions, see _run
     """
-    module_name = py_file[:-3]  # Remove .py extension
+    module_name = _get_module_name(py_file)
     file_path = os.path.join(output_path, py_file)
 
     # Load the module dynamically
@@ -161,7 +203,13 @@ def _process_test_file(
         # Test each API function
         for func_name in api_functions:
             _test_api_function(
-                module, module_name, func_name, auth, results, debug_api=debug_api
+                module,
+                module_name,
+                func_name,
+                auth,
+                results,
+                debug_api=debug_api,
+                loop=loop,
             )
 
         # Check for test functions to run
@@ -175,7 +223,13 @@ def _process_test_file(
 
         for test_func_name in test_functions:
             _test_test_function(
-                module, module_name, test_func_name, auth, results, debug_api=debug_api
+                module,
+                module_name,
+                test_func_name,
+                auth,
+                results,
+                debug_api=debug_api,
+                loop=loop,
             )
 
     except Exception as e:
@@ -195,6 +249,7 @@ def _test_api_function(
     auth: dict,
     results: dict,
     debug_api: bool = False,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
 ) -> None:
     """Test a single API function.
 
@@ -205,11 +260,16 @@ def _test_api_function(
         auth (dict): Authentication dictionary
         results (dict): Dictionary to store results in
         debug_api (bool): Whether to enable API debugging
+        loop (Optional[asyncio.AbstractEventLoop]): Runs async functions, see _run
     """
     func = getattr(module, func_name)
     try:
         print(f"Testing {module_name}.{func_name}...")
         response = func(auth=auth, debug_api=debug_api)
+
+        # functions exported with config["is_async"]
+        response = _run(response, loop)
+
         results[f"{module_name}.{func_name}"] = {
             "status": (
                 response.status_code if hasattr(response, "status_code") else "unknown"
@@ -239,6 +299,7 @@ def _test_test_function(
     auth: dict,
     results: dict,
     debug_api: bool = False,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
 ) -> None:
     """Test a single test function (functions that start with test_).
 
@@ -249,11 +310,15 @@ def _test_test_function(
         auth (dict): Authentication dictionary
         results (dict): Dictionary to store results in
         debug_api (bool): Whether to enable API debugging
+        loop (Optional[asyncio.AbstractEventLoop]): Runs async functions, see _run
     """
     func = getattr(module, func_name)
     try:
         print(f"Running test function {module_name}.{func_name}...")
         response = func(auth=auth)
+
+        response = _run(response, loop)
+
         results[f"{module_name}.{func_name}"] = {
             "status": (
                 response.status_code
@@ -0,0 +1,188 @@
+import json
+import re
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from src._1_models import PostmanRequest
+
+# {{variable}} anywhere, or a :path_variable at the start of a url path segment
+_TEMPLATE_PATTERN = re.compile(r"\{\{([^{}]+?)\}\}|(?:(?<=/)|^):([A-Za-z_]\w*)")
+
+LITERAL = 0
+VARIABLE = 1
+PATH_VARIABLE = 2
+
+Segment = Tuple[int, str, str]
+
+
+@lru_cache(maxsize=65536)
+def compile_template(text: str) -> Tuple[Segment, ...]:
+    """Split a template once into (kind, name, source_text) segments.
+
+    Cached per process, so repeated strings (hosts, common headers) are parsed once.
+    """
+    segments = []
+    position = 0
+
+    for match in _TEMPLATE_PATTERN.finditer(text):
+        if match.start() > position:
+            literal = text[position : match.start()]
+            segments.append((LITERAL, literal, literal))
+
+        if match.group(1) is not None:
+            segments.append((VARIABLE, match.group(1).strip(), match.group(0)))
+        else:
+            segments.append((PATH_VARIABLE, match.group(2), match.group(0)))
+
+        position = match.end()
+
+    if position < len(text):
+        literal = text[position:]
+        segments.append((LITERAL, literal, literal))
+
+    return tuple(segments)
+
+
+def to_variable_value(value: Any) -> str:
+    """The text a value is substituted as: str as is, anything else as JSON.
+
+    Exports and environments can hold numbers, booleans, lists or objects; storing
+    text keeps scopes hashable, so resolve_template can memoize them.
+    """
+    if isinstance(value, str):
+        return value
+
+    return json.dumps(value, ensure_ascii=False)
+
+
+def to_variable_items(
+    variables: Optional[Dict[str, Any]],
+) -> Tuple[Tuple[str, str], ...]:
+    """Sorted (name, text) pairs of a variable dict, usable as a hashable key."""
+    return tuple(
+        sorted(
+            (name, to_variable_value(value))
+            for name, value in (variables or {}).items()
+        )
+    )
+
+
+@dataclass(frozen=True)
+class PostmanVariableScope:
+    """Resolved variable values for a request, flattened by Postman's precedence.
+
+    `{{name}}` lookups use the narrowest definition: overrides > environment >
+    folder > collection. `:name` path variables resolve only from the url's
+    `variable` list. Scopes are immutable and hashable so resolutions can be
+    memoized per scope.
+
+    Attributes:
+        variables (Tuple[Tuple[str, str], ...]): Merged `{{name}}` values
+        path_variables (Tuple[Tuple[str, str], ...]): `:name` values from the url
+    """
+
+    variables: Tuple[Tuple[str, str], ...] = ()
+    path_variables: Tuple[Tuple[str, str], ...] = ()
+
+    _lookup: Dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _path_lookup: Dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _hash: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_lookup", dict(self.variables))
+        object.__setattr__(self, "_path_lookup", dict(self.path_variables))
+        object.__setattr__(self, "_hash", hash((self.variables, self.path_variables)))
+
+    def __hash__(self):
+        return self._hash
+
+    @classmethod
+    def from_layers(
+        cls,
+        collection: Optional[Dict[str, str]] = None,
+        folders: Tuple[Dict[str, str], ...] = (),
+        environment: Optional[Dict[str, str]] = None,
+        overrides: Optional[Dict[str, str]] = None,
+        path_variables: Optional[Dict[str, str]] = None,
+    ) -> "PostmanVariableScope":
+        """Merge layers from broadest to narrowest; later layers win.
+
+        Values that are not str are stored as their JSON text, see to_variable_value.
+        """
+        merged = {}
+
+        for layer in (collection, *folders, environment, overrides):
+            merged.update(layer or {})
+
+        return cls(
+            variables=to_variable_items(merged),
+            path_variables=to_variable_items(path_variables),
+        )
+
+    @classmethod
+    def from_dict(cls, variables: Dict[str, str]) -> "PostmanVariableScope":
+        return cls.from_layers(environment=variables)
+
+    @classmethod
+    def from_request(
+        cls,
+        request: PostmanRequest,
+        environment: Optional[Dict[str, str]] = None,
+        overrides: Optional[Dict[str, str]] = None,
+    ) -> "PostmanVariableScope":
+        """Scope of a request: ancestor variables, the environment and its url path variables.
+
+        Args:
+            request (PostmanRequest): The request being resolved
+            environment (Optional[Dict[str, str]]): Postman environment values
+            overrides (Optional[Dict[str, str]]): Values applied above every other layer
+        """
+
+        def _to_dict(variables) -> Dict[str, str]:
+            return {
+                variable.key: variable.value
+                for variable in variables or []
+                if variable.value is not None
+            }
+
+        # the collection is the first ancestor, nested folders follow
+        ancestor_layers = [
+            _to_dict(getattr(ancestor, "variables", None))
+            for ancestor in request.get_parents()
+        ]
+
+        return cls.from_layers(
+            collection=ancestor_layers[0] if ancestor_layers else None,
+            folders=tuple(ancestor_layers[1:]),
+            environment=environment,
+            overrides=overrides,
+            path_variables=_to_dict(request.url.variable if request.url else None),
+        )
+
+    def get(self, kind: int, name: str) -> Optional[str]:
+        if kind == PATH_VARIABLE:
+            return self._path_lookup.get(name)
+
+        return self._lookup.get(name)
+
+
+@lru_cache(maxsize=65536)
+def resolve_template(text: str, scope: PostmanVariableScope) -> str:
+    """Substitute every known variable of text in one pass; unknown ones are kept as is."""
+    res = []
+
+    for kind, name, source_text in compile_template(text):
+        if kind == LITERAL:
+            res.append(source_text)
+            continue
+
+        value = scope.get(kind, name)
+        res.append(source_text if value is None else value)
+
+    return "".join(res)
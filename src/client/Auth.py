@@ -1,6 +1,11 @@
+import asyncio
+import threading
+import time
+
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 
 
 @dataclass
@@ -8,3 +13,122 @@ class Auth(ABC):
     @abstractmethod
     def get_auth_headers(self) -> Dict[str, str]:
         pass
+
+    def generate_auth_headers(self) -> Dict[str, str]:
+        """Headers sent with each request, called by gd_requests."""
+        return self.get_auth_headers()
+
+    async def generate_auth_headers_async(self) -> Dict[str, str]:
+        """Headers sent with each request, called by gd_requests_async."""
+        return self.generate_auth_headers()
+
+
+@dataclass(kw_only=True)
+class CachedAuth(Auth):
+    """Auth whose headers are fetched once and reused until they expire.
+
+    Subclasses implement get_auth_headers (e.g. an OAuth token request) and may
+    override get_expires_in with the token's own lifetime. Within
+    refresh_ahead_seconds of expiry, callers keep the cached headers while one
+    background thread fetches new ones. Concurrent refreshes, from threads or
+    event loops, share a single fetch.
+
+    Attributes:
+        ttl_seconds (float): Lifetime of fetched headers, unless get_expires_in says otherwise
+        refresh_ahead_seconds (float): Start a background refresh this long before expiry
+    """
+
+    ttl_seconds: float = 300.0
+    refresh_ahead_seconds: float = 30.0
+
+    _headers: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _expires_at: float = field(default=0.0, init=False, repr=False, compare=False)
+    _refresh_future: Optional[Future] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def get_expires_in(self, headers: Dict[str, str]) -> float:
+        """Seconds the just fetched headers stay valid."""
+        return self.ttl_seconds
+
+    @property
+    def is_expired(self) -> bool:
+        return self._headers is None or time.monotonic() >= self._expires_at
+
+    def invalidate(self) -> None:
+        """Drop the cached headers, e.g. after a 401, so the next call fetches new ones."""
+        with self._lock:
+            self._headers = None
+            self._expires_at = 0.0
+
+    def _get_cached_headers(self) -> Optional[Dict[str, str]]:
+        """Valid cached headers, starting a background refresh when they are due."""
+        headers, expires_at = self._headers, self._expires_at
+        now = time.monotonic()
+
+        if headers is None or now >= expires_at:
+            return None
+
+        if now >= expires_at - self.refresh_ahead_seconds:
+            self._get_refresh_future(is_background=True)
+
+        return headers
+
+    def _get_refresh_future(self, is_background: bool) -> Future:
+        """The refresh in progress, or a new one; only one fetch runs at a time."""
+        with self._lock:
+            future = self._refresh_future
+
+            if future is not None:
+                return future
+
+            future = self._refresh_future = Future()
+
+        if is_background:
+            threading.Thread(
+                target=self._run_refresh, args=(future,), daemon=True
+            ).start()
+        else:
+            self._run_refresh(future)
+
+        return future
+
+    def _run_refresh(self, future: Future) -> None:
+        try:
+            headers = self.get_auth_headers()
+            expires_at = time.monotonic() + self.get_expires_in(headers)
+
+        except BaseException as e:
+            # waiters get the error, cached headers stay until they expire
+            with self._lock:
+                self._refresh_future = None
+            future.set_exception(e)
+            return
+
+        with self._lock:
+            self._headers, self._expires_at = headers, expires_at
+            self._refresh_future = None
+
+        future.set_result(headers)
+
+    def generate_auth_headers(self) -> Dict[str, str]:
+        headers = self._get_cached_headers()
+
+        if headers is not None:
+            return headers
+
+        return self._get_refresh_future(is_background=False).result()
+
+    async def generate_auth_headers_async(self) -> Dict[str, str]:
+        headers = self._get_cached_headers()
+
+        if headers is not None:
+            return headers
+
+        # the fetch runs on a thread, the loop keeps serving other tasks meanwhile
+        return await asyncio.wrap_future(self._get_refresh_future(is_background=True))
@@ -0,0 +1,415 @@
+import asyncio
+import re
+import threading
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.client.SessionPool import IDEMPOTENT_METHODS, THROTTLE_STATUS_CODES
+
+# path segments that are ids rather than route names: numbers, uuids, long hex
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{16,})$",
+    re.IGNORECASE,
+)
+
+
+def get_route_template(path: str) -> str:
+    """Path with its id-like segments replaced: "/users/42/posts" -> "/users/:id/posts"."""
+    return "/".join(
+        ":id" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, given in seconds or as an HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket refilled at rate per second, holding up to capacity tokens.
+
+    Tokens can go negative: each caller reserves one and waits until the bucket
+    would have refilled it, so waiting callers are spaced 1 / rate apart. A
+    throttled response forgives those reservations; callers still waiting see
+    n_throttled change and reserve again at the reduced rate.
+
+    Attributes:
+        rate (float): Current tokens per second, adapted by the limiter
+        max_rate (float): Rate the bucket recovers to after throttling
+        capacity (float): Burst size
+        tokens (float): Tokens available at updated_at
+        updated_at (float): time.monotonic() of the last refill
+        blocked_until (float): time.monotonic() before which nothing is sent (Retry-After)
+        decreased_at (Optional[float]): time.monotonic() of the last decrease
+        increased_at (float): time.monotonic() of the last increase
+        n_throttled (int): 429 / 503 responses seen
+    """
+
+    rate: float
+    max_rate: float
+    capacity: float
+    tokens: float = 0.0
+    updated_at: float = field(default_factory=time.monotonic)
+    blocked_until: float = 0.0
+    decreased_at: Optional[float] = None
+    increased_at: float = field(default_factory=time.monotonic)
+    n_throttled: int = 0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    def reserve(self, now: float) -> float:
+        """Take a token; returns the seconds to wait before using it."""
+        self._refill(now)
+
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+        return max(wait, self.blocked_until - now)
+
+    def on_throttled(
+        self,
+        now: float,
+        retry_after: Optional[float],
+        decrease_factor: float,
+        min_rate: float,
+        decrease_cooldown: float,
+    ) -> None:
+        self._refill(now)
+
+        self.n_throttled += 1
+
+        # the other requests of the burst that tripped the limit answer 429 too,
+        # they must not each cut the rate again
+        if self.decreased_at is None or now - self.decreased_at >= decrease_cooldown:
+            self.rate = max(self.rate * decrease_factor, min_rate)
+            self.decreased_at = self.increased_at = now
+
+        # drop the burst, the server just said it was too much
+        self.tokens = 0.0
+
+        if retry_after is not None:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+
+    def on_success(self, now: float, increase_per_second: float) -> None:
+        if self.rate < self.max_rate:
+            self.rate = min(
+                self.rate + (now - self.increased_at) * increase_per_second,
+                self.max_rate,
+            )
+
+        self.increased_at = now
+
+
+@dataclass
+class RateLimiter:
+    """Adaptive token buckets per host and, optionally, per endpoint.
+
+    Every request waits for a token of its host bucket and endpoint bucket
+    (method + host + route). A 429 or 503 cuts the rate of both buckets by
+    decrease_factor, at most once per decrease_cooldown, and blocks them for
+    Retry-After. While responses succeed the rate grows back by
+    increase_per_second, up to the configured rate (AIMD), so throughput settles
+    just under the vendor's limit.
+
+    The route of an endpoint is, in order: the endpoint_key passed with the
+    request, the path of the route_trie match, or the url path with id-like
+    segments replaced (get_route_template), so "/users/1" and "/users/2" share a
+    bucket. At most max_buckets are kept, the least recently used are dropped.
+
+    Throttled GET, HEAD, PUT, DELETE, OPTIONS and TRACE requests are retried.
+    Other methods are only paced: their throttled response is returned, unless
+    is_retry_unsafe_methods says the API makes them safe to resend.
+
+    Attributes:
+        rate_per_host (float): Requests per second per host
+        rate_per_endpoint (Optional[float]): Requests per second per endpoint, no endpoint limit when None
+        burst (Optional[float]): Bucket capacity, defaults to one second worth of requests
+        min_rate (float): Floor of the adapted rate
+        decrease_factor (float): Rate multiplier on a 429 / 503
+        decrease_cooldown (float): Seconds after a decrease in which further 429s do not decrease again
+        increase_per_second (float): Rate added per second of unthrottled responses
+        max_retries (int): Retries of a throttled request before its response is returned
+        max_retry_after (float): Cap on a Retry-After wait, in seconds
+        is_retry_unsafe_methods (bool): Also retry throttled POST and PATCH requests
+        max_buckets (int): Buckets kept before the least recently used are dropped
+        route_trie (Optional[PostmanRouteTrie]): Routes of the API, matched to key
+            endpoint buckets by the Postman request's path
+    """
+
+    rate_per_host: float = 10.0
+    rate_per_endpoint: Optional[float] = None
+    burst: Optional[float] = None
+    min_rate: float = 0.2
+    decrease_factor: float = 0.75
+    decrease_cooldown: float = 1.0
+    increase_per_second: float = 1.0
+    max_retries: int = 3
+    max_retry_after: float = 300.0
+    is_retry_unsafe_methods: bool = False
+    max_buckets: int = 1024
+    route_trie: Optional[Any] = field(default=None, repr=False)
+
+    _buckets: "OrderedDict[str, TokenBucket]" = field(
+        default_factory=OrderedDict, repr=False
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def get_bucket_keys(
+        self, url: str, method: str = "GET", endpoint_key: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """(host key, endpoint key) of a request, see the class docstring for the route."""
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}".lower()
+        method = method.upper()
+
+        if endpoint_key is None and self.route_trie is not None:
+            match = self.route_trie.match(url, method)
+            if match is not None and match.request.url:
+                endpoint_key = "/" + "/".join(match.request.url.path or [])
+
+        if endpoint_key is None:
+            endpoint_key = get_route_template(parts.path)
+
+        return host, f"{method} {host}{endpoint_key}"
+
+    def _get_bucket(self, key: str, rate: float) -> TokenBucket:
+        bucket = self._buckets.get(key)
+
+        if bucket is not None:
+            self._buckets.move_to_end(key)
+            return bucket
+
+        capacity = self.burst or max(rate, 1.0)
+        bucket = self._buckets[key] = TokenBucket(
+            rate=rate, max_rate=rate, capacity=capacity, tokens=capacity
+        )
+
+        while len(self._buckets) > self.max_buckets:
+            self._buckets.popitem(last=False)
+
+        return bucket
+
+    def _get_buckets(
+        self, url: str, method: str, endpoint_key: Optional[str] = None
+    ) -> List[TokenBucket]:
+        host_key, endpoint_key = self.get_bucket_keys(url, method, endpoint_key)
+
+        buckets = [self._get_bucket(host_key, self.rate_per_host)]
+
+        if self.rate_per_endpoint:
+            buckets.append(self._get_bucket(endpoint_key, self.rate_per_endpoint))
+
+        return buckets
+
+    def reserve(
+        self, url: str, method: str = "GET", endpoint_key: Optional[str] = None
+    ) -> Tuple[float, int]:
+        """Take a token from each bucket of the request.
+
+        Returns:
+            Tuple[float, int]: Seconds to wait, and the throttle count the
+                reservation was made under
+        """
+        with self._lock:
+            now = time.monotonic()
+            buckets = self._get_buckets(url, method, endpoint_key)
+
+            return (
+                max(bucket.reserve(now) for bucket in buckets),
+                sum(bucket.n_throttled for bucket in buckets),
+            )
+
+    def _is_throttled_since(
+        self, url: str, method: str, endpoint_key: Optional[str], n_throttled: int
+    ) -> bool:
+        with self._lock:
+            buckets = self._get_buckets(url, method, endpoint_key)
+
+            return sum(bucket.n_throttled for bucket in buckets) != n_throttled
+
+    def acquire(
+        self, url: str, method: str = "GET", endpoint_key: Optional[str] = None
+    ) -> float:
+        """Block until the request may be sent; returns the seconds waited."""
+        waited = 0.0
+
+        while True:
+            wait, n_throttled = self.reserve(url, method, endpoint_key)
+
+            if wait <= 0:
+                return waited
+
+            time.sleep(wait)
+            waited += wait
+
+            # the reservation was made at a rate the server has since refused
+            if not self._is_throttled_since(url, method, endpoint_key, n_throttled):
+                return waited
+
+    async def acquire_async(
+        self, url: str, method: str = "GET", endpoint_key: Optional[str] = None
+    ) -> float:
+        """Wait, without blocking the event loop, until the request may be sent."""
+        waited = 0.0
+
+        while True:
+            wait, n_throttled = self.reserve(url, method, endpoint_key)
+
+            if wait <= 0:
+                return waited
+
+            await asyncio.sleep(wait)
+            waited += wait
+
+            if not self._is_throttled_since(url, method, endpoint_key, n_throttled):
+                return waited
+
+    def is_retryable(self, method: str) -> bool:
+        """A throttled request of method may be sent again."""
+        return self.is_retry_unsafe_methods or method.upper() in IDEMPOTENT_METHODS
+
+    def update(
+        self, url: str, method: str, res: Any, endpoint_key: Optional[str] = None
+    ) -> bool:
+        """Adapt the request's buckets to its response.
+
+        Returns:
+            bool: res was throttled (429 / 503)
+        """
+        is_throttled = res.status_code in THROTTLE_STATUS_CODES
+
+        retry_after = None
+        if is_throttled:
+            retry_after = parse_retry_after(res.headers.get("Retry-After"))
+            if retry_after is not None:
+                retry_after = min(retry_after, self.max_retry_after)
+
+        with self._lock:
+            now = time.monotonic()
+
+            for bucket in self._get_buckets(url, method, endpoint_key):
+                if is_throttled:
+                    bucket.on_throttled(
+                        now,
+                        retry_after,
+                        self.decrease_factor,
+                        self.min_rate,
+                        self.decrease_cooldown,
+                    )
+                else:
+                    bucket.on_success(now, self.increase_per_second)
+
+        return is_throttled
+
+    def request(
+        self,
+        request_fn: Callable[..., Any],
+        method: str,
+        url: str,
+        endpoint_key: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """request_fn(method=, url=, **kwargs) paced by the limiter, retrying throttled responses.
+
+        Args:
+            endpoint_key (Optional[str]): Route of the request, e.g. "/users/:id"
+
+        Returns:
+            Any: The first response that is not throttled, or the last one once
+                max_retries are used up or when method is not retryable
+        """
+        max_retries = self.max_retries if self.is_retryable(method) else 0
+
+        for attempt in range(max_retries + 1):
+            self.acquire(url, method, endpoint_key)
+
+            res = request_fn(method=method, url=url, **kwargs)
+
+            if not self.update(url, method, res, endpoint_key):
+                return res
+
+            # hand a streamed response's connection back before retrying
+            if attempt < max_retries:
+                res.close()
+
+        return res
+
+    async def request_async(
+        self,
+        request_fn: Callable[..., Any],
+        method: str,
+        url: str,
+        endpoint_key: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """Async request, awaiting request_fn(method=, url=, **kwargs)."""
+        max_retries = self.max_retries if self.is_retryable(method) else 0
+
+        for attempt in range(max_retries + 1):
+            await self.acquire_async(url, method, endpoint_key)
+
+            res = await request_fn(method=method, url=url, **kwargs)
+
+            if not self.update(url, method, res, endpoint_key):
+                return res
+
+        return res
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Current rate and throttled count by bucket key."""
+        with self._lock:
+            return {
+                key: {
+                    "rate": round(bucket.rate, 3),
+                    "max_rate": bucket.max_rate,
+                    "n_throttled": bucket.n_throttled,
+                }
+                for key, bucket in self._buckets.items()
+            }
+
+
+_default_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_default_rate_limiter() -> Optional[RateLimiter]:
+    """RateLimiter used by gd_requests and gd_requests_async when none is passed, None by default."""
+    return _default_rate_limiter
+
+
+def set_default_rate_limiter(
+    rate_limiter: Optional[RateLimiter],
+) -> Optional[RateLimiter]:
+    """Pace every gd_requests / gd_requests_async call, None turns it off.
+
+    Returns:
+        Optional[RateLimiter]: The previous default
+    """
+    global _default_rate_limiter
+
+    previous, _default_rate_limiter = _default_rate_limiter, rate_limiter
+
+    return previous
@@ -0,0 +1,467 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from requests.structures import CaseInsensitiveDict
+
+CACHEABLE_METHODS = ("GET", "HEAD")
+
+# bump when CachedResponse changes so older disk entries are ignored
+CACHE_FORMAT = 1
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Directives of a Cache-Control header, lower cased: "max-age=60, private" -> {"max-age": "60", "private": None}."""
+    directives = {}
+
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+
+    return directives
+
+
+def get_max_age(headers: Dict[str, str], default_max_age: float = 0.0) -> float:
+    """Seconds a response stays fresh: Cache-Control max-age, then Expires, less its Age."""
+    directives = parse_cache_control(headers.get("Cache-Control"))
+
+    if "no-cache" in directives:
+        return 0.0
+
+    max_age = default_max_age
+
+    try:
+        if "max-age" in directives:
+            max_age = float(directives["max-age"])
+
+        elif headers.get("Expires"):
+            expires_at = parsedate_to_datetime(headers["Expires"]).timestamp()
+            max_age = expires_at - time.time()
+
+        max_age -= float(headers.get("Age", 0))
+
+    except (TypeError, ValueError):
+        return 0.0
+
+    return max(max_age, 0.0)
+
+
+@dataclass
+class CachedResponse:
+    """A stored response and what is needed to reuse or revalidate it.
+
+    Attributes:
+        status_code (int): HTTP status code
+        headers (CaseInsensitiveDict): Response headers
+        content (bytes): Response body
+        url (str): Url the response came from
+        encoding (Optional[str]): Encoding of the body
+        reason (Optional[str]): Status reason phrase
+        stored_at (float): time.time() of the response or its last revalidation
+        max_age (float): Seconds after stored_at the response stays fresh
+    """
+
+    status_code: int
+    headers: CaseInsensitiveDict
+    content: bytes
+    url: str
+    encoding: Optional[str] = None
+    reason: Optional[str] = None
+    stored_at: float = 0.0
+    max_age: float = 0.0
+
+    @classmethod
+    def from_response(
+        cls, res: requests.Response, default_max_age: float = 0.0
+    ) -> Optional["CachedResponse"]:
+        """The storable form of res, None when it must not be cached."""
+        if res.status_code != 200:
+            return None
+
+        if "no-store" in parse_cache_control(res.headers.get("Cache-Control")):
+            return None
+
+        if res.headers.get("Vary", "").strip() == "*":
+            return None
+
+        max_age = get_max_age(res.headers, default_max_age)
+
+        # without freshness or validators it could never be reused
+        if not max_age and not (
+            res.headers.get("ETag") or res.headers.get("Last-Modified")
+        ):
+            return None
+
+        return cls(
+            status_code=res.status_code,
+            headers=CaseInsensitiveDict(res.headers),
+            content=res.content,
+            url=res.url,
+            encoding=res.encoding,
+            reason=res.reason,
+            stored_at=time.time(),
+            max_age=max_age,
+        )
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.stored_at + self.max_age
+
+    def get_validator_headers(self) -> Dict[str, str]:
+        """Conditional request headers, so an unchanged resource answers 304."""
+        validators = {}
+
+        if self.headers.get("ETag"):
+            validators["If-None-Match"] = self.headers["ETag"]
+
+        if self.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = self.headers["Last-Modified"]
+
+        return validators
+
+    def revalidate(
+        self, res: requests.Response, default_max_age: float = 0.0
+    ) -> "CachedResponse":
+        """Copy refreshed by a 304 answer, whose headers replace the stored ones."""
+        headers = CaseInsensitiveDict(self.headers)
+        headers.update(
+            (key, value)
+            for key, value in res.headers.items()
+            # these describe the empty 304 body, not the stored one
+            if key.lower()
+            not in ("content-length", "content-encoding", "transfer-encoding")
+        )
+
+        return CachedResponse(
+            status_code=self.status_code,
+            headers=headers,
+            content=self.content,
+            url=self.url,
+            encoding=self.encoding,
+            reason=self.reason,
+            stored_at=time.time(),
+            max_age=get_max_age(headers, default_max_age),
+        )
+
+    def to_response(self) -> requests.Response:
+        res = requests.Response()
+
+        res.status_code = self.status_code
+        res.headers = CaseInsensitiveDict(self.headers)
+        res._content = self.content
+        # there is no connection to read from: iter_content serves _content
+        res._content_consumed = True
+        res.url = self.url
+        res.encoding = self.encoding
+        res.reason = self.reason
+
+        return res
+
+
+@dataclass
+class ResponseCache:
+    """HTTP cache of GET and HEAD responses: an LRU in memory over an optional disk tier.
+
+    Fresh responses (Cache-Control max-age or Expires) are answered without a
+    request. Stale ones are revalidated with If-None-Match / If-Modified-Since,
+    and a 304 reuses the stored body. Responses are keyed by method, url, params
+    and, by default, every request header. gd_requests merges the auth headers in
+    before the cache sees them, so whatever header an Auth uses (authorization,
+    x-api-key, ...) keeps one tenant's responses from being served to another.
+
+    Attributes:
+        max_entries (int): Responses kept in memory
+        cache_dir (Optional[str]): Folder of the persistent tier, memory only when None
+        max_bytes (int): Disk tier size above which the least recently used entries are evicted
+        vary_headers (Optional[Tuple[str, ...]]): Request headers that select a
+            different response, None (default) for all of them. A tuple raises the
+            hit rate when requests carry per-call headers (trace ids), and must then
+            name every header that carries credentials
+        default_max_age (float): Freshness of responses that do not declare one
+        n_hits (int): Answered from the cache without a request
+        n_revalidated (int): Answered from the cache after a 304
+        n_misses (int): Answered by the server
+    """
+
+    max_entries: int = 512
+    cache_dir: Optional[str] = None
+    max_bytes: int = 256 << 20
+    vary_headers: Optional[Tuple[str, ...]] = None
+    default_max_age: float = 0.0
+
+    n_hits: int = 0
+    n_revalidated: int = 0
+    n_misses: int = 0
+
+    _entries: "OrderedDict[str, CachedResponse]" = field(
+        default_factory=OrderedDict, repr=False
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _n_writes: int = field(default=0, repr=False)
+
+    def generate_key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        headers = {key.lower(): str(value) for key, value in (headers or {}).items()}
+
+        if self.vary_headers is None:
+            vary = sorted(headers.items())
+        else:
+            vary = [headers.get(name.lower()) for name in self.vary_headers]
+
+        return hashlib.sha256(
+            json.dumps(
+                [
+                    CACHE_FORMAT,
+                    method.upper(),
+                    url,
+                    sorted(
+                        (str(key), str(value))
+                        for key, value in (params or {}).items()
+                        if value is not None
+                    ),
+                    vary,
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Stored response of key, fresh or not; disk hits are promoted to memory."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        if not self.cache_dir:
+            return None
+
+        entry_path = self._get_entry_path(key)
+
+        try:
+            with open(entry_path, "rb") as f:
+                payload = pickle.load(f)
+
+            if payload.get("key") != key:
+                raise ValueError("cache key mismatch")
+
+        except FileNotFoundError:
+            return None
+
+        except Exception:
+            self._remove(entry_path)
+            return None
+
+        # refresh the mtime so eviction treats the entry as recently used
+        os.utime(entry_path)
+
+        self._set_memory(key, payload["entry"])
+
+        return payload["entry"]
+
+    def _set_memory(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        self._set_memory(key, entry)
+
+        if not self.cache_dir:
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {"key": key, "entry": entry}, f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+
+            # atomic, so concurrent readers never see a partial entry
+            os.replace(tmp_path, self._get_entry_path(key))
+
+        except (pickle.PicklingError, OSError):
+            self._remove(tmp_path)
+            return
+
+        with self._lock:
+            self._n_writes += 1
+            is_evict = self._n_writes % 100 == 0
+
+        # scanning the folder on every write would dominate small responses
+        if is_evict:
+            self.evict()
+
+    def request(
+        self,
+        request_fn: Callable[..., requests.Response],
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """request_fn(method, url, headers=, params=, **kwargs), answered from the cache when possible.
+
+        Args:
+            request_fn (Callable[..., requests.Response]): Sends the request, e.g. SessionPool.request
+            method (str): HTTP method, only GET and HEAD are cached
+            url (str): The URL to make the request to
+            headers (Optional[Dict[str, str]]): Request headers
+            params (Optional[Dict[str, Any]]): Query parameters
+            **kwargs: Forwarded to request_fn
+
+        Returns:
+            requests.Response: The cached or the server's response
+        """
+        if method.upper() not in CACHEABLE_METHODS:
+            return request_fn(
+                method=method, url=url, headers=headers, params=params, **kwargs
+            )
+
+        key = self.generate_key(method, url, params, headers)
+        entry = self.get(key)
+
+        if entry is not None and entry.is_fresh:
+            self._count("n_hits")
+            return entry.to_response()
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.get_validator_headers())
+
+        res = request_fn(
+            method=method, url=url, headers=request_headers, params=params, **kwargs
+        )
+
+        if res.status_code == 304 and entry is not None:
+            entry = entry.revalidate(res, self.default_max_age)
+            self.set(key, entry)
+
+            self._count("n_revalidated")
+            return entry.to_response()
+
+        self._count("n_misses")
+
+        entry = CachedResponse.from_response(res, self.default_max_age)
+        if entry is not None:
+            self.set(key, entry)
+
+        return res
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        n_requests = self.n_hits + self.n_revalidated + self.n_misses
+
+        return {
+            "n_hits": self.n_hits,
+            "n_revalidated": self.n_revalidated,
+            "n_misses": self.n_misses,
+            "hit_rate": (
+                (self.n_hits + self.n_revalidated) / n_requests if n_requests else 0.0
+            ),
+            "n_memory_entries": len(self._entries),
+        }
+
+    @staticmethod
+    def _remove(file_path: str) -> None:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+    def evict(self) -> List[str]:
+        """Remove the least recently used disk entries until under max_bytes.
+
+        Returns:
+            List[str]: Paths of the removed entries
+        """
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return []
+
+        entries = sorted(
+            (
+                (entry.path, entry.stat())
+                for entry in os.scandir(self.cache_dir)
+                if entry.is_file() and entry.name.endswith(".pkl")
+            ),
+            key=lambda entry: entry[1].st_mtime,
+        )
+
+        removed = []
+        total_bytes = sum(stat.st_size for _, stat in entries)
+
+        for entry_path, stat in entries:
+            if total_bytes <= self.max_bytes:
+                break
+
+            self._remove(entry_path)
+            total_bytes -= stat.st_size
+            removed.append(entry_path)
+
+        return removed
+
+    def clear(self) -> None:
+        """Drop every entry, in memory and on disk, and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.n_hits = self.n_revalidated = self.n_misses = 0
+
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".pkl"):
+                    self._remove(entry.path)
+
+
+_default_response_cache: Optional[ResponseCache] = None
+
+
+def get_default_response_cache() -> Optional[ResponseCache]:
+    """ResponseCache used by gd_requests when none is passed, None (no caching) by default."""
+    return _default_response_cache
+
+
+def set_default_response_cache(
+    response_cache: Optional[ResponseCache],
+) -> Optional[ResponseCache]:
+    """Turn on caching for every gd_requests call, None turns it off.
+
+    Returns:
+        Optional[ResponseCache]: The previous default
+    """
+    global _default_response_cache
+
+    previous, _default_response_cache = _default_response_cache, response_cache
+
+    return previous
@@ -0,0 +1,176 @@
+import http.cookiejar
+import threading
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) seconds; opt-in, e.g. SessionPool(timeout=DEFAULT_TIMEOUT)
+DEFAULT_TIMEOUT = (5.0, 30.0)
+
+# methods a retry cannot apply twice: GET, HEAD, PUT, DELETE, OPTIONS and TRACE
+IDEMPOTENT_METHODS = Retry.DEFAULT_ALLOWED_METHODS
+
+# left to a RateLimiter, when one paces the requests
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+@dataclass
+class SessionPool:
+    """Keep-alive `requests.Session` per scheme and host, shared across threads.
+
+    Each session mounts an HTTPAdapter whose urllib3 pool keeps up to pool_maxsize
+    connections open, so repeated calls skip the TCP and TLS handshakes.
+
+    Sessions are shared by every caller of a host, whatever its Auth, so they
+    keep no cookies: a Set-Cookie answered to one tenant is never sent for
+    another. Pass cookies per request instead.
+
+    Retries and a default timeout are opt-in, so by default a request behaves as
+    a plain requests.request. With max_retries, requests of retry_methods (the
+    idempotent ones) are retried on connection errors and on status_forcelist
+    responses, with exponential backoff that honours Retry-After; a POST or
+    PATCH is never sent twice. E.g. SessionPool(max_retries=3, timeout=DEFAULT_TIMEOUT).
+
+    Attributes:
+        pool_maxsize (int): Connections kept open per host
+        max_retries (int): Retries per request, 0 (default) disables retrying
+        backoff_factor (float): Sleep backoff_factor * 2 ** (retry - 1) seconds between retries
+        status_forcelist (Tuple[int, ...]): Response codes that are retried
+        retry_methods (FrozenSet[str]): Upper case methods that are retried
+        timeout (Optional[Union[float, Tuple[float, float]]]): Default (connect, read)
+            timeout, None (default) waits as long as requests does
+        is_pool_block (bool): Wait for a free connection instead of opening a
+            throwaway one once pool_maxsize are in use
+    """
+
+    pool_maxsize: int = 20
+    max_retries: int = 0
+    backoff_factor: float = 0.3
+    status_forcelist: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    retry_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    timeout: Optional[Union[float, Tuple[float, float]]] = None
+    is_pool_block: bool = False
+
+    _sessions: Dict[str, requests.Session] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def generate_retry(self, is_retry_throttled: bool = True) -> Retry:
+        status_forcelist = self.status_forcelist
+
+        if not is_retry_throttled:
+            status_forcelist = tuple(
+                code for code in status_forcelist if code not in THROTTLE_STATUS_CODES
+            )
+
+        return Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=status_forcelist,
+            allowed_methods=self.retry_methods,
+            # once retries are exhausted the last response is returned, not raised
+            raise_on_status=False,
+            # urllib3 retries any 413 / 429 / 503 carrying Retry-After when this is set
+            respect_retry_after_header=is_retry_throttled,
+        )
+
+    def generate_session(self, is_retry_throttled: bool = True) -> requests.Session:
+        session = requests.Session()
+
+        # shared across Auth objects, so cookies must not carry over between calls
+        session.cookies.set_policy(
+            http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+        )
+
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.generate_retry(is_retry_throttled),
+            pool_block=self.is_pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
+    def get_session(
+        self, url: str, is_retry_throttled: bool = True
+    ) -> requests.Session:
+        """The session of url's scheme and host, created on first use.
+
+        With is_retry_throttled False, 429 and 503 responses are returned instead of
+        retried, so a RateLimiter sees them.
+        """
+        parts = urlsplit(url)
+        key = f"{parts.scheme}://{parts.netloc}".lower()
+
+        if not is_retry_throttled:
+            key = f"{key} no-throttle-retry"
+
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+
+        with self._lock:
+            if key not in self._sessions:
+                self._sessions[key] = self.generate_session(is_retry_throttled)
+
+            return self._sessions[key]
+
+    def request(
+        self, method: str, url: str, is_retry_throttled: bool = True, **kwargs
+    ) -> requests.Response:
+        """requests.request on the host's pooled session, with the pool's timeout."""
+        kwargs.setdefault("timeout", self.timeout)
+
+        return self.get_session(url, is_retry_throttled).request(
+            method=method, url=url, **kwargs
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+
+        for session in sessions.values():
+            session.close()
+
+    def __enter__(self) -> "SessionPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+_default_session_pool: Optional[SessionPool] = None
+_default_lock = threading.Lock()
+
+
+def get_default_session_pool() -> SessionPool:
+    """Process wide SessionPool used by gd_requests when none is passed."""
+    global _default_session_pool
+
+    if _default_session_pool is None:
+        with _default_lock:
+            if _default_session_pool is None:
+                _default_session_pool = SessionPool()
+
+    return _default_session_pool
+
+
+def set_default_session_pool(session_pool: SessionPool) -> Optional[SessionPool]:
+    """Replace the default pool, e.g. to turn on retries or a default timeout.
+
+    Returns:
+        Optional[SessionPool]: The previous pool, left open for the caller to close
+    """
+    global _default_session_pool
+
+    with _default_lock:
+        previous, _default_session_pool = _default_session_pool, session_pool
+
+    return previous
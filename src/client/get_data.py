@@ -1,7 +1,97 @@
+import asyncio
+import contextlib
+import functools
+import json
+import os
+import tempfile
+import weakref
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 import requests
-from typing import Optional, Dict, Any, Union
+from requests.structures import CaseInsensitiveDict
+from dataclasses import dataclass
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import src.utils.json_stream as pmjs
 
 from src.client.Auth import Auth
+from src.client.RateLimiter import (
+    RateLimiter,
+    get_default_rate_limiter,
+    parse_retry_after,
+)
+from src.client.ResponseCache import ResponseCache, get_default_response_cache
+from src.client.SessionPool import (
+    THROTTLE_STATUS_CODES,
+    SessionPool,
+    get_default_session_pool,
+)
+
+# shared by every gd_requests_async call on one event loop
+ASYNC_MAX_CONNECTIONS = 100
+ASYNC_MAX_CONCURRENCY = 100
+ASYNC_TIMEOUT = 30.0
+
+
+class ApiResponseError(ValueError):
+    """Error response of a generated endpoint function.
+
+    A ValueError, so existing `except ValueError` handlers keep working.
+
+    Attributes:
+        status_code (int): HTTP status code
+        text (str): Response body
+        response (Any): The requests.Response or AsyncResponse
+    """
+
+    def __init__(self, status_code: int, text: str, response: Any = None):
+        super().__init__(f"Error {status_code}: {text}")
+        self.status_code = status_code
+        self.text = text
+        self.response = response
+
+    @classmethod
+    def from_response(cls, res: Any) -> "ApiResponseError":
+        """RateLimitedError for 429 / 503 responses, ApiResponseError otherwise."""
+        if res.status_code in THROTTLE_STATUS_CODES:
+            return RateLimitedError(
+                res.status_code,
+                res.text,
+                response=res,
+                retry_after=parse_retry_after(res.headers.get("Retry-After")),
+            )
+
+        return cls(res.status_code, res.text, response=res)
+
+
+class RateLimitedError(ApiResponseError):
+    """The server still throttled the request after the limiter's retries.
+
+    Attributes:
+        retry_after (Optional[float]): Seconds the server asked to wait, when it said
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        text: str,
+        response: Any = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(status_code, text, response=response)
+        self.retry_after = retry_after
 
 
 def gd_requests(
@@ -12,9 +102,24 @@ def gd_requests(
     params: Optional[Dict[str, str]] = None,
     body: Optional[Union[str, Dict[str, Any]]] = None,
     debug_api: bool = False,
+    session_pool: Optional[SessionPool] = None,
+    timeout: Optional[Union[float, Tuple[float, float]]] = None,
+    response_cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    stream: bool = False,
+    endpoint_key: Optional[str] = None,
 ) -> requests.Response:
     """Wrapper around requests.request that handles authentication and common parameters.
 
+    Requests go through a pooled keep-alive session of the url's host; retries and a
+    default timeout apply only when the SessionPool turns them on.
+    GET and HEAD responses are cached when a response_cache is passed or set as
+    the default with set_default_response_cache. Likewise a rate_limiter paces the
+    requests that reach the network and retries throttled (429 / 503) ones.
+
+    With stream the body is left unread for iter_response_chunks, download_response
+    or iter_response_records, and the cache is bypassed.
+
     Args:
         method (str): HTTP method (GET, POST, etc.)
         url (str): The URL to make the request to
@@ -22,13 +127,20 @@ def gd_requests(
         headers (Optional[Dict[str, str]]): Request headers
         params (Optional[Dict[str, str]]): Query parameters
         body (Optional[Union[str, Dict[str, Any]]]): Request body
+        session_pool (Optional[SessionPool]): Defaults to get_default_session_pool()
+        timeout (Optional[Union[float, Tuple[float, float]]]): Defaults to the pool's timeout
+        response_cache (Optional[ResponseCache]): Defaults to get_default_response_cache()
+        rate_limiter (Optional[RateLimiter]): Defaults to get_default_rate_limiter()
+        stream (bool): Return before downloading the body
+        endpoint_key (Optional[str]): Route of the url ("/users/:id") for the
+            rate_limiter's endpoint bucket
 
     Returns:
         requests.Response: The response from the request
     """
     # Merge auth headers with provided headers
 
-    headers = {**headers, **auth.generate_auth_headers()}
+    headers = {**(headers or {}), **auth.generate_auth_headers()}
     # Prepare request data
     data = body if isinstance(body, str) else None
     json_data = body if isinstance(body, dict) else None
@@ -40,7 +152,462 @@ def gd_requests(
         print(f"Data: {data}")
         print(f"JSON: {json_data}")
 
-    return requests.request(
+    session_pool = session_pool or get_default_session_pool()
+    response_cache = response_cache or get_default_response_cache()
+    rate_limiter = rate_limiter or get_default_rate_limiter()
+
+    request_fn = session_pool.request
+
+    if rate_limiter is not None:
+        # throttled responses go back to the limiter rather than urllib3's retry
+        request_fn = functools.partial(
+            rate_limiter.request,
+            functools.partial(session_pool.request, is_retry_throttled=False),
+            endpoint_key=endpoint_key,
+        )
+
+    # cache hits never reach the limiter; a streamed body is never stored
+    if response_cache is not None and not stream:
+        request_fn = functools.partial(response_cache.request, request_fn)
+
+    return request_fn(
+        method=method,
+        url=url,
+        headers=headers,
+        params=params,
+        data=data,
+        json=json_data,
+        timeout=timeout or session_pool.timeout,
+        stream=stream,
+    )
+
+
+STREAM_MODES = ["chunks", "records"]
+
+
+def iter_response_chunks(
+    res: requests.Response, chunk_size: int = 1 << 16
+) -> Iterator[bytes]:
+    """Body of a streamed response in chunks; the connection is released at the end."""
+    try:
+        yield from res.iter_content(chunk_size=chunk_size)
+
+    finally:
+        res.close()
+
+
+def download_response(
+    res: requests.Response, file_path: str, chunk_size: int = 1 << 20
+) -> str:
+    """Write a streamed response body to file_path, one chunk in memory at a time.
+
+    The body goes to a temporary file next to file_path first, so an interrupted
+    download never leaves a truncated file_path.
+
+    Returns:
+        str: file_path
+    """
+    folder = os.path.dirname(file_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=folder or ".", suffix=".part")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in iter_response_chunks(res, chunk_size):
+                f.write(chunk)
+
+        os.replace(tmp_path, file_path)
+
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return file_path
+
+
+def iter_response_records(
+    res: requests.Response,
+    path: Sequence[Union[str, int]] = (),
+    chunk_size: int = 1 << 16,
+) -> Iterator[Any]:
+    """Decode the elements of a JSON array body one at a time, as they arrive.
+
+    Args:
+        res (requests.Response): Response sent with stream=True
+        path (Sequence[Union[str, int]]): Keys leading to the array, e.g. ("values",)
+            for a paginated {"values": [...]} body; empty for a top level array
+        chunk_size (int): Bytes read per chunk
+
+    Yields:
+        Any: Each decoded element
+    """
+    reader = pmjs.JsonStreamReader.from_chunks(
+        iter_response_chunks(res, chunk_size),
+        encoding=res.encoding or "utf-8",
+        chunk_size=chunk_size,
+    )
+
+    yield from pmjs.iter_json_records(reader, path)
+
+
+def stream_response(
+    res: requests.Response,
+    stream: Optional[str] = None,
+    file_path: Optional[str] = None,
+    records_path: Sequence[Union[str, int]] = (),
+) -> Any:
+    """Return value of a generated function exported with config["is_stream"].
+
+    Args:
+        res (requests.Response): Successful response, sent with stream=True when
+            stream or file_path is set
+        stream (Optional[str]): "chunks" for an iterator of bytes, "records" for an
+            iterator of the body's JSON array elements
+        file_path (Optional[str]): Download the body to this path instead
+        records_path (Sequence[Union[str, int]]): Keys leading to the array, with "records"
+
+    Returns:
+        Any: file_path, an iterator, or res with its body read when neither is asked
+    """
+    if file_path:
+        return download_response(res, file_path)
+
+    if stream == "chunks":
+        return iter_response_chunks(res)
+
+    if stream == "records":
+        return iter_response_records(res, records_path)
+
+    if stream:
+        res.close()
+        raise ValueError(
+            f"Unknown stream mode '{stream}', expected one of {STREAM_MODES}"
+        )
+
+    # reading the body makes it behave like a non streamed response
+    res.content
+    return res
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one item of gd_requests_many.
+
+    Attributes:
+        index (int): Position of the item in the input
+        item (Any): The request spec or (function, kwargs) pair
+        response (Any): Response, or the function's return value
+        error (Optional[BaseException]): Exception raised by the item, or the
+            ApiResponseError of an unsuccessful response to a request spec
+    """
+
+    index: int
+    item: Any
+    response: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+
+def _run_batch_item(
+    index: int,
+    item: Any,
+    auth: Optional[Auth],
+    session_pool: SessionPool,
+) -> BatchResult:
+    result = BatchResult(index=index, item=item)
+
+    try:
+        if isinstance(item, dict):
+            spec = {"auth": auth, "session_pool": session_pool, **item}
+            result.response = gd_requests(**spec)
+
+            if not result.response.ok:
+                result.error = ApiResponseError.from_response(result.response)
+
+        else:
+            fn, kwargs = item
+            if auth is not None and "auth" not in kwargs:
+                kwargs = {"auth": auth, **kwargs}
+
+            result.response = fn(**kwargs)
+
+    except Exception as e:
+        result.error = e
+
+    return result
+
+
+def gd_requests_many(
+    items: Iterable[Union[Dict[str, Any], Tuple[Callable, Dict[str, Any]]]],
+    auth: Optional[Auth] = None,
+    max_workers: int = 16,
+    max_in_flight: Optional[int] = None,
+    is_ordered: bool = True,
+    session_pool: Optional[SessionPool] = None,
+) -> Iterator[BatchResult]:
+    """Run many requests over a thread pool, yielding one BatchResult per item.
+
+    Items are drawn from items only as slots free up, so at most max_in_flight are
+    submitted or waiting to be yielded at once; a generator of millions of items
+    runs in flat memory. Errors are captured per item and never stop the batch.
+
+    Args:
+        items (Iterable[Union[Dict[str, Any], Tuple[Callable, Dict[str, Any]]]]): Each
+            either keyword arguments of gd_requests ({"method": "get", "url": ...}) or
+            a (generated function, kwargs) pair
+        auth (Optional[Auth]): Passed to every item that does not set its own
+        max_workers (int): Threads sending requests; keep within the session
+            pool's pool_maxsize so every thread reuses a connection
+        max_in_flight (Optional[int]): Items submitted but not yet yielded,
+            defaults to 2 * max_workers
+        is_ordered (bool): Yield in input order; otherwise as each item completes
+        session_pool (Optional[SessionPool]): Shared by request specs, defaults
+            to get_default_session_pool()
+
+    Yields:
+        BatchResult: One per item
+    """
+    session_pool = session_pool or get_default_session_pool()
+    max_in_flight = max(max_in_flight or 2 * max_workers, 1)
+
+    items = iter(enumerate(items))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = deque() if is_ordered else set()
+
+    def _submit() -> bool:
+        next_item = next(items, None)
+
+        if next_item is None:
+            return False
+
+        index, item = next_item
+        future = executor.submit(_run_batch_item, index, item, auth, session_pool)
+
+        if is_ordered:
+            pending.append(future)
+        else:
+            pending.add(future)
+
+        return True
+
+    try:
+        while len(pending) < max_in_flight and _submit():
+            pass
+
+        while pending:
+            if is_ordered:
+                # a slow head holds back later results, bounded by max_in_flight
+                done = [pending.popleft()]
+
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                pending.difference_update(done)
+
+            for future in done:
+                _submit()
+                yield future.result()
+
+    finally:
+        # a consumer that stops early does not wait for items never yielded
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass
+class AsyncResponse:
+    """Fully read response of gd_requests_async, mirroring requests.Response.
+
+    Attributes:
+        status_code (int): HTTP status code
+        headers (CaseInsensitiveDict): Response headers
+        content (bytes): Response body
+        url (str): Final url of the request
+        encoding (Optional[str]): Charset of the body, utf-8 when not declared
+    """
+
+    status_code: int
+    headers: CaseInsensitiveDict
+    content: bytes
+    url: str
+    encoding: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+@dataclass
+class AsyncTransport:
+    """Connection pool and concurrency limit shared by the calls of one event loop.
+
+    Attributes:
+        session (aiohttp.ClientSession): Pooled session, keeps connections alive between calls
+        semaphore (asyncio.Semaphore): Bounds the requests in flight
+        closer (Any): Async generator that closes session when the loop shuts down
+    """
+
+    session: Any
+    semaphore: asyncio.Semaphore
+    closer: Any = None
+
+
+# AsyncTransport by event loop, a ClientSession is bound to the loop it was created on
+_async_transports = weakref.WeakKeyDictionary()
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+
+    except ImportError as e:
+        raise ImportError(
+            "gd_requests_async requires aiohttp, install it with `pip install aiohttp`."
+        ) from e
+
+    return aiohttp
+
+
+async def _close_on_loop_shutdown(session: Any):
+    try:
+        yield
+
+    finally:
+        await session.close()
+
+
+def get_async_transport() -> AsyncTransport:
+    """The running loop's AsyncTransport, created on first use.
+
+    Sized by ASYNC_MAX_CONNECTIONS, ASYNC_MAX_CONCURRENCY and ASYNC_TIMEOUT as they
+    are when the loop makes its first call. The session is closed by
+    close_async_transport, or else when the loop shuts down its async generators
+    (asyncio.run does), so no connection outlives its loop.
+    """
+    loop = asyncio.get_running_loop()
+
+    transport = _async_transports.get(loop)
+    if transport is not None and not transport.session.closed:
+        return transport
+
+    aiohttp = _import_aiohttp()
+
+    transport = AsyncTransport(
+        session=aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=ASYNC_MAX_CONNECTIONS),
+            timeout=aiohttp.ClientTimeout(total=ASYNC_TIMEOUT),
+        ),
+        semaphore=asyncio.Semaphore(ASYNC_MAX_CONCURRENCY),
+    )
+
+    # starting the generator registers it with the loop, whose shutdown_asyncgens
+    # then runs its finally; the transport holds the only strong reference
+    transport.closer = _close_on_loop_shutdown(transport.session)
+    try:
+        transport.closer.asend(None).send(None)
+    except StopIteration:
+        pass
+
+    _async_transports[loop] = transport
+
+    return transport
+
+
+async def close_async_transport() -> None:
+    """Close the running loop's connection pool now, instead of at loop shutdown."""
+    transport = _async_transports.pop(asyncio.get_running_loop(), None)
+
+    if transport is not None:
+        await transport.closer.aclose()
+
+
+@contextlib.asynccontextmanager
+async def async_transport():
+    """Scope the running loop's connection pool: `async with async_transport(): ...`.
+
+    Yields:
+        AsyncTransport: The pool gd_requests_async uses inside the block, closed on exit
+    """
+    try:
+        yield get_async_transport()
+
+    finally:
+        await close_async_transport()
+
+
+async def gd_requests_async(
+    auth: Auth,
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, str]] = None,
+    body: Optional[Union[str, Dict[str, Any]]] = None,
+    debug_api: bool = False,
+    rate_limiter: Optional[RateLimiter] = None,
+    endpoint_key: Optional[str] = None,
+) -> AsyncResponse:
+    """Async counterpart of gd_requests on a pooled aiohttp.ClientSession.
+
+    At most ASYNC_MAX_CONCURRENCY calls of one event loop are in flight at once, the
+    others wait for a slot instead of opening more connections.
+
+    Args:
+        method (str): HTTP method (GET, POST, etc.)
+        url (str): The URL to make the request to
+        auth (Auth): Generates the authentication headers
+        headers (Optional[Dict[str, str]]): Request headers
+        params (Optional[Dict[str, str]]): Query parameters
+        body (Optional[Union[str, Dict[str, Any]]]): Request body
+        rate_limiter (Optional[RateLimiter]): Defaults to get_default_rate_limiter()
+        endpoint_key (Optional[str]): Route of the url for the rate_limiter's endpoint bucket
+
+    Returns:
+        AsyncResponse: The response, with its body already read
+    """
+    headers = {**(headers or {}), **await auth.generate_auth_headers_async()}
+
+    data = body if isinstance(body, str) else None
+    json_data = body if isinstance(body, dict) else None
+
+    if debug_api:
+        print(f"🚀 Making async {method} request to {url}")
+        print(f"Headers: {headers}")
+        print(f"Params: {params}")
+        print(f"Data: {data}")
+        print(f"JSON: {json_data}")
+
+    if params:
+        # requests leaves out None values, aiohttp rejects them
+        params = {key: value for key, value in params.items() if value is not None}
+
+    rate_limiter = rate_limiter or get_default_rate_limiter()
+
+    if rate_limiter is not None:
+        # waits for a token before taking one of the transport's slots
+        return await rate_limiter.request_async(
+            _send_async,
+            method=method,
+            url=url,
+            endpoint_key=endpoint_key,
+            headers=headers,
+            params=params,
+            data=data,
+            json=json_data,
+        )
+
+    return await _send_async(
         method=method,
         url=url,
         headers=headers,
@@ -50,6 +617,22 @@ def gd_requests(
     )
 
 
+async def _send_async(method: str, url: str, **kwargs) -> AsyncResponse:
+    transport = get_async_transport()
+
+    async with transport.semaphore:
+        async with transport.session.request(
+            method=method.upper(), url=url, **kwargs
+        ) as res:
+            return AsyncResponse(
+                status_code=res.status,
+                headers=CaseInsensitiveDict(res.headers),
+                content=await res.read(),
+                url=str(res.url),
+                encoding=res.charset,
+            )
+
+
 def normalize_json_to_python(json_str: str) -> str:
     """Convert JSON-style boolean and null values to Python syntax (True, False, None).
 
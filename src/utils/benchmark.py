@@ -0,0 +1,1249 @@
+import gc
+import json
+import threading
+import time
+import tracemalloc
+
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List
+
+
+def build_synthetic_collection(
+    n_folders: int = 50,
+    n_requests_per_folder: int = 100,
+    n_responses: int = 1,
+) -> Dict[str, Any]:
+    """Build a Postman v2.1 collection dict shaped like a large vendor export.
+
+    Args:
+        n_folders (int): Number of top level folders
+        n_requests_per_folder (int): Requests in each folder
+        n_responses (int): Example responses stored on each request
+
+    Returns:
+        Dict[str, Any]: Collection data, as `json.load` would return it
+    """
+
+    methods = ["GET", "POST", "PUT", "DELETE"]
+
+    def _request(folder_name: str, index: int) -> Dict[str, Any]:
+        path = ["rest", "api", "3", folder_name, f"resource{index}", ":id"]
+
+        return {
+            "name": f"{folder_name} resource {index}",
+            "request": {
+                "method": methods[index % len(methods)],
+                "header": [
+                    {"key": "Accept", "value": "application/json"},
+                    {"key": "Content-Type", "value": "application/json"},
+                ],
+                "url": {
+                    "raw": "{{baseUrl}}/" + "/".join(path) + "?expand=<string>",
+                    "host": ["{{baseUrl}}"],
+                    "path": path,
+                    "query": [
+                        {
+                            "key": "expand",
+                            "value": "<string>",
+                            "description": "Fields to expand.",
+                        },
+                        {"key": "maxResults", "value": "<integer>", "disabled": True},
+                    ],
+                    "variable": [{"key": "id", "value": "<string>"}],
+                },
+                "description": f"Returns resource {index}. Requires read access. ",
+            },
+            "response": [
+                {
+                    "name": "OK",
+                    "code": 200,
+                    "status": "OK",
+                    "header": [{"key": "Content-Type", "value": "application/json"}],
+                    "body": '{"id": "10000", "self": "https://example.com"}',
+                }
+                for _ in range(n_responses)
+            ],
+        }
+
+    return {
+        "info": {
+            "_postman_id": "00000000-0000-0000-0000-000000000000",
+            "name": "Synthetic Collection",
+            "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json",
+            "_exporter_id": "0",
+            "_collection_link": "",
+        },
+        "item": [
+            {
+                "name": f"folder{folder_index}",
+                "item": [
+                    _request(f"folder{folder_index}", index)
+                    for index in range(n_requests_per_folder)
+                ],
+            }
+            for folder_index in range(n_folders)
+        ],
+        "variable": [{"key": "baseUrl", "value": "https://example.com"}],
+    }
+
+
+def measure(fn: Callable, *args, **kwargs) -> Dict[str, Any]:
+    """Run fn once, returning its result with elapsed seconds and traced memory.
+
+    `retained_mb` is memory still allocated after the call (what the result keeps
+    alive), `peak_mb` is the high-water mark during the call.
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "result": result,
+        "seconds": round(elapsed, 4),
+        "retained_mb": round(retained / 1e6, 2),
+        "peak_mb": round(peak / 1e6, 2),
+    }
+
+
+class _DictBackedModel:
+    """Stand-in for the models before they were slotted: fields live in a __dict__."""
+
+
+# one class per model, so instances share their __dict__ keys as the models did
+_dict_backed_classes: Dict[str, type] = {}
+
+
+# private fields the models had before slots; the others cache derived state
+_DICT_BACKED_PRIVATE_FIELDS = {"_raw", "_exporter_id", "_collection_link"}
+
+
+def _build_dict_backed(model, parent=None) -> _DictBackedModel:
+    """Copy a parsed tree into dict-backed objects shaped like the pre-slots models.
+
+    As before, requests keep a shallow copy of their source dict and header keys
+    are lower cased without interning.
+    """
+    import dataclasses
+
+    from src._1_models import PostmanBase, PostmanFolder, PostmanRequest_Header
+
+    def _copy(value, mirror):
+        if isinstance(value, PostmanBase):
+            return _build_dict_backed(value, mirror)
+
+        if isinstance(value, list) and any(isinstance(v, PostmanBase) for v in value):
+            return [_copy(item, mirror) for item in value]
+
+        return value
+
+    model_name = type(model).__name__
+    if model_name not in _dict_backed_classes:
+        _dict_backed_classes[model_name] = type(model_name, (_DictBackedModel,), {})
+
+    mirror = _dict_backed_classes[model_name]()
+    mirror._raw = None
+    mirror.parent = parent
+
+    for model_field in dataclasses.fields(model):
+        name = model_field.name
+        if name == "parent" or (
+            name.startswith("_") and name not in _DICT_BACKED_PRIVATE_FIELDS
+        ):
+            continue
+
+        setattr(mirror, name, _copy(getattr(model, name), mirror))
+
+    if isinstance(model, PostmanFolder):
+        mirror.items = _copy(model.items, mirror)
+
+    elif isinstance(model, PostmanRequest_Header):
+        mirror.key = model.key.lower()
+
+    if model_name == "PostmanRequest" and model._raw is not None:
+        mirror._raw = {**model._raw}
+
+    return mirror
+
+
+def benchmark_model_memory(
+    n_folders: int = 50, n_requests_per_folder: int = 100, debug_prn: bool = True
+) -> List[Dict[str, Any]]:
+    """Compare retained memory of the parsed models with and without `_raw` payloads.
+
+    `keep_raw=True` is the original behaviour: every model references its source
+    dict, so the whole JSON tree stays alive next to the models. The "dict-backed"
+    run copies the parsed tree into objects shaped like the models before they were
+    slotted, as a baseline for retained memory; its seconds include the copy.
+    """
+    import json
+
+    from src._1_models import PostmanCollection
+
+    text = json.dumps(build_synthetic_collection(n_folders, n_requests_per_folder))
+
+    def _load_dict_backed():
+        return _build_dict_backed(
+            PostmanCollection.from_dict(json.loads(text), keep_raw=True)
+        )
+
+    def _count_requests(mirror) -> int:
+        if not hasattr(mirror, "items"):
+            return 1
+
+        return sum(_count_requests(item) for item in mirror.items or [])
+
+    results = []
+    for models, keep_raw in [
+        ("dict-backed", True),
+        ("slotted", True),
+        ("slotted", False),
+    ]:
+        if models == "dict-backed":
+            run = measure(_load_dict_backed)
+        else:
+            # decode inside the measured call, as from_file does, so the source
+            # tree is only counted when `_raw` keeps it alive
+            run = measure(
+                lambda: PostmanCollection.from_dict(json.loads(text), keep_raw=keep_raw)
+            )
+        collection = run.pop("result")
+
+        run.update(
+            {
+                "models": models,
+                "keep_raw": keep_raw,
+                "n_requests": _count_requests(collection),
+            }
+        )
+        results.append(run)
+
+        del collection
+
+    if debug_prn:
+        for run in results:
+            print(run)
+
+    return results
+
+
+def benchmark_lazy_load(
+    n_folders: int = 50, n_requests_per_folder: int = 100, debug_prn: bool = True
+) -> List[Dict[str, Any]]:
+    """Compare eager and lazy loading when only one folder is converted.
+
+    Each run loads the collection, picks the first subfolder and lists its requests.
+    """
+    from src._1_models import PostmanCollection
+
+    data = build_synthetic_collection(n_folders, n_requests_per_folder)
+
+    def _open_one_folder(lazy: bool):
+        collection = PostmanCollection.from_dict(data, lazy=lazy)
+        return collection.get_subfolders()[0].get_folder_requests()
+
+    results = []
+    for lazy in [False, True]:
+        run = measure(_open_one_folder, lazy=lazy)
+        run.update({"lazy": lazy, "n_requests": len(run.pop("result"))})
+        results.append(run)
+
+    if debug_prn:
+        for run in results:
+            print(run)
+
+    return results
+
+
+def benchmark_json_backends(
+    n_folders: int = 50,
+    n_requests_per_folder: int = 100,
+    n_runs: int = 3,
+    debug_prn: bool = True,
+) -> List[Dict[str, Any]]:
+    """Time decoding a collection export with each installed JSON backend.
+
+    The "json (text mode)" row is the original `json.load` over a text file handle.
+    Seconds are the best of n_runs untraced runs; peak memory comes from one traced run.
+    """
+    import json
+    import os
+    import tempfile
+
+    import src.utils.json_backend as pmjb
+
+    data = build_synthetic_collection(n_folders, n_requests_per_folder)
+
+    fd, file_path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    def _load_text_mode():
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    runs = [("json (text mode)", _load_text_mode)] + [
+        (name, lambda name=name: pmjb.read_json_file(file_path, backend=name))
+        for name in pmjb.JSON_BACKENDS
+    ]
+
+    results = []
+    try:
+        for name, load_fn in runs:
+            seconds = []
+            for _ in range(n_runs):
+                start = time.perf_counter()
+                load_fn()
+                seconds.append(time.perf_counter() - start)
+
+            results.append(
+                {
+                    "backend": name,
+                    "file_mb": round(os.path.getsize(file_path) / 1e6, 2),
+                    "seconds": round(min(seconds), 4),
+                    "peak_mb": measure(load_fn)["peak_mb"],
+                }
+            )
+    finally:
+        os.remove(file_path)
+
+    if debug_prn:
+        for run in results:
+            print(run)
+
+    return results
+
+
+def benchmark_route_matching(
+    n_folders: int = 50,
+    n_requests_per_folder: int = 100,
+    n_urls: int = 10_000,
+    debug_prn: bool = True,
+) -> List[Dict[str, Any]]:
+    """Compare attributing concrete urls with the route trie and a linear regex scan.
+
+    The regex scan compiles one pattern per request and tries them in order, as a
+    log parser without an index would.
+    """
+    import random
+    import re
+
+    from src._1_models import PostmanCollection
+    from src._1_routes import PostmanRouteTrie, get_segment_variable
+
+    collection = PostmanCollection.from_dict(
+        build_synthetic_collection(n_folders, n_requests_per_folder), keep_raw=False
+    )
+    requests = collection.get_folder_requests()
+
+    rng = random.Random(0)
+    urls = []
+    for request in rng.choices(requests, k=n_urls):
+        segments = [
+            str(rng.randint(1, 99999)) if get_segment_variable(segment) else segment
+            for segment in request.url.path
+        ]
+        urls.append((request.method, "https://example.com/" + "/".join(segments)))
+
+    def _match_trie():
+        trie = PostmanRouteTrie.from_requests(requests)
+        return sum(trie.match(url, method) is not None for method, url in urls)
+
+    def _match_regex():
+        patterns = [
+            (
+                request.method,
+                re.compile(
+                    "^/"
+                    + "/".join(
+                        "[^/]+" if get_segment_variable(segment) else re.escape(segment)
+                        for segment in request.url.path
+                    )
+                    + "/?$"
+                ),
+            )
+            for request in requests
+        ]
+
+        n_matched = 0
+        for method, url in urls:
+            path = "/" + url.split("://", 1)[1].split("/", 1)[1]
+            n_matched += any(
+                method == route_method and pattern.match(path)
+                for route_method, pattern in patterns
+            )
+        return n_matched
+
+    results = []
+    for name, match_fn in [("trie", _match_trie), ("regex scan", _match_regex)]:
+        start = time.perf_counter()
+        n_matched = match_fn()
+        seconds = time.perf_counter() - start
+
+        results.append(
+            {
+                "matcher": name,
+                "n_routes": len(requests),
+                "n_urls": n_urls,
+                "n_matched": n_matched,
+                "seconds": round(seconds, 4),
+                "urls_per_second": round(n_urls / seconds),
+            }
+        )
+
+    if debug_prn:
+        for run in results:
+            print(run)
+
+    return results
+
+
+def benchmark_collection_conversion(
+    n_folders: int = 50,
+    n_requests_per_folder: int = 200,
+    n_jobs_options: List[int] = None,
+    debug_prn: bool = True,
+) -> List[Dict[str, Any]]:
+    """Compare PostmanCollectionConverter throughput for several pool sizes.
+
+    Requests are only rendered (nothing is written) so disk speed does not skew
+    the comparison.
+    """
+    import os
+
+    from src._1_models import PostmanCollection
+    from src._2_converter import PostmanCollectionConverter
+
+    collection = PostmanCollection.from_dict(
+        build_synthetic_collection(n_folders, n_requests_per_folder), keep_raw=False
+    )
+    config = {"drop_n_from_path_head": 3, "base_url_variable": "baseUrl"}
+
+    results = []
+    for n_jobs in n_jobs_options or sorted({1, 2, os.cpu_count() or 1}):
+        converter = PostmanCollectionConverter(collection=collection, config=config)
+        converter.convert(export_base_folder=None, n_jobs=n_jobs)
+
+        results.append(
+            {
+                "n_jobs": n_jobs,
+                "n_requests": len(converter.results),
+                "n_errors": len(converter.errors),
+                "seconds": round(converter.seconds, 4),
+                "requests_per_second": round(converter.requests_per_second),
+            }
+        )
+
+    if debug_prn:
+        for run in results:
+            print(run)
+
+    return results
+
+
+def benchmark_render_request_code(
+    n_folders: int = 50,
+    n_requests_per_folder: int = 200,
+    debug_prn: bool = True,
+) -> Dict[str, Any]:
+    """Time rendering every request of a large collection, in microseconds per request.
+
+    `render_us` covers the template rendering only, `total_us` the whole
+    generate_request_code (names, params, url and rendering).
+    """
+    from src._1_models import PostmanCollection
+    from src._2_converter import PostmanRequestConverter
+    import src._2_templates as pmtp
+
+    collection = PostmanCollection.from_dict(
+        build_synthetic_collection(n_folders, n_requests_per_folder), keep_raw=False
+    )
+    requests = collection.get_folder_requests()
+    config = {
+        "drop_n_from_path_head": 3,
+        "base_url_variable": "baseUrl",
+        "signature_params": ["expand"],
+    }
+
+    start = time.perf_counter()
+    converters = [
+        PostmanRequestConverter.from_postman_request(request, config=config)
+        for request in requests
+    ]
+    total_seconds = time.perf_counter() - start
+
+    render_kwargs = [
+        {
+            "function_name": converter.function_name,
+            "breadcrumb": " > ".join(converter.request.get_breadcrumb()),
+            "signature_lines": [
+                param.generate_signature_part() for param in converter._params_signature
+            ],
+            "description_lines": [converter.description],
+            "url": converter.url,
+            "headers": converter.headers,
+            "method": converter.request.method.lower(),
+            "params": converter._params_body,
+        }
+        for converter in converters
+    ]
+
+    start = time.perf_counter()
+    for kwargs in render_kwargs:
+        pmtp.render_request_code(**kwargs)
+    render_seconds = time.perf_counter() - start
+
+    res = {
+        "n_requests": len(requests),
+        "total_us": round(total_seconds / len(requests) * 1e6, 1),
+        "render_us": round(render_seconds / len(requests) * 1e6, 1),
+    }
+
+    if debug_prn:
+        print(res)
+
+    return res
+
+
+_IMPORT_ALL_SCRIPT = """
+import importlib, json, os, sys, time
+
+export_folder = sys.argv[1]
+sys.path.insert(0, export_folder)
+
+module_names = []
+for folder_path, folder_names, file_names in os.walk(export_folder):
+    folder_names[:] = [name for name in folder_names if name != "__pycache__"]
+    for file_name in file_names:
+        if file_name.endswith(".py") and file_name != "__init__.py":
+            relative_path = os.path.relpath(os.path.join(folder_path, file_name), export_folder)
+            module_names.append(relative_path[:-3].replace(os.sep, "."))
+
+start = time.perf_counter()
+for module_name in module_names:
+    importlib.import_module(module_name)
+
+print(json.dumps({"n_modules": len(module_names), "seconds": time.perf_counter() - start}))
+"""
+
+_LAZY_IMPORT_SCRIPT = """
+import importlib, json, os, sys, time
+
+export_folder = os.path.abspath(sys.argv[1])
+sys.path.insert(0, os.path.dirname(export_folder))
+
+start = time.perf_counter()
+package = importlib.import_module(os.path.basename(export_folder))
+for name in package.__all__[:2]:
+    getattr(package, name)
+
+print(json.dumps({"n_modules": len(package.__all__), "seconds": time.perf_counter() - start}))
+"""
+
+
+def benchmark_output_layouts(
+    n_folders: int = 50,
+    n_requests_per_folder: int = 100,
+    debug_prn: bool = True,
+) -> List[Dict[str, Any]]:
+    """Compare the "file" and "folder" output modes: file count and import time.
+
+    Every generated module is imported in a fresh interpreter, first without
+    bytecode caches (`cold_import_seconds`) and again once they were written.
+    `lazy_import_seconds` imports the generated package and calls up two of its
+    functions through the lazy `__init__.py`, as a CLI using two endpoints would.
+    """
+    import json
+    import os
+    import subprocess
+    import sys
+    import tempfile
+
+    import src
+    from src._1_models import PostmanCollection
+    from src._2_converter import PostmanCollectionConverter
+
+    collection = PostmanCollection.from_dict(
+        build_synthetic_collection(n_folders, n_requests_per_folder), keep_raw=False
+    )
+    config = {"drop_n_from_path_head": 3, "prefix": "v", "base_url_variable": "baseUrl"}
+
+    # the generated code imports src.client, so the repo root must be importable
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.path.dirname(os.path.dirname(os.path.abspath(src.__file__))),
+    }
+    # the warm run needs the bytecode caches of the cold one
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    def _import_all(export_folder: str, script: str = _IMPORT_ALL_SCRIPT) -> Dict:
+        completed = subprocess.run(
+            [sys.executable, "-c", script, export_folder],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return json.loads(completed.stdout)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for output_mode in ["file", "folder"]:
+            export_folder = os.path.join(tmp_dir, output_mode)
+
+            converter = PostmanCollectionConverter(collection=collection, config=config)
+            converter.convert(
+                export_base_folder=export_folder,
+                output_mode=output_mode,
+                is_incremental=False,
+            )
+
+            n_files = sum(
+                len(file_names) for _, _, file_names in os.walk(export_folder)
+            )
+            cold = _import_all(export_folder)
+            warm = _import_all(export_folder)
+            lazy = _import_all(export_folder, script=_LAZY_IMPORT_SCRIPT)
+
+            results.append(
+                {
+                    "output_mode": output_mode,
+                    "n_requests": len(converter.results),
+                    "n_files": n_files,
+                    "n_modules": cold["n_modules"],
+                    "convert_seconds": round(converter.seconds, 4),
+                    "cold_import_seconds": round(cold["seconds"], 4),
+                    "warm_import_seconds": round(warm["seconds"], 4),
+                    "lazy_import_seconds": round(lazy["seconds"], 4),
+                }
+            )
+
+    if debug_prn:
+        for run in results:
+            print(run)
+
+    return results
+
+
+class _LocalHandler(BaseHTTPRequestHandler):
+    # keep-alive, so pooled connections are reused between requests
+    protocol_version = "HTTP/1.1"
+    # headers and body are separate writes, Nagle would hold the body back
+    disable_nagle_algorithm = True
+    latency_seconds = 0.0
+
+    def do_GET(self):
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _LocalServer(ThreadingHTTPServer):
+    # the default backlog of 5 drops connections opened by a burst of clients
+    request_queue_size = 1024
+
+
+def _run_local_server(handler_cls, handler_attributes: Dict, connection) -> None:
+    handler = type(handler_cls.__name__, (handler_cls,), handler_attributes)
+    server = _LocalServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+
+    connection.send(server.server_address[1])
+    server.serve_forever()
+
+
+@contextmanager
+def serve_locally(
+    latency_seconds: float = 0.0, handler_cls=_LocalHandler, **handler_attributes
+):
+    """Serve handler_cls on a free localhost port from a separate process.
+
+    The server runs in its own interpreter so its threads do not compete with the
+    measured client for the GIL.
+
+    Args:
+        latency_seconds (float): Delay before each response, standing in for a remote API
+        handler_cls: Module level BaseHTTPRequestHandler subclass
+        **handler_attributes: Class attributes set on handler_cls, e.g. a stub's limits
+
+    Yields:
+        str: Base url of the server
+    """
+    import multiprocessing
+
+    parent_connection, child_connection = multiprocessing.Pipe()
+    process = multiprocessing.Process(
+        target=_run_local_server,
+        args=(
+            handler_cls,
+            {**handler_attributes, "latency_seconds": latency_seconds},
+            child_connection,
+        ),
+        daemon=True,
+    )
+    process.start()
+
+    try:
+        yield f"http://127.0.0.1:{parent_connection.recv()}"
+
+    finally:
+        process.terminate()
+        process.join()
+
+
+def benchmark_async_requests(
+    n_requests: int = 500,
+    latency_seconds: float = 0.05,
+    max_concurrency: int = 100,
+    n_repeats: int = 3,
+    debug_prn: bool = True,
+) -> List[Dict[str, Any]]:
+    """Compare a thread per call of gd_requests with gd_requests_async on one loop.
+
+    Both run max_concurrency calls at a time against a local server that answers
+    after latency_seconds. Each transport runs n_repeats times and reports its
+    median; the async runs include opening and closing their connection pool.
+    On this stub, async only pulls ahead when many calls are in flight: with
+    max_concurrency=10 and 50ms of latency both are bound by the concurrency limit.
+    """
+    import asyncio
+    import statistics
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    import src.client.get_data as gd
+
+    from src.client.Auth import Auth
+
+    class _NoAuth(Auth):
+        def get_auth_headers(self) -> Dict[str, str]:
+            return {}
+
+    auth = _NoAuth()
+
+    def _run_threads(url: str) -> list:
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            return list(
+                pool.map(
+                    lambda _: gd.gd_requests(auth, "get", url, headers={}),
+                    range(n_requests),
+                )
+            )
+
+    async def _gather(url: str) -> list:
+        async with gd.async_transport():
+            return await asyncio.gather(
+                *(gd.gd_requests_async(auth, "get", url) for _ in range(n_requests))
+            )
+
+    def _run_async(url: str) -> list:
+        return asyncio.run(_gather(url))
+
+    results = []
+
+    previous = gd.ASYNC_MAX_CONCURRENCY
+    gd.ASYNC_MAX_CONCURRENCY = max_concurrency
+
+    try:
+        with serve_locally(latency_seconds) as base_url:
+            url = f"{base_url}/items"
+
+            for transport, run_fn in [("threads", _run_threads), ("async", _run_async)]:
+                timings = []
+
+                for _ in range(n_repeats):
+                    start = time.perf_counter()
+                    responses = run_fn(url)
+                    timings.append(time.perf_counter() - start)
+
+                results.append(
+                    {
+                        "transport": transport,
+                        "n_ok": sum(res.ok for res in responses),
+                        "seconds": statistics.median(timings),
+                    }
+                )
+
+    finally:
+        gd.ASYNC_MAX_CONCURRENCY = previous
+
+    for run in results:
+        run["n_requests"] = n_requests
+        run["max_concurrency"] = max_concurrency
+        run["requests_per_second"] = round(n_requests / run["seconds"])
+        run["seconds"] = round(run["seconds"], 4)
+
+    if debug_prn:
+        for run in results:
+            print(run)
+
+    return results
+
+
+def benchmark_session_pool(
+    n_requests: int = 500,
+    latency_seconds: float = 0.0,
+    n_threads_options: List[int] = None,
+    debug_prn: bool = True,
+) -> List[Dict[str, Any]]:
+    """Compare a new connection per call (requests.request) with a SessionPool.
+
+    Runs against a local keep-alive server, so the difference is connection setup;
+    over TLS to a remote host the handshake makes it larger.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import requests
+
+    from src.client.SessionPool import SessionPool
+
+    results = []
+
+    with serve_locally(latency_seconds) as base_url:
+        url = f"{base_url}/items"
+
+        for n_threads in n_threads_options or [1, 16]:
+            session_pool = SessionPool(pool_maxsize=n_threads)
+
+            for transport, request_fn in [
+                ("requests.request", requests.request),
+                ("SessionPool", session_pool.request),
+            ]:
+                start = time.perf_counter()
+
+                with ThreadPoolExecutor(max_workers=n_threads) as pool:
+                    responses = list(
+                        pool.map(lambda _: request_fn("get", url), range(n_requests))
+                    )
+
+                seconds = time.perf_counter() - start
+                results.append(
+                    {
+                        "transport": transport,
+                        "n_threads": n_threads,
+                        "n_requests": n_requests,
+                        "n_ok": sum(res.ok for res in responses),
+                        "seconds": round(seconds, 4),
+                        "requests_per_second": round(n_requests / seconds),
+                    }
+                )
+
+            session_pool.close()
+
+    if debug_prn:
+        for run in results:
+            print(run)
+
+    return results
+
+
+class _CachingHandler(_LocalHandler):
+    """Stub API answering with an ETag and a one second max-age."""
+
+    etag = '"v1"'
+    body = b'{"items": [' + b",".join(b'{"id": %d}' % i for i in range(1000)) + b"]}"
+
+    def do_GET(self):
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.send_header("Cache-Control", "max-age=1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", self.etag)
+        self.send_header("Cache-Control", "max-age=1")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+
+def benchmark_response_cache(
+    n_requests: int = 200,
+    latency_seconds: float = 0.02,
+    n_urls: int = 10,
+    debug_prn: bool = True,
+) -> List[Dict[str, Any]]:
+    """Compare uncached gd_requests with a memory and a disk backed ResponseCache.
+
+    The stub answers with max-age=1 and an ETag, so longer runs also exercise 304
+    revalidation. "disk" starts with an empty memory tier over the entries written
+    by the "memory + disk" run, as a new process would.
+    """
+    import tempfile
+
+    import src.client.get_data as gd
+
+    from src.client.Auth import Auth
+    from src.client.ResponseCache import ResponseCache
+    from src.client.SessionPool import SessionPool
+
+    class _NoAuth(Auth):
+        def get_auth_headers(self) -> Dict[str, str]:
+            return {}
+
+    auth = _NoAuth()
+    results = []
+
+    with serve_locally(
+        latency_seconds, _CachingHandler
+    ) as base_url, tempfile.TemporaryDirectory() as cache_dir, SessionPool() as session_pool:
+        urls = [f"{base_url}/items/{i}" for i in range(n_urls)]
+
+        for name, response_cache in [
+            ("no cache", None),
+            ("memory", ResponseCache()),
+            ("memory + disk", ResponseCache(cache_dir=cache_dir)),
+            ("disk", ResponseCache(cache_dir=cache_dir, max_entries=0)),
+        ]:
+            start = time.perf_counter()
+
+            responses = [
+                gd.gd_requests(
+                    auth,
+                    "get",
+                    urls[i % n_urls],
+                    session_pool=session_pool,
+                    response_cache=response_cache,
+                )
+                for i in range(n_requests)
+            ]
+
+            seconds = time.perf_counter() - start
+            results.append(
+                {
+                    "cache": name,
+                    "n_requests": n_requests,
+                    "n_ok": sum(res.ok for res in responses),
+                    "seconds": round(seconds, 4),
+                    **(response_cache.stats if response_cache else {}),
+                }
+            )
+
+    if debug_prn:
+        for run in results:
+            print(run)
+
+    return results
+
+
+class _ThrottlingHandler(_LocalHandler):
+    """Stub API allowing `rate` requests per second; beyond it, 429 with Retry-After.
+
+    GET /stats returns how many requests were served and throttled.
+    """
+
+    rate = 50.0
+    retry_after = "1"
+
+    _lock = threading.Lock()
+    _state = {"tokens": 0.0, "updated_at": 0.0, "n_ok": 0, "n_throttled": 0}
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            state = self._state
+            now = time.monotonic()
+
+            # a one second burst, like most vendor limits
+            state["tokens"] = min(
+                self.rate,
+                (
+                    state["tokens"] + (now - state["updated_at"]) * self.rate
+                    if state["updated_at"]
+                    else self.rate
+                ),
+            )
+            state["updated_at"] = now
+
+            if state["tokens"] < 1:
+                state["n_throttled"] += 1
+                return False
+
+            state["tokens"] -= 1
+            state["n_ok"] += 1
+            return True
+
+    def do_GET(self):
+        if self.path == "/stats":
+            body = json.dumps(self._state).encode("utf-8")
+            self.send_response(200)
+
+        elif self._take_token():
+            return super().do_GET()
+
+        else:
+            body = b'{"error": "rate limited"}'
+            self.send_response(429)
+            self.send_header("Retry-After", self.retry_after)
+
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def benchmark_rate_limiter(
+    n_requests: int = 300,
+    server_rate: float = 50.0,
+    n_threads: int = 16,
+    debug_prn: bool = True,
+) -> List[Dict[str, Any]]:
+    """Fan n_requests out over n_threads against a stub limited to server_rate per second.
+
+    Compares session level retries alone (urllib3 honouring Retry-After) with an
+    adaptive RateLimiter that starts at twice the allowed rate and has to find it.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import requests
+
+    import src.client.get_data as gd
+
+    from src.client.Auth import Auth
+    from src.client.RateLimiter import RateLimiter
+    from src.client.SessionPool import SessionPool
+
+    class _NoAuth(Auth):
+        def get_auth_headers(self) -> Dict[str, str]:
+            return {}
+
+    auth = _NoAuth()
+    results = []
+
+    for name, rate_limiter in [
+        ("session retries", None),
+        ("rate limiter", RateLimiter(rate_per_host=server_rate * 2)),
+    ]:
+        with serve_locally(
+            0.0, _ThrottlingHandler, rate=server_rate, retry_after="1"
+        ) as base_url, SessionPool(pool_maxsize=n_threads) as session_pool:
+            url = f"{base_url}/items"
+
+            start = time.perf_counter()
+
+            with ThreadPoolExecutor(max_workers=n_threads) as pool:
+                responses = list(
+                    pool.map(
+                        lambda _: gd.gd_requests(
+                            auth,
+                            "get",
+                            url,
+                            session_pool=session_pool,
+                            rate_limiter=rate_limiter,
+                        ),
+                        range(n_requests),
+                    )
+                )
+
+            seconds = time.perf_counter() - start
+            server_stats = requests.get(f"{base_url}/stats").json()
+
+        results.append(
+            {
+                "client": name,
+                "n_requests": n_requests,
+                "n_ok": sum(res.ok for res in responses),
+                "n_throttled_by_server": server_stats["n_throttled"],
+                "seconds": round(seconds, 4),
+                "requests_per_second": round(n_requests / seconds, 1),
+                "final_rate": (
+                    list(rate_limiter.stats.values())[0]["rate"]
+                    if rate_limiter
+                    else None
+                ),
+            }
+        )
+
+    if debug_prn:
+        for run in results:
+            print(run)
+
+    return results
+
+
+def benchmark_requests_many(
+    n_requests: int = 500,
+    latency_seconds: float = 0.02,
+    max_workers_options: List[int] = None,
+    debug_prn: bool = True,
+) -> List[Dict[str, Any]]:
+    """Compare sequential gd_requests calls with gd_requests_many batches."""
+    import src.client.get_data as gd
+
+    from src.client.Auth import Auth
+    from src.client.SessionPool import SessionPool
+
+    class _NoAuth(Auth):
+        def get_auth_headers(self) -> Dict[str, str]:
+            return {}
+
+    auth = _NoAuth()
+    results = []
+
+    with serve_locally(latency_seconds) as base_url:
+        specs = [
+            {"method": "get", "url": f"{base_url}/items/{i}"} for i in range(n_requests)
+        ]
+
+        for max_workers in [1] + (max_workers_options or [8, 32]):
+            with SessionPool(pool_maxsize=max_workers) as session_pool:
+                start = time.perf_counter()
+
+                if max_workers == 1:
+                    n_ok = sum(
+                        gd.gd_requests(auth, session_pool=session_pool, **spec).ok
+                        for spec in specs
+                    )
+
+                else:
+                    n_ok = sum(
+                        result.is_success
+                        for result in gd.gd_requests_many(
+                            specs,
+                            auth=auth,
+                            max_workers=max_workers,
+                            session_pool=session_pool,
+                        )
+                    )
+
+                seconds = time.perf_counter() - start
+
+            results.append(
+                {
+                    "mode": "sequential" if max_workers == 1 else "gd_requests_many",
+                    "max_workers": max_workers,
+                    "n_requests": n_requests,
+                    "n_ok": n_ok,
+                    "seconds": round(seconds, 4),
+                    "requests_per_second": round(n_requests / seconds),
+                }
+            )
+
+    if debug_prn:
+        for run in results:
+            print(run)
+
+    return results
+
+
+class _LargeBodyHandler(_LocalHandler):
+    """Answers with a `{"values": [...]}` page of n_records records, written in pieces."""
+
+    n_records = 100_000
+
+    def do_GET(self):
+        record = (
+            b'{"id": "10000", "key": "PROJ-1", "summary": "A record of a large page"}'
+        )
+        n_per_write = 1_000
+
+        piece = b", ".join([record] * n_per_write)
+        n_pieces, remainder = divmod(self.n_records, n_per_write)
+
+        parts = [piece] * n_pieces
+        if remainder:
+            parts.append(b", ".join([record] * remainder))
+
+        body_length = (
+            len(b'{"values": []}') + sum(map(len, parts)) + 2 * (len(parts) - 1)
+        )
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(body_length))
+        self.end_headers()
+
+        self.wfile.write(b'{"values": [')
+        for index, part in enumerate(parts):
+            self.wfile.write(b", " + part if index else part)
+        self.wfile.write(b"]}")
+
+
+def benchmark_streaming(
+    n_records: int = 100_000,
+    export_folder: str = None,
+    debug_prn: bool = True,
+) -> List[Dict[str, Any]]:
+    """Compare peak memory of a buffered response with the stream_response modes."""
+    import os
+    import tempfile
+
+    import src.client.get_data as gd
+
+    from src.client.Auth import Auth
+    from src.client.SessionPool import SessionPool
+
+    class _NoAuth(Auth):
+        def get_auth_headers(self) -> Dict[str, str]:
+            return {}
+
+    auth = _NoAuth()
+    export_folder = export_folder or tempfile.mkdtemp()
+    results = []
+
+    with serve_locally(
+        handler_cls=_LargeBodyHandler, n_records=n_records
+    ) as base_url, SessionPool() as session_pool:
+        url = f"{base_url}/search"
+
+        def _send(stream: bool):
+            return gd.gd_requests(
+                auth, "get", url, session_pool=session_pool, stream=stream
+            )
+
+        def _buffered():
+            return len(_send(stream=False).json()["values"])
+
+        def _chunks():
+            return sum(map(len, gd.stream_response(_send(True), stream="chunks")))
+
+        def _records():
+            return sum(
+                1
+                for _ in gd.stream_response(
+                    _send(True), stream="records", records_path=("values",)
+                )
+            )
+
+        def _file():
+            file_path = os.path.join(export_folder, "search.json")
+            return os.path.getsize(gd.stream_response(_send(True), file_path=file_path))
+
+        for mode, fn in [
+            ("buffered json()", _buffered),
+            ("chunks", _chunks),
+            ("records", _records),
+            ("file_path", _file),
+        ]:
+            run = measure(fn)
+            run["mode"] = mode
+            run["n_records"] = n_records
+            results.append(run)
+
+    if debug_prn:
+        for run in results:
+            print(run)
+
+    return results
@@ -0,0 +1,111 @@
+import gc
+import json
+import mmap
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# each backend decodes a read-only buffer (memoryview over the mapped file)
+JSON_BACKENDS: Dict[str, Callable[[memoryview], Any]] = {}
+
+# fastest first; used when no backend is requested
+JSON_BACKEND_PREFERENCE = ["orjson", "simdjson", "ujson", "json"]
+
+
+def register_json_backend(name: str, loads_fn: Callable[[memoryview], Any]) -> None:
+    JSON_BACKENDS[name] = loads_fn
+
+
+def decode_buffer(buffer: memoryview) -> str:
+    """Decode a buffer straight into one str, for decoders that do not take buffers.
+
+    bytes(buffer) would first copy the whole mapping, then json.loads would decode
+    that copy; this skips the bytes copy. The encoding is detected as json.loads
+    does for bytes (UTF-8, with or without BOM, UTF-16 or UTF-32).
+    """
+    return str(buffer, json.detect_encoding(buffer[:4].tobytes()), "surrogatepass")
+
+
+def _register_default_backends() -> None:
+    # the mapped file is decoded once, into the str the parser reads
+    register_json_backend("json", lambda buffer: json.loads(decode_buffer(buffer)))
+
+    try:
+        import orjson
+
+        # orjson reads buffers directly, no intermediate bytes copy
+        register_json_backend("orjson", orjson.loads)
+    except ImportError:
+        pass
+
+    try:
+        import simdjson
+
+        # not zero-copy: the parser is handed a bytes copy of the mapping
+        register_json_backend(
+            "simdjson",
+            lambda buffer: simdjson.Parser().parse(bytes(buffer), recursive=True),
+        )
+    except ImportError:
+        pass
+
+    try:
+        import ujson
+
+        register_json_backend(
+            "ujson", lambda buffer: ujson.loads(decode_buffer(buffer))
+        )
+    except ImportError:
+        pass
+
+
+_register_default_backends()
+
+
+def get_json_backend(
+    name: Optional[str] = None,
+) -> Tuple[str, Callable[[memoryview], Any]]:
+    """Return (name, loads_fn) for a backend, defaulting to the fastest installed one."""
+    if name:
+        if name not in JSON_BACKENDS:
+            raise ValueError(
+                f"JSON backend '{name}' is not available, installed backends: {list(JSON_BACKENDS)}"
+            )
+        return name, JSON_BACKENDS[name]
+
+    name = next(name for name in JSON_BACKEND_PREFERENCE if name in JSON_BACKENDS)
+    return name, JSON_BACKENDS[name]
+
+
+def read_json_file(file_path: str, backend: Optional[str] = None) -> Any:
+    """Decode a JSON file through a memory map, without reading it into Python bytes.
+
+    orjson parses the mapping in place. The json and ujson backends decode it into a
+    single str first, and simdjson parses a bytes copy, so those are not zero-copy.
+
+    Args:
+        file_path (str): Path to the JSON file
+        backend (Optional[str]): Name of a registered backend, defaults to the fastest available
+
+    Returns:
+        Any: The decoded document
+    """
+    _, loads_fn = get_json_backend(backend)
+
+    # decoded JSON is acyclic, so collector passes over the new containers are wasted work
+    is_gc_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        with open(file_path, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped; let the backend raise its decode error
+                return loads_fn(memoryview(b""))
+
+            with mapped, memoryview(mapped) as buffer:
+                return loads_fn(buffer)
+
+    finally:
+        if is_gc_enabled:
+            gc.enable()
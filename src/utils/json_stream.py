@@ -0,0 +1,201 @@
+import codecs
+import json
+import re
+
+from typing import Callable, Iterable, Iterator, Any, Sequence, Union
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonStreamReader:
+    """Incremental JSON reader that decodes one value at a time from a text stream.
+
+    Only the value currently being decoded is held in memory, so walking a large
+    document costs as much as its largest leaf value rather than the whole file.
+
+    Containers are walked with `iter_object` / `iter_array`; between yields the
+    caller must consume exactly one value (`read_value`, `skip_value` or a
+    nested `iter_*` call).
+
+    Args:
+        read_fn (Callable[[int], str]): Function returning up to n characters, "" at EOF
+        chunk_size (int): Number of characters to request per read
+    """
+
+    def __init__(self, read_fn: Callable[[int], str], chunk_size: int = 1 << 16):
+        self._read = read_fn
+        self._decoder = json.JSONDecoder()
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    @classmethod
+    def from_chunks(
+        cls,
+        chunks: Iterable[Union[bytes, str]],
+        encoding: str = "utf-8",
+        chunk_size: int = 1 << 16,
+    ) -> "JsonStreamReader":
+        """Reader over an iterable of chunks, e.g. a streamed HTTP response body.
+
+        Bytes are decoded incrementally, so multi-byte characters may span chunks.
+        """
+        chunks = iter(chunks)
+        decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+        pending = [""]
+
+        def read_fn(size: int) -> str:
+            while not pending[0]:
+                chunk = next(chunks, None)
+
+                if chunk is None:
+                    return decoder.decode(b"", final=True)
+
+                pending[0] = chunk if isinstance(chunk, str) else decoder.decode(chunk)
+
+            text, pending[0] = pending[0][:size], pending[0][size:]
+            return text
+
+        return cls(read_fn, chunk_size=chunk_size)
+
+    def _fill(self, size: int = None) -> bool:
+        """Append the next chunk to the buffer, dropping already consumed text."""
+        if self.eof:
+            return False
+
+        if self.pos >= self.chunk_size:
+            self.buf = self.buf[self.pos :]
+            self.pos = 0
+
+        chunk = self._read(size or self.chunk_size)
+
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.buf += chunk
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ("" at EOF)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(
+                f"Expecting '{char}', found '{found}'", self.buf, self.pos
+            )
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        """Decode and return the next complete JSON value."""
+        self.peek()
+        size = self.chunk_size
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+
+            except json.JSONDecodeError:
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+
+            # a number ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self.buf) and self._fill(size):
+                continue
+
+            self.pos = end
+            return value
+
+    def skip_value(self) -> None:
+        self.read_value()
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield the keys of the next JSON object; the caller consumes each value."""
+        self.expect("{")
+
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            self.expect(":")
+
+            yield key
+
+            char = self.peek()
+            self.pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise json.JSONDecodeError(
+                    "Expecting ',' delimiter", self.buf, self.pos - 1
+                )
+
+    def iter_array(self) -> Iterator[int]:
+        """Yield the index of each element of the next JSON array; the caller consumes each element."""
+        self.expect("[")
+
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        index = 0
+        while True:
+            yield index
+            index += 1
+
+            char = self.peek()
+            self.pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise json.JSONDecodeError(
+                    "Expecting ',' delimiter", self.buf, self.pos - 1
+                )
+
+
+def iter_json_records(
+    reader: JsonStreamReader, path: Sequence[Union[str, int]] = ()
+) -> Iterator[Any]:
+    """Yield the elements of a JSON array one at a time.
+
+    Args:
+        reader (JsonStreamReader): Positioned before the document
+        path (Sequence[Union[str, int]]): Keys / indexes leading to the array, e.g.
+            ("values",) for {"values": [...], "total": 10}; empty for a top level array
+
+    Yields:
+        Any: Each decoded element
+    """
+    if not path:
+        for _ in reader.iter_array():
+            yield reader.read_value()
+        return
+
+    step, rest = path[0], path[1:]
+    keys = reader.iter_array() if isinstance(step, int) else reader.iter_object()
+
+    for key in keys:
+        if key != step:
+            reader.skip_value()
+            continue
+
+        yield from iter_json_records(reader, rest)
+
+        # the container's remaining keys are left unread
+        return
+
+    raise KeyError(f"{step!r} not found in the JSON document")
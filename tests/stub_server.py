@@ -0,0 +1,103 @@
+"""Stub HTTP API for the client tests, served with utils.benchmark.serve_locally.
+
+The response is shaped by query parameters, so one server covers every test:
+
+- `status`: response status (200)
+- `set_cookie`: Set-Cookie header value
+- `cache_control`, `etag`, `retry_after`: the matching response headers; a
+  request whose If-None-Match equals `etag` gets a 304
+- `n_records`: answer {"data": [{"id": 0}, ...]} instead of the echo
+
+Other responses echo the request as JSON (method, path, headers, body). Hits are
+counted per "METHOD /path"; GET /_hits returns and resets the counts.
+"""
+
+import json
+
+from collections import Counter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from src.utils.benchmark import serve_locally
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency_seconds = 0.0
+
+    # per server process
+    hits = Counter()
+
+    def _handle(self):
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8") if length else ""
+
+        if parts.path == "/_hits":
+            payload = dict(self.hits)
+            self.hits.clear()
+            return self._send(200, payload)
+
+        self.hits[f"{self.command} {parts.path}"] += 1
+
+        headers = {}
+        for name, header in [
+            ("set_cookie", "Set-Cookie"),
+            ("cache_control", "Cache-Control"),
+            ("etag", "ETag"),
+            ("retry_after", "Retry-After"),
+        ]:
+            if name in query:
+                headers[header] = query[name]
+
+        if "etag" in query and self.headers.get("If-None-Match") == query["etag"]:
+            return self._send(304, None, headers)
+
+        if "n_records" in query:
+            payload = {"data": [{"id": i} for i in range(int(query["n_records"]))]}
+        else:
+            payload = {
+                "method": self.command,
+                "path": parts.path,
+                "headers": {key.lower(): value for key, value in self.headers.items()},
+                "body": body,
+            }
+
+        return self._send(int(query.get("status", 200)), payload, headers)
+
+    def _send(self, status: int, payload, headers=None):
+        content = b"" if payload is None else json.dumps(payload).encode("utf-8")
+
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+
+        if self.command != "HEAD":
+            self.wfile.write(content)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve_stub():
+    """Yields the base url of a StubHandler server."""
+    with serve_locally(handler_cls=StubHandler) as base_url:
+        yield base_url
+
+
+def get_hits(base_url: str) -> dict:
+    """Hits per "METHOD /path" since the last call."""
+    return requests.get(f"{base_url}/_hits").json()
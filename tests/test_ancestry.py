@@ -0,0 +1,40 @@
+from src._1_models import PostmanCollection
+
+from tests.test_models import INFO, _request
+
+
+def _collection(lazy: bool = False) -> PostmanCollection:
+    return PostmanCollection.from_dict(
+        {
+            "info": INFO,
+            "item": [
+                {
+                    "name": "outer",
+                    "item": [
+                        {"name": "inner", "item": [_request("a"), _request("b")]},
+                    ],
+                },
+                _request("root"),
+            ],
+        },
+        lazy=lazy,
+    )
+
+
+def test_parents_and_breadcrumbs():
+    for lazy in (False, True):
+        collection = _collection(lazy=lazy)
+        a, b, root = collection.get_folder_requests()
+
+        assert [parent.name for parent in a.get_parents()] == ["Coll", "outer", "inner"]
+        assert a.depth == 3 and root.depth == 1
+        assert a.get_breadcrumb() == ("Coll", "outer", "inner", "a")
+        assert root.get_breadcrumb() == ("Coll", "root")
+        assert collection.items[0].items[0].folder_path == ("Coll", "outer", "inner")
+
+
+def test_siblings_share_the_parent_lineage():
+    a, b, _ = _collection().get_folder_requests()
+
+    assert a.get_parents() == b.get_parents()
+    assert a._ancestors is b._ancestors
@@ -0,0 +1,87 @@
+import asyncio
+import textwrap
+
+import pytest
+
+import src.client.get_data as gd
+
+from src._2_tester import test_exports as run_exports
+from src.client.Auth import Auth
+from src.utils.benchmark import serve_locally
+
+# loops the exported functions of test_tester_runs_coroutines_on_one_loop ran on
+LOOPS = []
+
+
+class _NoAuth(Auth):
+    def get_auth_headers(self):
+        return {}
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    with serve_locally() as base_url:
+        yield base_url
+
+
+def test_asyncio_run_closes_the_pool(base_url):
+    async def _request():
+        res = await gd.gd_requests_async(_NoAuth(), "get", f"{base_url}/items")
+        return res, gd.get_async_transport()
+
+    res, transport = asyncio.run(_request())
+
+    assert res.json() == {"ok": True}
+    assert transport.session.closed
+
+
+def test_async_transport_closes_on_exit(base_url):
+    async def _requests():
+        async with gd.async_transport() as transport:
+            responses = await asyncio.gather(
+                *(
+                    gd.gd_requests_async(_NoAuth(), "get", f"{base_url}/items")
+                    for _ in range(3)
+                )
+            )
+            # every call of the block shares the one pool
+            assert gd.get_async_transport() is transport
+
+        return responses, transport
+
+    responses, transport = asyncio.run(_requests())
+
+    assert [res.status_code for res in responses] == [200, 200, 200]
+    assert transport.session.closed
+
+
+def test_tester_runs_coroutines_on_one_loop(tmp_path):
+    (tmp_path / "endpoints.py").write_text(
+        textwrap.dedent("""
+            import asyncio
+
+            from tests.test_async import LOOPS
+
+
+            class _Response:
+                status_code = 200
+
+
+            async def first(auth, debug_api=False):
+                LOOPS.append(asyncio.get_running_loop())
+                return _Response()
+
+
+            async def second(auth, debug_api=False):
+                LOOPS.append(asyncio.get_running_loop())
+                return _Response()
+            """),
+        encoding="utf-8",
+    )
+    LOOPS.clear()
+
+    results = run_exports(str(tmp_path), auth=None, update_files=False)
+
+    assert [result["success"] for result in results.values()] == [True, True]
+    assert len(LOOPS) == 2 and LOOPS[0] is LOOPS[1]
+    assert LOOPS[0].is_closed()
@@ -0,0 +1,151 @@
+import threading
+import time
+
+import pytest
+
+import src.client.get_data as gd
+
+from src.client.SessionPool import SessionPool
+
+from tests.stub_server import get_hits, serve_stub
+from tests.test_session_pool import _TokenAuth
+
+
+class _Probe:
+    """Generated-function stand-in that records how many calls overlap."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.n_running = 0
+        self.max_running = 0
+
+    def __call__(self, auth=None, value=None, delay=0.0, error=None):
+        with self.lock:
+            self.n_running += 1
+            self.max_running = max(self.max_running, self.n_running)
+
+        try:
+            time.sleep(delay)
+            if error is not None:
+                raise error
+            return value
+
+        finally:
+            with self.lock:
+                self.n_running -= 1
+
+
+def test_results_keep_input_order():
+    probe = _Probe()
+    items = [(probe, {"value": i, "delay": 0.02 if i % 2 else 0}) for i in range(10)]
+
+    results = list(gd.gd_requests_many(items, max_workers=4))
+
+    assert [result.index for result in results] == list(range(10))
+    assert [result.response for result in results] == list(range(10))
+
+
+def test_unordered_results_arrive_as_completed():
+    probe = _Probe()
+    items = [(probe, {"value": 0, "delay": 0.2})] + [
+        (probe, {"value": i}) for i in range(1, 4)
+    ]
+
+    results = list(gd.gd_requests_many(items, max_workers=4, is_ordered=False))
+
+    assert results[-1].index == 0
+    assert sorted(result.index for result in results) == [0, 1, 2, 3]
+
+
+def test_items_are_drawn_within_the_in_flight_window():
+    probe = _Probe()
+    n_drawn = 0
+
+    def _items():
+        nonlocal n_drawn
+        for i in range(100):
+            n_drawn += 1
+            yield probe, {"value": i, "delay": 0.001}
+
+    n_yielded = 0
+    for result in gd.gd_requests_many(_items(), max_workers=2, max_in_flight=3):
+        n_yielded += 1
+        # drawn but not yet yielded: the in-flight window plus the refill
+        assert n_drawn - n_yielded <= 3
+
+    assert n_yielded == 100
+    assert probe.max_running <= 2
+
+
+def test_stopping_early_draws_no_more_items():
+    probe = _Probe()
+    n_drawn = 0
+
+    def _items():
+        nonlocal n_drawn
+        for i in range(100):
+            n_drawn += 1
+            yield probe, {"value": i}
+
+    batch = gd.gd_requests_many(_items(), max_workers=2, max_in_flight=4)
+    assert next(batch).index == 0
+    batch.close()
+
+    assert n_drawn <= 5
+
+
+def test_errors_are_captured_per_item():
+    probe = _Probe()
+    items = [
+        (probe, {"value": 0}),
+        (probe, {"error": ValueError("bad item")}),
+        (probe, {"value": 2}),
+    ]
+
+    results = list(gd.gd_requests_many(items, max_workers=2))
+
+    assert [result.is_success for result in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert results[2].response == 2
+
+
+def test_auth_is_passed_unless_the_item_sets_its_own():
+    seen = []
+
+    def _fn(auth=None):
+        seen.append(auth)
+
+    default_auth, item_auth = _TokenAuth("a"), _TokenAuth("b")
+    list(
+        gd.gd_requests_many(
+            [(_fn, {}), (_fn, {"auth": item_auth})], auth=default_auth, max_workers=1
+        )
+    )
+
+    assert seen == [default_auth, item_auth]
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    with serve_stub() as base_url:
+        yield base_url
+
+
+def test_request_specs_share_the_session_pool(base_url):
+    get_hits(base_url)
+    specs = [
+        {"method": "get", "url": f"{base_url}/items/{i}", "params": {"status": status}}
+        for i, status in enumerate([200, 404, 200])
+    ]
+
+    with SessionPool() as session_pool:
+        results = list(
+            gd.gd_requests_many(
+                specs, auth=_TokenAuth("a"), session_pool=session_pool, max_workers=2
+            )
+        )
+
+    assert [result.response.status_code for result in results] == [200, 404, 200]
+    assert results[0].response.json()["headers"]["x-api-token"] == "a"
+    assert isinstance(results[1].error, gd.ApiResponseError)
+    assert sum(get_hits(base_url).values()) == 3
@@ -0,0 +1,70 @@
+import gc
+import json
+import os
+
+from src._1_cache import PostmanSnapshotCache
+from src._1_models import PostmanCollection
+
+from tests.test_models import INFO, _request
+
+
+def _write(file_path, names) -> str:
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump({"info": INFO, "item": [_request(name) for name in names]}, f)
+    return str(file_path)
+
+
+def _names(collection) -> list:
+    return [request.name for request in collection.get_folder_requests()]
+
+
+def test_snapshot_hit_and_invalidation_on_edit(tmp_path):
+    cache = PostmanSnapshotCache(cache_dir=str(tmp_path / "cache"))
+    file_path = _write(tmp_path / "c.json", ["a"])
+
+    assert _names(PostmanCollection.from_file(file_path, snapshot_cache=cache)) == ["a"]
+    key = cache.get_key(file_path, keep_raw=True, lazy=False)
+    assert cache.read(key) is not None
+
+    _write(file_path, ["a", "b"])
+
+    assert cache.get_key(file_path, keep_raw=True, lazy=False) != key
+    assert _names(PostmanCollection.from_file(file_path, snapshot_cache=cache)) == [
+        "a",
+        "b",
+    ]
+
+
+def test_load_options_are_part_of_the_key(tmp_path):
+    cache = PostmanSnapshotCache(cache_dir=str(tmp_path / "cache"))
+    file_path = _write(tmp_path / "c.json", ["a"])
+
+    assert cache.get_key(file_path, keep_raw=True) != cache.get_key(
+        file_path, keep_raw=False
+    )
+
+
+def test_corrupt_snapshot_is_discarded_and_gc_restored(tmp_path):
+    cache = PostmanSnapshotCache(cache_dir=str(tmp_path / "cache"))
+    file_path = _write(tmp_path / "c.json", ["a"])
+
+    PostmanCollection.from_file(file_path, snapshot_cache=cache)
+    key = cache.get_key(file_path, keep_raw=True, lazy=False)
+    snapshot_path = os.path.join(cache.cache_dir, f"{key}.pkl")
+
+    with open(snapshot_path, "wb") as f:
+        f.write(b"not a pickle")
+
+    assert gc.isenabled()
+    assert cache.read(key) is None
+    assert gc.isenabled()
+    assert not os.path.exists(snapshot_path)
+
+
+def test_evict_over_max_bytes(tmp_path):
+    cache = PostmanSnapshotCache(cache_dir=str(tmp_path / "cache"), max_bytes=0)
+    file_path = _write(tmp_path / "c.json", ["a"])
+
+    PostmanCollection.from_file(file_path, snapshot_cache=cache)
+
+    assert cache._list_snapshots() == []
@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import pytest
+
+from src.client.Auth import CachedAuth
+
+
+@dataclass(kw_only=True)
+class _CountingAuth(CachedAuth):
+    """Fetches "token-<n>", optionally waiting for release or failing."""
+
+    release: threading.Event = field(default_factory=threading.Event)
+    error: Exception = None
+    n_fetches: int = 0
+
+    def get_auth_headers(self):
+        self.n_fetches += 1
+        self.release.wait(5)
+
+        if self.error is not None:
+            raise self.error
+
+        return {"authorization": f"token-{self.n_fetches}"}
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_concurrent_callers_share_one_fetch():
+    auth = _CountingAuth()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(auth.generate_auth_headers) for _ in range(8)]
+        _wait_for(lambda: auth.n_fetches == 1)
+        auth.release.set()
+
+        headers = [future.result() for future in futures]
+
+    assert headers == [{"authorization": "token-1"}] * 8
+    assert auth.n_fetches == 1
+
+
+def test_cached_until_invalidated():
+    auth = _CountingAuth()
+    auth.release.set()
+
+    assert auth.generate_auth_headers() == auth.generate_auth_headers()
+    assert auth.n_fetches == 1
+
+    auth.invalidate()
+
+    assert auth.generate_auth_headers() == {"authorization": "token-2"}
+
+
+def test_expired_headers_are_fetched_again():
+    auth = _CountingAuth(ttl_seconds=0.05, refresh_ahead_seconds=0)
+    auth.release.set()
+
+    auth.generate_auth_headers()
+    time.sleep(0.06)
+
+    assert auth.is_expired
+    assert auth.generate_auth_headers() == {"authorization": "token-2"}
+
+
+def test_refresh_ahead_serves_cached_headers_meanwhile():
+    auth = _CountingAuth(ttl_seconds=10, refresh_ahead_seconds=10)
+    auth.release.set()
+    auth.generate_auth_headers()
+
+    auth.release.clear()
+
+    # inside the refresh window: cached headers come back while one refresh runs
+    assert auth.generate_auth_headers() == {"authorization": "token-1"}
+    assert auth.generate_auth_headers() == {"authorization": "token-1"}
+    _wait_for(lambda: auth.n_fetches == 2)
+
+    auth.release.set()
+    _wait_for(lambda: auth._headers == {"authorization": "token-2"})
+    assert auth.n_fetches == 2
+
+
+def test_fetch_errors_reach_every_waiter_and_are_not_cached():
+    auth = _CountingAuth(error=RuntimeError("token endpoint down"))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(auth.generate_auth_headers) for _ in range(4)]
+        _wait_for(lambda: auth.n_fetches == 1)
+        auth.release.set()
+
+        for future in futures:
+            with pytest.raises(RuntimeError, match="down"):
+                future.result()
+
+    auth.error = None
+    assert auth.generate_auth_headers() == {"authorization": "token-2"}
+
+
+def test_async_callers_share_one_fetch():
+    auth = _CountingAuth()
+
+    async def _gather():
+        tasks = [
+            asyncio.ensure_future(auth.generate_auth_headers_async()) for _ in range(5)
+        ]
+        await asyncio.sleep(0.01)
+        auth.release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(_gather()) == [{"authorization": "token-1"}] * 5
+    assert auth.n_fetches == 1
@@ -0,0 +1,234 @@
+import os
+
+import pytest
+
+from src._1_diff import PostmanCollectionDiff
+from src._1_models import PostmanCollection, PostmanQueryParam
+from src._2_converter import (
+    PostmanCollectionConverter,
+    PostmanRequestConverter,
+    diff_collections,
+    export_collection_diff,
+)
+
+from tests.test_models import INFO, _request
+
+CONFIG = {"drop_n_from_path_head": 0, "prefix": "v"}
+
+
+def _collection(folders: dict) -> PostmanCollection:
+    return PostmanCollection.from_dict(
+        {
+            "info": INFO,
+            "item": [
+                {"name": folder_name, "item": [_request(name) for name in names]}
+                for folder_name, names in folders.items()
+            ],
+        }
+    )
+
+
+def test_export_collection_diff_keeps_file_shared_with_live_request(tmp_path):
+    export_folder = str(tmp_path)
+
+    old = _collection({"a": ["items"], "b": ["items"]})
+    new = _collection({"b": ["items"]})
+
+    kept = new.get_folder_requests()[0]
+    file_path = PostmanRequestConverter(request=kept).export_code(
+        config=CONFIG, export_base_folder=export_folder
+    )
+
+    res = export_collection_diff(
+        PostmanCollectionDiff.from_collections(old, new),
+        config=CONFIG,
+        export_base_folder=export_folder,
+    )
+
+    assert res["removed"] == []
+    assert os.path.exists(file_path)
+
+
+def _collection_with_host(host: str, name: str = "Coll") -> PostmanCollection:
+    return PostmanCollection.from_dict(
+        {
+            "info": {**INFO, "name": name},
+            "variable": [{"key": "host", "value": host}],
+            "item": [
+                {
+                    "name": "folder",
+                    "item": [
+                        {
+                            "name": "items",
+                            "request": {
+                                "method": "GET",
+                                "url": {
+                                    "raw": "https://{{host}}/items",
+                                    "protocol": "https",
+                                    "host": ["{{host}}"],
+                                    "path": ["items"],
+                                },
+                            },
+                        }
+                    ],
+                }
+            ],
+        }
+    )
+
+
+def _convert(collection: PostmanCollection, export_folder: str):
+    converter = PostmanCollectionConverter(
+        collection=collection, config={"resolve_variables": True}
+    )
+    (result,) = converter.convert(export_base_folder=export_folder, n_jobs=1)
+
+    with open(result.file_path, encoding="utf-8") as f:
+        return converter, f.read()
+
+
+def test_incremental_convert_regenerates_on_collection_variable_change(tmp_path):
+    export_folder = str(tmp_path)
+
+    _, code = _convert(_collection_with_host("a.example.com"), export_folder)
+    assert "https://a.example.com/items" in code
+
+    converter, code = _convert(_collection_with_host("b.example.com"), export_folder)
+    assert "https://b.example.com/items" in code
+    assert len(converter.results) == 1 and not converter.results[0].is_skipped
+
+
+def test_incremental_convert_regenerates_on_collection_rename(tmp_path):
+    export_folder = str(tmp_path)
+
+    _convert(_collection_with_host("a.example.com"), export_folder)
+    _, code = _convert(_collection_with_host("a.example.com", "Renamed"), export_folder)
+
+    assert "# Renamed > folder > items" in code
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_diff_collections_sees_variable_and_rename_changes(tmp_path, n_jobs):
+    config = {"resolve_variables": True}
+    old = _collection_with_host("a.example.com")
+
+    assert PostmanCollectionDiff.from_collections(
+        old, _collection_with_host("b.example.com")
+    ).is_empty
+
+    for new in [
+        _collection_with_host("b.example.com"),
+        _collection_with_host("a.example.com", "Renamed"),
+    ]:
+        diff = diff_collections(old, new, config)
+        assert [change.new.name for change in diff.modified] == ["items"]
+
+        res = export_collection_diff(
+            diff, config=config, export_base_folder=str(tmp_path), n_jobs=n_jobs
+        )
+        assert res["errors"] == [] and len(res["written"]) == 1
+
+    with open(res["written"][0], encoding="utf-8") as f:
+        assert "# Renamed > folder > items" in f.read()
+
+    assert diff_collections(
+        old, _collection_with_host("a.example.com"), config
+    ).is_empty
+
+
+def test_stream_functions_only_stream_when_asked():
+    (request,) = _collection_with_host("a.example.com").get_folder_requests()
+
+    code = PostmanRequestConverter.from_postman_request(
+        request, config={"is_stream": True}
+    ).code
+
+    assert "stream = bool(stream or file_path)" in code
+
+
+def test_stream_params_clash_with_signature_params():
+    collection = _collection_with_host("a.example.com")
+    (request,) = collection.get_folder_requests()
+    request.url.query = [
+        PostmanQueryParam.from_dict(None, {"key": "stream", "value": "<boolean>"})
+    ]
+
+    with pytest.raises(ValueError, match="stream"):
+        PostmanRequestConverter.from_postman_request(
+            request, config={"is_stream": True, "signature_params": ["stream"]}
+        )
+
+
+def _api_collection() -> PostmanCollection:
+    def _api_request(method: str, path: list) -> dict:
+        return {
+            "name": f"{method} {'/'.join(path)}",
+            "request": {
+                "method": method,
+                "url": {
+                    "raw": "https://example.com/" + "/".join(path),
+                    "protocol": "https",
+                    "host": ["example", "com"],
+                    "path": path,
+                },
+            },
+        }
+
+    return PostmanCollection.from_dict(
+        {
+            "info": INFO,
+            "item": [
+                {
+                    "name": "Users",
+                    "item": [
+                        _api_request("GET", ["users"]),
+                        _api_request("POST", ["users"]),
+                        {
+                            "name": "Roles",
+                            "item": [_api_request("GET", ["users", "roles"])],
+                        },
+                    ],
+                },
+                _api_request("GET", ["status"]),
+            ],
+        }
+    )
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_collection_converter_renders_each_request_once(n_jobs):
+    collection = _api_collection()
+
+    converter = PostmanCollectionConverter(collection=collection, config=CONFIG)
+    results = converter.convert(export_base_folder=None, n_jobs=n_jobs)
+
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert converter.errors == {}
+    assert converter.requests_per_second > 0
+    assert [result.code for result in results] == [
+        PostmanRequestConverter.from_postman_request(request, config=CONFIG).code
+        for request in converter.requests
+    ]
+    assert all(result.file_path is None for result in results)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_collection_converter_records_errors_and_continues(tmp_path, n_jobs):
+    collection = _api_collection()
+    converter = PostmanCollectionConverter(collection=collection, config=CONFIG)
+    converter.requests[1].url = None
+
+    results = converter.convert(
+        export_base_folder=str(tmp_path), n_jobs=n_jobs, is_incremental=False
+    )
+
+    assert list(converter.errors) == [1]
+    assert converter.errors[1].startswith("AttributeError")
+    assert [result.function_name for result in results if result.is_success] == [
+        "vusers_get",
+        "vroles_get",
+        "vstatus_get",
+    ]
+    assert all(
+        os.path.exists(result.file_path) for result in results if result.is_success
+    )
@@ -0,0 +1,106 @@
+from src._1_models import PostmanCollection
+
+from tests.test_models import INFO
+
+
+def _request(name: str, method: str, path: list) -> dict:
+    return {
+        "name": name,
+        "request": {
+            "method": method,
+            "url": {"raw": "https://example.com/" + "/".join(path), "path": path},
+        },
+    }
+
+
+def _collection() -> PostmanCollection:
+    return PostmanCollection.from_dict(
+        {
+            "info": INFO,
+            "item": [
+                {
+                    "name": "issues",
+                    "item": [
+                        _request("Get issue", "GET", ["rest", "api", "issue", ":id"]),
+                        _request("Edit issue", "PUT", ["rest", "api", "issue", ":id"]),
+                        {
+                            "name": "comments",
+                            "item": [
+                                _request(
+                                    "Get comments",
+                                    "GET",
+                                    ["rest", "api", "issue", ":id", "comment"],
+                                )
+                            ],
+                        },
+                    ],
+                },
+                {
+                    "name": "issue types",
+                    "item": [_request("Get types", "get", ["rest", "types"])],
+                },
+                _request("Server info", "GET", ["rest", "info"]),
+            ],
+        }
+    )
+
+
+def _names(requests) -> list:
+    return [request.name for request in requests]
+
+
+def test_exact_lookups():
+    index = _collection().get_index()
+
+    assert _names(index.get_by_name("Get issue")) == ["Get issue"]
+    assert _names(index.get_by_method("get")) == [
+        "Get issue",
+        "Get comments",
+        "Get types",
+        "Server info",
+    ]
+    assert _names(index.get_by_folder("issues")) == ["Get issue", "Edit issue"]
+    assert _names(index.get_by_folder(())) == ["Server info"]
+    assert _names(index.get_by_path("/rest/api/issue/:id/", method="PUT")) == [
+        "Edit issue"
+    ]
+    assert index.get_folder("issues/comments").name == "comments"
+    assert index.get_by_name("missing") == []
+
+
+def test_prefix_lookups():
+    index = _collection().get_index()
+
+    assert _names(index.get_by_name("Get", prefix=True)) == [
+        "Get comments",
+        "Get issue",
+        "Get types",
+    ]
+    assert _names(index.get_by_folder("issues", prefix=True)) == [
+        "Get issue",
+        "Edit issue",
+        "Get comments",
+    ]
+    assert _names(index.get_by_path("rest/api", prefix=True)) == [
+        "Get issue",
+        "Edit issue",
+        "Get comments",
+    ]
+    assert [
+        folder.name for folder in index.get_folders_by_name("issue", prefix=True)
+    ] == [
+        "issue types",
+        "issues",
+    ]
+
+
+def test_prefix_lookup_sees_requests_added_later():
+    index = _collection().get_index()
+    index.get_by_name("Get", prefix=True)
+
+    (extra,) = PostmanCollection.from_dict(
+        {"info": INFO, "item": [_request("Get extra", "GET", ["extra"])]}
+    ).get_folder_requests()
+    index.add_request(extra)
+
+    assert "Get extra" in _names(index.get_by_name("Get", prefix=True))
@@ -0,0 +1,48 @@
+from src._1_inventory import get_request_auth_type
+from src._1_models import PostmanCollection
+
+from tests.test_models import INFO, _request, _write_collection
+
+
+def test_request_auth_inherited_from_folder():
+    collection = PostmanCollection.from_dict(
+        {
+            "info": INFO,
+            "auth": {"type": "basic"},
+            "item": [
+                {
+                    "name": "bearer folder",
+                    "auth": {"type": "bearer", "bearer": [{"key": "token"}]},
+                    "item": [{"name": "nested", "item": [_request("inherits")]}],
+                },
+                _request("collection auth"),
+            ],
+        }
+    )
+
+    inherits, collection_auth = collection.get_folder_requests()
+
+    assert get_request_auth_type(inherits) == "bearer"
+    assert get_request_auth_type(collection_auth) == "basic"
+    assert set(collection.get_inventory().auth_types) == {"bearer", "basic"}
+
+
+def test_streamed_request_auth_inherited_from_folder(tmp_path):
+    file_path = _write_collection(
+        tmp_path,
+        {
+            "info": INFO,
+            "item": [
+                {"name": "f", "auth": {"type": "bearer"}, "item": [_request("a")]},
+                {"name": "g", "item": [_request("b")], "auth": {"type": "apikey"}},
+            ],
+        },
+    )
+
+    # auth after the item array is read once the folder closes
+    requests = list(PostmanCollection.iter_requests(file_path))
+
+    assert [get_request_auth_type(request) for request in requests] == [
+        "bearer",
+        "apikey",
+    ]
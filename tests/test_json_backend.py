@@ -0,0 +1,58 @@
+import gc
+import json
+
+import pytest
+
+from src._1_models import PostmanCollection
+from src.utils.json_backend import JSON_BACKENDS, get_json_backend, read_json_file
+
+from tests.test_models import INFO, _request, _write_collection
+
+DOCUMENT = {
+    "text": "café ☃ \U0001f600",
+    "numbers": [0, -1, 1.5, 1e100, 2**53],
+    "nested": {"empty": {}, "list": [], "null": None, "flags": [True, False]},
+}
+
+
+@pytest.mark.parametrize("backend", sorted(JSON_BACKENDS))
+def test_backends_decode_identically(tmp_path, backend):
+    file_path = tmp_path / "document.json"
+    file_path.write_text(json.dumps(DOCUMENT, ensure_ascii=False), encoding="utf-8")
+
+    assert read_json_file(str(file_path), backend=backend) == DOCUMENT
+
+
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16", "utf-32"])
+def test_json_backend_detects_encoding(tmp_path, encoding):
+    file_path = tmp_path / "document.json"
+    file_path.write_text(json.dumps(DOCUMENT, ensure_ascii=False), encoding=encoding)
+
+    assert read_json_file(str(file_path), backend="json") == DOCUMENT
+
+
+@pytest.mark.parametrize("backend", sorted(JSON_BACKENDS))
+def test_empty_file_raises_and_restores_gc(tmp_path, backend):
+    file_path = tmp_path / "empty.json"
+    file_path.write_bytes(b"")
+
+    assert gc.isenabled()
+    with pytest.raises(ValueError):
+        read_json_file(str(file_path), backend=backend)
+    assert gc.isenabled()
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError, match="not available"):
+        get_json_backend("missing")
+
+
+@pytest.mark.parametrize("backend", sorted(JSON_BACKENDS))
+def test_collection_loads_with_every_backend(tmp_path, backend):
+    file_path = _write_collection(
+        tmp_path, {"info": INFO, "item": [{"name": "f", "item": [_request("a")]}]}
+    )
+
+    collection = PostmanCollection.from_file(file_path, json_backend=backend)
+
+    assert [request.name for request in collection.get_folder_requests()] == ["a"]
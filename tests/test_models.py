@@ -0,0 +1,65 @@
+import json
+
+from src._1_models import PostmanCollection, PostmanFolder, PostmanRequest
+
+
+def _write_collection(tmp_path, data) -> str:
+    file_path = tmp_path / "collection.json"
+    file_path.write_text(json.dumps(data), encoding="utf-8")
+    return str(file_path)
+
+
+INFO = {
+    "_postman_id": "0",
+    "name": "Coll",
+    "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json",
+    "_exporter_id": "0",
+    "_collection_link": "",
+}
+
+
+def _request(name: str) -> dict:
+    return {
+        "name": name,
+        "request": {"method": "GET", "url": {"raw": "https://example.com/" + name}},
+    }
+
+
+def test_iter_requests_folder_name_after_items(tmp_path):
+    file_path = _write_collection(
+        tmp_path,
+        {
+            "info": INFO,
+            "item": [
+                {
+                    "item": [
+                        _request("first"),
+                        {"item": [_request("nested")], "name": "inner"},
+                    ],
+                    "name": "outer",
+                },
+                {"name": "named", "item": [_request("second")]},
+            ],
+        },
+    )
+
+    breadcrumbs = [
+        request.get_breadcrumb()
+        for request in PostmanCollection.iter_requests(file_path)
+    ]
+
+    assert breadcrumbs == [
+        ("Coll", "outer", "first"),
+        ("Coll", "outer", "inner", "nested"),
+        ("Coll", "named", "second"),
+    ]
+
+
+def test_folder_items_init_parameter():
+    request = PostmanRequest.from_dict(None, _request("first"))
+    folder = PostmanFolder(parent=None, _raw=None, name="x", items=[request])
+
+    assert folder.items == [request]
+    assert repr(folder).startswith("PostmanFolder(name='x'")
+    assert "_items" not in repr(folder)
+    assert PostmanFolder(parent=None, _raw=None, name="y").items == []
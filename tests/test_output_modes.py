@@ -0,0 +1,98 @@
+import ast
+import os
+
+import pytest
+
+from src._2_converter import PostmanCollectionConverter
+
+from tests.test_converter import CONFIG, _api_collection
+
+
+def _files(folder) -> list:
+    return sorted(
+        os.path.relpath(os.path.join(root, name), folder)
+        for root, _, names in os.walk(folder)
+        for name in names
+        if name.endswith(".py")
+    )
+
+
+def _function_names(file_path: str) -> list:
+    with open(file_path, encoding="utf-8") as f:
+        return [
+            node.name
+            for node in ast.parse(f.read()).body
+            if isinstance(node, ast.FunctionDef)
+        ]
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_folder_mode_writes_one_module_per_folder(tmp_path, n_jobs):
+    export_folder = str(tmp_path / "client")
+
+    converter = PostmanCollectionConverter(collection=_api_collection(), config=CONFIG)
+    converter.convert(
+        export_base_folder=export_folder, output_mode="folder", n_jobs=n_jobs
+    )
+
+    assert converter.errors == {}
+    assert _files(export_folder) == [
+        "__init__.py",
+        "endpoints.py",
+        os.path.join("users", "__init__.py"),
+        os.path.join("users", "endpoints.py"),
+        os.path.join("users", "roles", "__init__.py"),
+        os.path.join("users", "roles", "endpoints.py"),
+    ]
+    assert _function_names(os.path.join(export_folder, "users", "endpoints.py")) == [
+        "vusers_get",
+        "vusers_post",
+    ]
+
+    with open(
+        os.path.join(export_folder, "users", "endpoints.py"), encoding="utf-8"
+    ) as f:
+        assert f.read().count("from src.client.get_data import") == 1
+
+
+def test_folder_mode_renames_clashing_functions(tmp_path):
+    collection = _api_collection()
+    users_get, users_post = collection.get_index().get_by_folder("Users")
+    users_post.method = "GET"
+
+    converter = PostmanCollectionConverter(collection=collection, config=CONFIG)
+    results = converter.convert(
+        export_base_folder=str(tmp_path), output_mode="folder", n_jobs=1
+    )
+
+    assert [result.function_name for result in results[:2]] == [
+        "vusers_get",
+        "vusers_get_2",
+    ]
+    assert _function_names(str(tmp_path / "users" / "endpoints.py")) == [
+        "vusers_get",
+        "vusers_get_2",
+    ]
+
+
+def test_rerun_skips_unchanged_modules(tmp_path):
+    converter = PostmanCollectionConverter(collection=_api_collection(), config=CONFIG)
+    converter.convert(export_base_folder=str(tmp_path), output_mode="folder", n_jobs=1)
+
+    collection = _api_collection()
+    (roles_get,) = collection.get_index().get_by_folder("Users/Roles")
+    roles_get.description = "changed"
+
+    converter = PostmanCollectionConverter(collection=collection, config=CONFIG)
+    results = converter.convert(
+        export_base_folder=str(tmp_path), output_mode="folder", n_jobs=1
+    )
+
+    assert [result.is_skipped for result in results] == [True, True, False, True]
+
+
+def test_unknown_output_mode_raises(tmp_path):
+    converter = PostmanCollectionConverter(collection=_api_collection(), config=CONFIG)
+
+    with pytest.raises(ValueError, match="output_mode"):
+        converter.convert(export_base_folder=str(tmp_path), output_mode="package")
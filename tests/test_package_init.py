@@ -0,0 +1,53 @@
+import importlib
+import sys
+
+import pytest
+
+from src._2_converter import PostmanCollectionConverter
+
+from tests.test_converter import CONFIG, _api_collection
+
+
+@pytest.fixture(params=["file", "folder"])
+def client(request, tmp_path, monkeypatch):
+    """Export the test collection as an importable package, unloaded afterwards."""
+    package_name = f"lazy_client_{request.param}"
+
+    PostmanCollectionConverter(collection=_api_collection(), config=CONFIG).convert(
+        export_base_folder=str(tmp_path / package_name),
+        output_mode=request.param,
+        n_jobs=1,
+    )
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module(package_name)
+
+    for name in [name for name in sys.modules if name.startswith(package_name)]:
+        del sys.modules[name]
+
+
+def _loaded_modules(package) -> list:
+    return sorted(
+        name for name in sys.modules if name.startswith(package.__name__ + ".")
+    )
+
+
+def test_import_loads_no_endpoint_module(client):
+    assert _loaded_modules(client) == []
+    assert {"vusers_get", "vusers_post", "vroles_get", "vstatus_get"} <= set(
+        dir(client)
+    )
+    assert sorted(client.__all__) == client.__all__
+
+
+def test_function_is_imported_on_first_access(client):
+    function = client.vstatus_get
+
+    assert callable(function) and function.__name__ == "vstatus_get"
+    assert len(_loaded_modules(client)) == 1
+    assert vars(client)["vstatus_get"] is function
+
+
+def test_unknown_attribute_raises(client):
+    with pytest.raises(AttributeError, match="missing"):
+        client.missing
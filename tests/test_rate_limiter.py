@@ -0,0 +1,165 @@
+from types import SimpleNamespace
+
+import pytest
+
+import src.client.get_data as gd
+
+from src.client.RateLimiter import RateLimiter
+from src.client.SessionPool import SessionPool
+
+from tests.stub_server import get_hits, serve_stub
+from tests.test_routes import _trie
+from tests.test_session_pool import _TokenAuth
+
+
+def _response(status_code: int, retry_after: str = None):
+    return SimpleNamespace(
+        status_code=status_code,
+        headers={"Retry-After": retry_after} if retry_after else {},
+    )
+
+
+def _host_bucket(limiter: RateLimiter):
+    return limiter._buckets["https://api.example.com"]
+
+
+def test_throttling_decreases_once_per_cooldown():
+    limiter = RateLimiter(rate_per_host=10, decrease_factor=0.5, min_rate=2)
+    url = "https://api.example.com/items"
+
+    limiter.reserve(url)
+    for _ in range(3):
+        assert limiter.update(url, "GET", _response(429))
+
+    bucket = _host_bucket(limiter)
+    assert bucket.rate == 5 and bucket.n_throttled == 3 and bucket.tokens == 0
+
+    # past the cooldown a new 429 cuts again, never below min_rate
+    for _ in range(3):
+        bucket.decreased_at -= limiter.decrease_cooldown
+        limiter.update(url, "GET", _response(429))
+
+    assert bucket.rate == 2
+
+
+def test_success_increases_back_to_the_configured_rate():
+    limiter = RateLimiter(rate_per_host=10, decrease_factor=0.5, increase_per_second=2)
+    url = "https://api.example.com/items"
+
+    limiter.update(url, "GET", _response(429))
+    bucket = _host_bucket(limiter)
+
+    bucket.increased_at -= 1
+    limiter.update(url, "GET", _response(200))
+    assert bucket.rate == pytest.approx(7, abs=0.01)
+
+    bucket.increased_at -= 10
+    limiter.update(url, "GET", _response(200))
+    assert bucket.rate == 10
+
+
+def test_retry_after_blocks_the_bucket():
+    limiter = RateLimiter(rate_per_host=100)
+    url = "https://api.example.com/items"
+
+    limiter.update(url, "GET", _response(503, retry_after="2"))
+    wait, _ = limiter.reserve(url)
+
+    assert 1.9 < wait <= 2
+
+
+def test_endpoint_buckets_are_keyed_by_route():
+    limiter = RateLimiter(rate_per_endpoint=5)
+
+    for url in [
+        "https://api.example.com/users/1",
+        "https://api.example.com/users/2?expand=1",
+        "https://api.example.com/users/550e8400-e29b-41d4-a716-446655440000",
+    ]:
+        limiter.reserve(url)
+    limiter.reserve("https://api.example.com/users/me", endpoint_key="/users/:id")
+    limiter.reserve("https://api.example.com/users/me")
+
+    assert set(limiter.stats) == {
+        "https://api.example.com",
+        "GET https://api.example.com/users/:id",
+        "GET https://api.example.com/users/me",
+    }
+
+
+def test_endpoint_buckets_follow_the_route_trie():
+    limiter = RateLimiter(
+        rate_per_endpoint=5, route_trie=_trie(("GET", "/users/{{user}}/posts"))
+    )
+
+    limiter.reserve("https://api.example.com/users/alice/posts")
+    limiter.reserve("https://api.example.com/users/bob/posts")
+
+    assert "GET https://api.example.com/users/{{user}}/posts" in limiter.stats
+    assert len(limiter.stats) == 2
+
+
+def test_buckets_are_capped():
+    limiter = RateLimiter(rate_per_endpoint=5, max_buckets=3)
+
+    for name in ["a", "b", "c", "d"]:
+        limiter.reserve(f"https://api.example.com/{name}")
+
+    # the host bucket is used by every request, so it is never the oldest
+    assert set(limiter.stats) == {
+        "https://api.example.com",
+        "GET https://api.example.com/c",
+        "GET https://api.example.com/d",
+    }
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    with serve_stub() as base_url:
+        yield base_url
+
+
+@pytest.mark.parametrize(
+    "method, is_retry_unsafe_methods, n_hits",
+    [("get", False, 3), ("put", False, 3), ("post", False, 1), ("patch", False, 1)]
+    + [("post", True, 3)],
+)
+def test_only_idempotent_methods_are_retried(
+    base_url, method, is_retry_unsafe_methods, n_hits
+):
+    limiter = RateLimiter(
+        rate_per_host=1000,
+        max_retries=2,
+        is_retry_unsafe_methods=is_retry_unsafe_methods,
+    )
+    get_hits(base_url)
+
+    with SessionPool() as session_pool:
+        res = gd.gd_requests(
+            _TokenAuth("a"),
+            method,
+            f"{base_url}/throttled",
+            params={"status": 429, "retry_after": 0},
+            session_pool=session_pool,
+            rate_limiter=limiter,
+        )
+
+    assert res.status_code == 429
+    assert get_hits(base_url) == {f"{method.upper()} /throttled": n_hits}
+
+
+def test_gd_requests_forwards_the_endpoint_key(base_url):
+    limiter = RateLimiter(rate_per_host=1000, rate_per_endpoint=1000)
+
+    with SessionPool() as session_pool:
+        res = gd.gd_requests(
+            _TokenAuth("a"),
+            "get",
+            f"{base_url}/users/me",
+            session_pool=session_pool,
+            rate_limiter=limiter,
+            endpoint_key="/users/:id",
+        )
+
+    assert res.ok
+    assert f"GET {base_url}/users/:id" in limiter.stats
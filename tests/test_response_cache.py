@@ -0,0 +1,120 @@
+import time
+
+import pytest
+
+import src.client.get_data as gd
+
+from src.client.ResponseCache import ResponseCache
+from src.client.SessionPool import SessionPool
+
+from tests.stub_server import get_hits, serve_stub
+from tests.test_session_pool import _TokenAuth
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    with serve_stub() as base_url:
+        yield base_url
+
+
+@pytest.fixture()
+def session_pool(base_url):
+    get_hits(base_url)
+
+    with SessionPool() as session_pool:
+        yield session_pool
+
+
+def _get(base_url, session_pool, response_cache, token="a", **params):
+    return gd.gd_requests(
+        _TokenAuth(token),
+        "get",
+        f"{base_url}/items",
+        params=params,
+        session_pool=session_pool,
+        response_cache=response_cache,
+    )
+
+
+def test_responses_are_not_shared_across_auth_headers(base_url, session_pool):
+    response_cache = ResponseCache()
+
+    for token in ["tenant-a", "tenant-b", "tenant-a", "tenant-b"]:
+        res = _get(
+            base_url, session_pool, response_cache, token, cache_control="max-age=60"
+        )
+        assert res.json()["headers"]["x-api-token"] == token
+
+    assert get_hits(base_url) == {"GET /items": 2}
+    assert response_cache.stats["n_hits"] == 2
+
+
+def test_narrowed_vary_headers(base_url, session_pool):
+    response_cache = ResponseCache(vary_headers=("x-api-token",))
+
+    for trace_id in ["1", "2"]:
+        res = gd.gd_requests(
+            _TokenAuth("a"),
+            "get",
+            f"{base_url}/items",
+            headers={"x-trace-id": trace_id},
+            params={"cache_control": "max-age=60"},
+            session_pool=session_pool,
+            response_cache=response_cache,
+        )
+        assert res.ok
+
+    assert get_hits(base_url) == {"GET /items": 1}
+
+
+def test_stale_response_is_revalidated(base_url, session_pool):
+    response_cache = ResponseCache()
+    params = {"cache_control": "max-age=0.2", "etag": '"v1"'}
+
+    first = _get(base_url, session_pool, response_cache, **params)
+    assert _get(base_url, session_pool, response_cache, **params).content == (
+        first.content
+    )
+
+    time.sleep(0.25)
+    res = _get(base_url, session_pool, response_cache, **params)
+
+    assert res.status_code == 200 and res.content == first.content
+    assert response_cache.stats["n_hits"] == 1
+    assert response_cache.stats["n_revalidated"] == 1
+    assert get_hits(base_url) == {"GET /items": 2}
+
+
+def test_cached_response_reads_like_a_fresh_one(base_url, session_pool, tmp_path):
+    response_cache = ResponseCache(cache_dir=str(tmp_path))
+    first = _get(base_url, session_pool, response_cache, cache_control="max-age=60")
+
+    # a new cache over the same folder answers from disk
+    res = _get(
+        base_url,
+        session_pool,
+        ResponseCache(cache_dir=str(tmp_path)),
+        cache_control="max-age=60",
+    )
+
+    assert b"".join(res.iter_content(7)) == first.content
+    assert res.json() == first.json()
+    assert get_hits(base_url) == {"GET /items": 1}
+
+
+def test_unsafe_methods_and_no_store_are_not_cached(base_url, session_pool):
+    response_cache = ResponseCache()
+
+    for _ in range(2):
+        _get(base_url, session_pool, response_cache, cache_control="no-store")
+        gd.gd_requests(
+            _TokenAuth("a"),
+            "post",
+            f"{base_url}/items",
+            params={"cache_control": "max-age=60"},
+            session_pool=session_pool,
+            response_cache=response_cache,
+        )
+
+    assert get_hits(base_url) == {"GET /items": 2, "POST /items": 2}
+    assert response_cache.stats["n_memory_entries"] == 0
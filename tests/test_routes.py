@@ -0,0 +1,65 @@
+from src._1_models import PostmanCollection
+from src._1_routes import PostmanRouteTrie
+
+from tests.test_models import INFO
+
+
+def _trie(*routes) -> PostmanRouteTrie:
+    return PostmanRouteTrie.from_folder(
+        PostmanCollection.from_dict(
+            {
+                "info": INFO,
+                "item": [
+                    {
+                        "name": f"{method} {path}",
+                        "request": {
+                            "method": method,
+                            "url": {
+                                "raw": "https://example.com" + path,
+                                "path": path.strip("/").split("/"),
+                            },
+                        },
+                    }
+                    for method, path in routes
+                ],
+            }
+        )
+    )
+
+
+def test_literal_wins_over_variable():
+    trie = _trie(("GET", "/users/:id"), ("GET", "/users/me"))
+
+    assert trie.match("/users/me").request.name == "GET /users/me"
+
+    match = trie.match("https://example.com/users/42?expand=1")
+    assert match.request.name == "GET /users/:id"
+    assert match.path_variables == {"id": "42"}
+
+
+def test_leftmost_literal_wins_when_ambiguous():
+    trie = _trie(("GET", "/a/:x/c"), ("GET", "/a/b/:y"))
+
+    assert trie.match("/a/b/c").request.name == "GET /a/b/:y"
+    assert [match.request.name for match in trie.match_all("/a/b/c")] == [
+        "GET /a/b/:y",
+        "GET /a/:x/c",
+    ]
+
+
+def test_dead_end_literal_falls_back_to_variable():
+    trie = _trie(("GET", "/users/me/settings"), ("GET", "/users/{{id}}/posts"))
+
+    match = trie.match("/users/me/posts")
+    assert match.request.name == "GET /users/{{id}}/posts"
+    assert match.path_variables == {"id": "me"}
+
+    assert trie.match("/users/me") is None
+
+
+def test_method_filter():
+    trie = _trie(("GET", "/items/:id"), ("DELETE", "/items/:id"))
+
+    assert trie.match("/items/1", method="delete").request.name == "DELETE /items/:id"
+    assert trie.match("/items/1", method="POST") is None
+    assert len(trie.match_all("/items/1")) == 2
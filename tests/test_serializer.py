@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from src._1_models import PostmanCollection
+from src._1_serializer import (
+    get_parity_errors,
+    iter_collection_json,
+    split_collection,
+)
+
+from tests.test_models import INFO, _request
+
+DATA = {
+    "info": INFO,
+    "item": [
+        {
+            "name": "users",
+            "description": "kept from the source",
+            "item": [_request("list users"), _request("get user")],
+        },
+        {"name": "orders", "item": [{"name": "nested", "item": [_request("list")]}]},
+        _request("ping"),
+    ],
+    "variable": [{"key": "host", "value": "example.com"}],
+}
+
+
+def _names(folder) -> list:
+    return [request.name for request in folder.get_index().requests]
+
+
+@pytest.mark.parametrize("prefer_raw", [True, False])
+def test_full_collection_round_trips(prefer_raw):
+    collection = PostmanCollection.from_dict(DATA)
+
+    data = json.loads("".join(iter_collection_json(collection, prefer_raw=prefer_raw)))
+
+    assert data["info"] == INFO
+    assert data["variable"] == DATA["variable"]
+    assert (data["item"][0].get("description") is not None) == prefer_raw
+    assert get_parity_errors(PostmanCollection.from_dict(data)) == []
+    assert _names(PostmanCollection.from_dict(data)) == _names(collection)
+
+
+def test_subset_prunes_empty_folders():
+    collection = PostmanCollection.from_dict(DATA)
+    kept = [
+        request for request in collection.get_index().requests if "user" in request.name
+    ]
+
+    data = json.loads(
+        "".join(iter_collection_json(collection, requests=kept, name="Users"))
+    )
+
+    assert data["info"]["name"] == "Users"
+    assert data["info"]["_postman_id"] == INFO["_postman_id"]
+    assert [item["name"] for item in data["item"]] == ["users"]
+    assert _names(PostmanCollection.from_dict(data)) == ["list users", "get user"]
+
+
+def test_split_collection_writes_loadable_collections_with_own_ids(tmp_path):
+    collection = PostmanCollection.from_dict(DATA)
+
+    def _key(request):
+        return None if request.name == "ping" else request.get_breadcrumb()[1]
+
+    paths = split_collection(collection, _key, str(tmp_path))
+    splits = {key: PostmanCollection.from_file(path) for key, path in paths.items()}
+
+    assert {key: _names(split) for key, split in splits.items()} == {
+        "users": ["list users", "get user"],
+        "orders": ["list"],
+    }
+    assert splits["orders"].name == "Coll - orders"
+
+    ids = {split.info.id for split in splits.values()}
+    assert len(ids) == 2 and INFO["_postman_id"] not in ids
+
+    # the ids are derived, so re-running a split keeps them
+    rerun = split_collection(collection, _key, str(tmp_path / "rerun"))
+    assert PostmanCollection.from_file(rerun["users"]).info.id == (
+        splits["users"].info.id
+    )
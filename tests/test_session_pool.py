@@ -0,0 +1,97 @@
+import pytest
+
+import src.client.get_data as gd
+
+from src.client.SessionPool import SessionPool
+
+from tests.stub_server import get_hits, serve_stub
+from tests.test_async import _NoAuth
+
+
+class _TokenAuth(_NoAuth):
+    def __init__(self, token: str):
+        self.token = token
+
+    def get_auth_headers(self):
+        return {"x-api-token": self.token}
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    with serve_stub() as base_url:
+        yield base_url
+
+
+def test_pooled_sessions_keep_no_cookies(base_url):
+    with SessionPool() as session_pool:
+        gd.gd_requests(
+            _TokenAuth("tenant-a"),
+            "get",
+            f"{base_url}/login",
+            params={"set_cookie": "sid=tenant-a; Path=/"},
+            session_pool=session_pool,
+        )
+        res = gd.gd_requests(
+            _TokenAuth("tenant-b"), "get", f"{base_url}/me", session_pool=session_pool
+        )
+        assert "cookie" not in res.json()["headers"]
+
+        # cookies passed with a request are still sent
+        res = session_pool.request("get", f"{base_url}/me", cookies={"sid": "b"})
+        assert res.json()["headers"]["cookie"] == "sid=b"
+
+
+def test_no_retries_or_timeout_by_default(base_url):
+    get_hits(base_url)
+
+    with SessionPool() as session_pool:
+        assert session_pool.timeout is None
+
+        res = session_pool.request("get", f"{base_url}/flaky", params={"status": 503})
+
+    assert res.status_code == 503
+    assert get_hits(base_url) == {"GET /flaky": 1}
+
+
+def test_retries_only_idempotent_methods(base_url):
+    get_hits(base_url)
+
+    with SessionPool(max_retries=2, backoff_factor=0) as session_pool:
+        for method in ["get", "put", "post", "patch"]:
+            res = session_pool.request(
+                method, f"{base_url}/flaky", params={"status": 502}
+            )
+            assert res.status_code == 502
+
+    assert get_hits(base_url) == {
+        "GET /flaky": 3,
+        "PUT /flaky": 3,
+        "POST /flaky": 1,
+        "PATCH /flaky": 1,
+    }
+
+
+def test_throttled_responses_left_to_the_caller(base_url):
+    get_hits(base_url)
+
+    with SessionPool(max_retries=2, backoff_factor=0) as session_pool:
+        res = session_pool.request(
+            "get",
+            f"{base_url}/throttled",
+            params={"status": 429, "retry_after": 0},
+            is_retry_throttled=False,
+        )
+
+    assert res.status_code == 429
+    assert get_hits(base_url) == {"GET /throttled": 1}
+
+
+def test_sessions_are_reused_per_host(base_url):
+    with SessionPool() as session_pool:
+        session = session_pool.get_session(f"{base_url}/a")
+
+        assert session_pool.get_session(f"{base_url}/b?x=1") is session
+        assert (
+            session_pool.get_session(f"{base_url}/a", is_retry_throttled=False)
+            is not session
+        )
@@ -0,0 +1,140 @@
+import json
+import os
+
+import pytest
+
+import src.client.get_data as gd
+import src.utils.json_stream as pmjs
+
+from src.client.SessionPool import SessionPool
+
+from tests.stub_server import serve_stub
+from tests.test_session_pool import _TokenAuth
+
+
+def _records(document, path=(), chunk_size=3):
+    """Decode document through byte chunks of chunk_size."""
+    content = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    chunks = [
+        content[start : start + chunk_size]
+        for start in range(0, len(content), chunk_size)
+    ]
+    reader = pmjs.JsonStreamReader.from_chunks(chunks, chunk_size=chunk_size)
+
+    return list(pmjs.iter_json_records(reader, path))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1 << 16])
+def test_records_match_a_full_decode(chunk_size):
+    records = [
+        {"id": 12345678901234567890, "name": "naïve café ☕", "tags": ["a", "b"]},
+        {"id": -1.5e-3, "nested": {"values": [1, [2, 3]], "flag": None}},
+        'text with "quotes" and \\ escapes',
+        [],
+        {},
+    ]
+
+    assert _records(records, chunk_size=chunk_size) == records
+
+
+def test_records_under_a_path():
+    document = {
+        "meta": {"values": ["not", "these"]},
+        "values": [{"id": 0}, {"id": 1}],
+        "total": 2,
+    }
+
+    assert _records(document, ("values",)) == [{"id": 0}, {"id": 1}]
+    assert _records({"pages": [[], [1, 2]]}, ("pages", 1)) == [1, 2]
+    assert _records({"values": []}, ("values",)) == []
+
+
+def test_missing_path_and_malformed_documents_raise():
+    with pytest.raises(KeyError, match="values"):
+        _records({"data": []}, ("values",))
+
+    reader = pmjs.JsonStreamReader.from_chunks([b'[{"id": 0} {"id": 1}]'])
+    with pytest.raises(json.JSONDecodeError, match="delimiter"):
+        list(pmjs.iter_json_records(reader))
+
+
+def test_records_are_decoded_lazily():
+    n_read = 0
+
+    def _chunks():
+        nonlocal n_read
+        for chunk in [b'{"values": [', b'{"id": 0}', b", ", b'{"id": 1}', b"]}"]:
+            n_read += 1
+            yield chunk
+
+    reader = pmjs.JsonStreamReader.from_chunks(_chunks(), chunk_size=4)
+    records = pmjs.iter_json_records(reader, ("values",))
+
+    assert next(records) == {"id": 0}
+    assert n_read < 5
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    with serve_stub() as base_url:
+        yield base_url
+
+
+def _get(base_url, session_pool, stream=True, **params):
+    return gd.gd_requests(
+        _TokenAuth("a"),
+        "get",
+        f"{base_url}/items",
+        params=params,
+        session_pool=session_pool,
+        stream=stream,
+    )
+
+
+def test_stream_response_modes(base_url, tmp_path):
+    expected = [{"id": i} for i in range(500)]
+
+    with SessionPool() as session_pool:
+        res = _get(base_url, session_pool, n_records=500)
+        records = gd.stream_response(res, stream="records", records_path=("data",))
+        assert list(records) == expected
+        assert res.raw.closed
+
+        res = _get(base_url, session_pool, n_records=500)
+        content = b"".join(gd.stream_response(res, stream="chunks"))
+        assert json.loads(content) == {"data": expected}
+
+        res = _get(base_url, session_pool, n_records=500)
+        file_path = str(tmp_path / "out" / "items.json")
+        assert gd.stream_response(res, file_path=file_path) == file_path
+        with open(file_path, "rb") as f:
+            assert f.read() == content
+        assert os.listdir(tmp_path / "out") == ["items.json"]
+
+        res = _get(base_url, session_pool, stream=False, n_records=2)
+        assert gd.stream_response(res) is res
+        assert res.json() == {"data": expected[:2]}
+
+
+def test_interrupted_download_leaves_no_file(base_url, tmp_path, monkeypatch):
+    with SessionPool() as session_pool:
+        res = _get(base_url, session_pool, n_records=10)
+
+    def _broken_chunks(res, chunk_size):
+        yield b"partial"
+        raise ConnectionError("connection reset")
+
+    monkeypatch.setattr(gd, "iter_response_chunks", _broken_chunks)
+
+    with pytest.raises(ConnectionError):
+        gd.download_response(res, str(tmp_path / "items.json"))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_unknown_stream_mode_is_rejected(base_url):
+    with SessionPool() as session_pool:
+        res = _get(base_url, session_pool, n_records=1)
+
+        with pytest.raises(ValueError, match="Unknown stream mode"):
+            gd.stream_response(res, stream="lines")
@@ -0,0 +1,92 @@
+import ast
+
+import pytest
+
+from src._2_templates import (
+    CodeTemplate,
+    render_dict_literal,
+    render_module_code,
+    render_request_code,
+)
+
+
+def _render(**kwargs) -> str:
+    return render_request_code(
+        **{
+            "function_name": "users_get",
+            "breadcrumb": "Coll > Users",
+            "signature_lines": ["limit: int = None,"],
+            "description_lines": ["List users."],
+            "url": "https://example.com/users",
+            "headers": {"content-type": "application/json"},
+            "method": "get",
+            "params": render_dict_literal([("limit", "limit"), ("page", "'1'")]),
+            **kwargs,
+        }
+    )
+
+
+def test_compile_splits_literals_and_fields():
+    template = CodeTemplate.compile("def {name}():\n    return {{'a': {value}}}\n")
+
+    assert [field_name for _, field_name in template.parts if field_name] == [
+        "name",
+        "value",
+    ]
+    assert template.render(name="f", value=1) == "def f():\n    return {'a': 1}\n"
+
+
+def test_render_into_appends_to_the_callers_buffer():
+    buffer = ["# head\n"]
+
+    CodeTemplate.compile("x = {x}\n").render_into(buffer, {"x": 1})
+
+    assert "".join(buffer) == "# head\nx = 1\n"
+
+
+def test_compile_rejects_format_specs():
+    with pytest.raises(ValueError, match="format spec"):
+        CodeTemplate.compile("{value:>10}")
+
+    with pytest.raises(ValueError, match="conversion"):
+        CodeTemplate.compile("{value!r}")
+
+
+def test_render_dict_literal():
+    assert render_dict_literal([("a", "1"), ("b", "b")]) == '{"a": 1, "b": b}'
+    assert render_dict_literal([]) == "{}"
+
+
+@pytest.mark.parametrize(
+    "is_async, is_stream", [(False, False), (True, False), (False, True)]
+)
+def test_rendered_code_is_valid_python(is_async, is_stream):
+    code = _render(is_async=is_async, is_stream=is_stream)
+
+    (function,) = [
+        node
+        for node in ast.parse(code).body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+    assert function.name == "users_get"
+    assert isinstance(function, ast.AsyncFunctionDef) == is_async
+    assert ast.get_docstring(function) == "List users."
+    assert ("records_path" in [arg.arg for arg in function.args.args]) == is_stream
+    assert code.startswith("# Auto-generated by PostmanConverter.")
+
+
+def test_async_stream_is_rejected():
+    with pytest.raises(ValueError, match="async"):
+        _render(is_async=True, is_stream=True)
+
+
+def test_module_shares_one_import_block():
+    functions = [
+        _render(function_name=name, is_add_imports=False) for name in ["a", "b"]
+    ]
+
+    code = render_module_code("Coll > Users", functions)
+
+    ast.parse(code)
+    assert code.count("from src.client.get_data import") == 1
+    assert code.count("\ndef ") == 2
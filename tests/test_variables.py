@@ -0,0 +1,87 @@
+from src._1_models import PostmanCollection
+from src._2_converter import PostmanRequestConverter
+from src._2_variables import VARIABLE, PostmanVariableScope, resolve_template
+
+from tests.test_models import INFO
+
+
+def _collection() -> PostmanCollection:
+    request = {
+        "name": "get item",
+        "request": {
+            "method": "POST",
+            "header": [{"key": "X-Tenant", "value": "{{tenant}}"}],
+            "url": {
+                "raw": "https://{{host}}/items",
+                "protocol": "https",
+                "host": ["{{host}}"],
+                "path": ["items"],
+            },
+            "body": {"mode": "raw", "raw": '{"tenant": "{{tenant}}"}'},
+        },
+    }
+
+    return PostmanCollection.from_dict(
+        {
+            "info": INFO,
+            "variable": [
+                {"key": "host", "value": "a.example.com"},
+                {"key": "tenant", "value": "collection"},
+            ],
+            "item": [
+                {
+                    "name": "folder",
+                    "variable": [{"key": "tenant", "value": "folder"}],
+                    "item": [request],
+                }
+            ],
+        }
+    )
+
+
+def test_folder_variable_overrides_collection():
+    (request,) = _collection().get_folder_requests()
+
+    scope = PostmanVariableScope.from_request(request)
+
+    assert scope.get(VARIABLE, "tenant") == "folder"
+    assert scope.get(VARIABLE, "host") == "a.example.com"
+
+
+def test_converter_resolves_url_headers_and_body():
+    (request,) = _collection().get_folder_requests()
+    config = {"resolve_variables": True}
+
+    converter = PostmanRequestConverter.from_postman_request(request, config=config)
+
+    assert converter.url == "https://a.example.com/items"
+    assert converter.generate_headers(**config) == {"x-tenant": "folder"}
+    assert converter.generate_body(**config) == '{"tenant": "folder"}'
+
+
+def test_scope_follows_environment_edits():
+    (request,) = _collection().get_folder_requests()
+    converter = PostmanRequestConverter(request=request)
+    environment = {"host": "env.example.com"}
+
+    assert (
+        converter.generate_url(environment=environment, resolve_variables=True)
+        == "https://env.example.com/items"
+    )
+
+    environment["host"] = "edited.example.com"
+    assert (
+        converter.generate_url(environment=environment, resolve_variables=True)
+        == "https://edited.example.com/items"
+    )
+
+
+def test_non_str_values_resolve_as_json():
+    scope = PostmanVariableScope.from_dict(
+        {"ids": [1, 2], "filter": {"a": True}, "limit": 10, "name": "x"}
+    )
+
+    assert (
+        resolve_template("{{ids}} {{filter}} {{limit}} {{name}}", scope)
+        == '[1, 2] {"a": true} 10 x'
+    )
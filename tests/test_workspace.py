@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from src._1_workspace import PostmanWorkspace
+
+from tests.test_models import INFO, _request
+
+
+def _write_workspace(tmp_path) -> None:
+    for name in ["alpha", "beta"]:
+        (tmp_path / f"{name}.json").write_text(
+            json.dumps(
+                {
+                    "info": {**INFO, "name": name},
+                    "item": [{"name": "folder", "item": [_request(name)]}],
+                }
+            ),
+            encoding="utf-8",
+        )
+
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_from_path_reports_failed_files(tmp_path, n_jobs):
+    _write_workspace(tmp_path)
+
+    workspace = PostmanWorkspace.from_path(str(tmp_path), n_jobs=n_jobs)
+
+    assert [file.file_path for file in workspace.files] == [
+        str(tmp_path / "alpha.json"),
+        str(tmp_path / "beta.json"),
+        str(tmp_path / "broken.json"),
+    ]
+    assert [collection.name for collection in workspace.collections] == [
+        "alpha",
+        "beta",
+    ]
+    assert list(workspace.errors) == [str(tmp_path / "broken.json")]
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_combined_index_prefixes_collection_name(tmp_path, n_jobs):
+    _write_workspace(tmp_path)
+
+    workspace = PostmanWorkspace.from_path(str(tmp_path / "*a.json"), n_jobs=n_jobs)
+    index = workspace.get_index()
+
+    assert [request.name for request in index.get_by_folder("alpha/folder")] == [
+        "alpha"
+    ]
+    assert [request.name for request in index.get_by_folder("beta", prefix=True)] == [
+        "beta"
+    ]
+    assert index.get_by_folder("folder") == []